@@ -0,0 +1,103 @@
+import math
+import random
+from typing import List, Callable, Dict
+
+from model.Node import Node
+
+
+def create_grid_graph(node_count: int, seed: int) -> List[Node]:
+    """
+    Creates a square grid, every node is connected to its right and lower neighbour.
+
+    :param node_count: The minimum number of nodes, rounded up to a square
+    :param seed: The seed of the random weights
+    :return: A list of all nodes
+    """
+    rng = random.Random(seed)
+    side = math.ceil(math.sqrt(node_count))
+    spacing = 3 * Node.radius
+    nodes = [Node(str(i), (i % side) * spacing, (i // side) * spacing) for i in range(side * side)]
+    for i, node in enumerate(nodes):
+        if i % side + 1 < side:
+            node.add_neighbour(nodes[i + 1], rng.randint(spacing, 2 * spacing))
+        if i + side < len(nodes):
+            node.add_neighbour(nodes[i + side], rng.randint(spacing, 2 * spacing))
+    return nodes
+
+
+def create_geometric_graph(node_count: int, seed: int, degree: float = 6.0) -> List[Node]:
+    """
+    Creates a random geometric graph, nodes closer than a radius are connected.
+    The weight is the rounded up euclidean distance.
+
+    :param node_count: The number of nodes
+    :param seed: The seed of the random positions
+    :param degree: The expected average degree
+    :return: A list of all nodes
+    """
+    rng = random.Random(seed)
+    size = 3 * Node.radius * math.sqrt(node_count)
+    radius = math.sqrt(degree * size * size / (math.pi * node_count))
+    nodes = [Node(str(i), rng.randint(0, int(size)), rng.randint(0, int(size))) for i in range(node_count)]
+
+    cells: Dict = {}
+    for node in nodes:
+        cells.setdefault((int(node.x // radius), int(node.y // radius)), []).append(node)
+    for (column, row), cell_nodes in cells.items():
+        for node in cell_nodes:
+            for other_column in (column - 1, column, column + 1):
+                for other_row in (row - 1, row, row + 1):
+                    for other in cells.get((other_column, other_row), ()):
+                        distance = math.hypot(node.x - other.x, node.y - other.y)
+                        if node is not other and distance <= radius and other not in node.neighbours:
+                            node.add_neighbour(other, max(1, math.ceil(distance)))
+    return nodes
+
+
+def create_scale_free_graph(node_count: int, seed: int, edges_per_node: int = 2) -> List[Node]:
+    """
+    Creates a scale-free graph by preferential attachment (Barabási–Albert).
+
+    :param node_count: The number of nodes
+    :param seed: The seed of the random connections, positions and weights
+    :param edges_per_node: The number of connections of every new node
+    :return: A list of all nodes
+    """
+    rng = random.Random(seed)
+    size = int(3 * Node.radius * math.sqrt(node_count))
+    nodes = [Node(str(i), rng.randint(0, size), rng.randint(0, size)) for i in range(node_count)]
+    targets = nodes[:edges_per_node]
+    repeated_nodes = []
+    for node in nodes[edges_per_node:]:
+        for target in dict.fromkeys(targets):
+            node.add_neighbour(target, rng.randint(1, 100))
+        repeated_nodes.extend(targets)
+        repeated_nodes.extend([node] * edges_per_node)
+        targets = [rng.choice(repeated_nodes) for _ in range(edges_per_node)]
+    return nodes
+
+
+def create_complete_graph(node_count: int, seed: int) -> List[Node]:
+    """
+    Creates a complete graph with nodes on a circle.
+
+    :param node_count: The number of nodes
+    :param seed: The seed of the random weights
+    :return: A list of all nodes
+    """
+    rng = random.Random(seed)
+    radius = 3 * Node.radius * node_count / (2 * math.pi)
+    nodes = [Node(str(i), round(radius * (1 + math.cos(2 * math.pi * i / node_count))),
+                  round(radius * (1 + math.sin(2 * math.pi * i / node_count)))) for i in range(node_count)]
+    for i, node in enumerate(nodes):
+        for other in nodes[i + 1:]:
+            node.add_neighbour(other, rng.randint(1, 100))
+    return nodes
+
+
+GENERATORS: Dict[str, Callable[[int, int], List[Node]]] = {
+    "grid": create_grid_graph,
+    "geometric": create_geometric_graph,
+    "scale_free": create_scale_free_graph,
+    "complete": create_complete_graph,
+}
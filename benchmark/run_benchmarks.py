@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+
+"""
+Benchmarks of the model and file layers.
+
+Run `python3 benchmark/run_benchmarks.py --output results.json` and compare a later run
+with `python3 benchmark/run_benchmarks.py --compare results.json`.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "dijkstra_visualizer"))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmark.graph_generators import GENERATORS
+from model.CompactGraph import CompactGraph
+from model.ContractionHierarchy import ContractionHierarchy
+from model.ContractionHierarchyAlgorithm import ContractionHierarchyAlgorithm
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.GraphFile import GraphFile
+from model.GraphSnapshot import GraphSnapshot
+from model.Node import Node
+from model.PriorityQueue import LinearPriorityQueue, BucketPriorityQueue
+from model.QueryRunner import QueryRunner
+from model.SpatialIndex import SpatialIndex
+
+try:
+    from view.GraphCanvas import GraphCanvas
+except ImportError:  # tkinter is not installed
+    GraphCanvas = None
+
+COMPLETE_GRAPH_LIMIT = 1000  # Complete graphs grow quadratically
+LINEAR_QUEUE_LIMIT = 5000  # The reference implementation is quadratic
+HIT_TEST_COUNT = 10000
+QUERY_COUNT = 100
+
+
+if GraphCanvas:
+    class HeadlessCanvas(GraphCanvas):
+        def __init__(self, width: int = 1000, height: int = 600):
+            """
+            A graph canvas without a Tk window, all item operations are only counted.
+            """
+            self.node_items = {}
+            self.node_states = {}
+            self.connection_items = {}
+            self.connection_weights = {}
+            self.size = {"width": width, "height": height}
+            self.item_count = 0
+
+        def cget(self, key):
+            return self.size[key]
+
+        def create_item(self, *args, **kwargs) -> int:
+            self.item_count += 1
+            return self.item_count
+
+        create_oval = create_line = create_text = create_item
+
+        def itemconfig(self, *args, **kwargs):
+            pass
+
+        def delete(self, *args):
+            pass
+
+        def tag_lower(self, *args):
+            pass
+
+        move = scale = coords = tag_lower
+
+
+def measure(function: Callable, repeat: int) -> float:
+    """
+    :return: The best time in seconds of all repetitions
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_steps(nodes: List[Node], queue_class=None):
+    algorithm = DijkstraAlgorithm(nodes, nodes[0], queue_class) if queue_class else DijkstraAlgorithm(nodes, nodes[0])
+    for _ in algorithm:
+        pass
+
+
+def hit_test(nodes: List[Node], seed: int) -> Callable:
+    index = SpatialIndex()
+    for node in nodes:
+        index.insert(node)
+    rng = random.Random(seed)
+    max_x, max_y = max(n.x for n in nodes), max(n.y for n in nodes)
+    positions = [(rng.randint(0, max_x), rng.randint(0, max_y)) for _ in range(HIT_TEST_COUNT)]
+    return lambda: [index.find(x, y) for x, y in positions]
+
+
+def run_queries(runner: QueryRunner, queries: List) -> Callable:
+    return lambda: [runner.point_to_point(source, target) for source, target in queries]
+
+
+def benchmark_hierarchy(nodes: List[Node], seed: int, repeat: int) -> Dict[str, float]:
+    """
+    Builds the contraction hierarchy once and compares its point-to-point queries with Dijkstra's.
+
+    :return: A dictionary of the benchmark names and the measured times, the queries' times are per query
+    """
+    start = time.perf_counter()
+    hierarchy = ContractionHierarchy.build(CompactGraph.from_nodes(nodes))
+    results = {"ch_build": time.perf_counter() - start}
+
+    rng = random.Random(seed)
+    queries = [(rng.choice(nodes).name, rng.choice(nodes).name) for _ in range(QUERY_COUNT)]
+    runner = QueryRunner(nodes, ContractionHierarchyAlgorithm, hierarchy=hierarchy)
+    results["ch_query"] = measure(run_queries(runner, queries), repeat) / QUERY_COUNT
+    results["dijkstra_query"] = measure(run_queries(QueryRunner(nodes), queries), repeat) / QUERY_COUNT
+    return results
+
+
+def benchmark_graph(nodes: List[Node], seed: int, repeat: int, directory: Path) -> Dict[str, float]:
+    """
+    Runs all benchmarks on a graph.
+
+    :return: A dictionary of the benchmark names and the measured times
+    """
+    results = {
+        "solve": measure(lambda: DijkstraAlgorithm(nodes, nodes[0]).solve(), repeat),
+        "steps": measure(lambda: run_steps(nodes), repeat),
+        "steps_buckets": measure(lambda: run_steps(nodes, BucketPriorityQueue), repeat),
+    }
+    if len(nodes) <= LINEAR_QUEUE_LIMIT:
+        results["steps_linear"] = measure(lambda: run_steps(nodes, LinearPriorityQueue), repeat)
+
+    graph = CompactGraph.from_nodes(nodes)
+    results["solve_compact"] = measure(lambda: DijkstraAlgorithm.solve_compact(graph, 0), repeat)
+
+    for suffix in (".jsonl", ".json", ".graph"):
+        file = directory / f"graph{suffix}"
+        results[f"save{suffix}"] = measure(lambda: GraphFile.write(file, nodes), repeat)
+        results[f"load{suffix}"] = measure(lambda: GraphFile.read(file), repeat)
+    results["load_compact.graph"] = measure(lambda: GraphSnapshot.read(directory / "graph.graph"), repeat)
+
+    results["hit_test"] = measure(hit_test(nodes, seed), repeat)
+
+    if GraphCanvas:
+        results["redraw"] = measure(lambda: HeadlessCanvas().redraw_graph(nodes), repeat)
+        canvas = HeadlessCanvas(10 ** 9, 10 ** 9)
+        canvas.redraw_graph(nodes)
+        results["update_step"] = measure(lambda: canvas.update_nodes(nodes[:2]), repeat)
+        results["pan"] = measure(lambda: (canvas.pan(5, 5), canvas.update_view(nodes)), repeat)
+    return results
+
+
+def compare(results: List[Dict], previous_results: List[Dict], threshold: float) -> bool:
+    """
+    Prints the ratio of all results to the previous results.
+
+    :return: True if any benchmark is slower than the threshold allows
+    """
+    previous = {(r["graph"], r["nodes"], r["benchmark"]): r["seconds"] for r in previous_results}
+    regression = False
+    for result in results:
+        key = (result["graph"], result["nodes"], result["benchmark"])
+        if key not in previous or not previous[key]:
+            continue
+        ratio = result["seconds"] / previous[key]
+        marker = ""
+        if ratio > threshold:
+            marker = "  REGRESSION"
+            regression = True
+        print(f"{key[0]:>12} {key[1]:>8} {key[2]:>18} {ratio:8.2f}x{marker}")
+    return regression
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--graphs", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1000, 10000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="Number of repetitions, the best time is reported")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="Compare the results with a previous JSON output")
+    parser.add_argument("--threshold", type=float, default=1.2, help="Slowdown ratio reported as regression")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for graph_name in args.graphs:
+            for size in args.sizes:
+                if graph_name == "complete" and size > COMPLETE_GRAPH_LIMIT:
+                    continue
+                nodes = GENERATORS[graph_name](size, args.seed)
+                edge_count = sum(len(n.neighbours) for n in nodes) // 2
+                benchmarks = benchmark_graph(nodes, args.seed, args.repeat, Path(directory))
+                # Contracting a node of a complete graph connects all of its neighbours by shortcuts
+                if graph_name != "complete":
+                    benchmarks.update(benchmark_hierarchy(nodes, args.seed, args.repeat))
+                for benchmark, seconds in benchmarks.items():
+                    results.append({"graph": graph_name, "nodes": len(nodes), "edges": edge_count,
+                                    "benchmark": benchmark, "seconds": seconds})
+                    print(f"{graph_name:>12} {len(nodes):>8} {benchmark:>18} {seconds * 1000:12.3f} ms", flush=True)
+
+    output = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(output, indent=2))
+    if args.compare:
+        previous_results = json.loads(args.compare.read_text())["results"]
+        if compare(results, previous_results, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+"""
+Command line interface of the Dijkstra Visualizer, it does not import tkinter and needs no display.
+
+Examples:
+    python3 cli.py graph.jsonl --source 1
+    python3 cli.py graph.jsonl --source 1 --target 42 --paths --format jsonl
+    python3 cli.py graph.jsonl --source 1 --vectorized
+    python3 cli.py graph.jsonl --queries queries.csv --algorithm bidirectional
+    python3 cli.py graph.jsonl --queries queries.csv --algorithm ch
+    python3 cli.py graph.jsonl --queries queries.csv --algorithm ch --store-hierarchy graph.jsonl.ch
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from pathlib import Path
+from typing import List, Tuple, Union, Iterator, TextIO, Iterable
+
+from model.CompactGraph import CompactGraph
+from model.ContractionHierarchy import ContractionHierarchy
+from model.GraphFile import GraphFile
+from model.Node import Node
+from model.Profiler import profiler
+from model.QueryRunner import QueryRunner, QueryResult
+from model.VectorizedDijkstra import VectorizedDijkstra
+
+
+def parse_arguments(arguments: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Calculates shortest paths of a graph file without a display.")
+    parser.add_argument("graph", type=Path, help="graph file (.jsonl, .json or .graph)")
+    query = parser.add_mutually_exclusive_group(required=True)
+    query.add_argument("--source", help="name of the source node, without --target all distances are written")
+    query.add_argument("--queries", help="file with one query 'source[,target]' per line, '-' reads stdin")
+    parser.add_argument("--target", help="name of the target node")
+    parser.add_argument("--algorithm", choices=sorted(QueryRunner.ALGORITHMS), default="dijkstra",
+                        help="algorithm of point-to-point queries, ch uses the contraction hierarchy stored next to "
+                             "the graph file (<graph>.ch) or builds it in memory if it is missing or outdated")
+    parser.add_argument("--store-hierarchy", type=Path, metavar="PATH",
+                        help="with --algorithm ch, read the contraction hierarchy from PATH and build and write it "
+                             "there if it is missing or outdated, without it no file is written")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv", help="format of the results")
+    parser.add_argument("--paths", action="store_true", help="write the nodes on the shortest paths")
+    parser.add_argument("--vectorized", action="store_true",
+                        help="solve single-source queries with NumPy, falls back to Python if NumPy is not installed")
+    parser.add_argument("--output", help="file to write the results to, default is stdout")
+    parser.add_argument("--statistics", action="store_true", help="write the profiler's statistics to stderr")
+    args = parser.parse_args(arguments)
+    if args.target is not None and args.source is None:
+        parser.error("--target requires --source")
+    if args.store_hierarchy is not None and args.algorithm != "ch":
+        parser.error("--store-hierarchy requires --algorithm ch")
+    return args
+
+
+def load_hierarchy(graph_file: Path, nodes: List[Node], store_file: Path = None) -> ContractionHierarchy:
+    """
+    Reads the contraction hierarchy of the graph, if it is missing or outdated it is built.
+    A built hierarchy is only written if a file to store it is given.
+
+    :param graph_file: The graph's file, a hierarchy stored next to it is used if no store file is given
+    :param nodes: The graph's nodes
+    :param store_file: The file to read the hierarchy from and to write a built hierarchy to
+    :return: The hierarchy
+    """
+    graph = CompactGraph.from_nodes(nodes)
+    file = store_file if store_file else ContractionHierarchy.get_file(graph_file)
+    hierarchy = ContractionHierarchy.load_file(file, graph)
+    if hierarchy:
+        return hierarchy
+
+    hierarchy = ContractionHierarchy.build(graph)
+    if not store_file:
+        return hierarchy
+    try:
+        hierarchy.write(store_file)
+    except OSError as error:
+        print(f"warning: the contraction hierarchy could not be stored: {error}", file=sys.stderr)
+    return hierarchy
+
+
+def read_queries(stream: TextIO) -> Iterator[Tuple[str, Union[str, None]]]:
+    """
+    Reads one query per line, empty lines and lines starting with # are skipped.
+
+    :param stream: The stream containing lines 'source' or 'source,target'
+    :return: Pairs of the source's and the target's name, the target is None if not given
+    """
+    for row in csv.reader(stream):
+        if not row or not row[0].strip() or row[0].startswith("#"):
+            continue
+        target = row[1].strip() if len(row) > 1 and row[1].strip() else None
+        yield row[0].strip(), target
+
+
+def write_results(results: Iterable[QueryResult], stream: TextIO, output_format: str, paths: bool):
+    """
+    Writes every result as soon as it is calculated, so the results can be piped to other programs.
+
+    :param results: The results to write
+    :param stream: The stream to write to
+    :param output_format: "csv" or "jsonl"
+    :param paths: If True the paths are written as well
+    """
+    writer = csv.writer(stream, lineterminator="\n") if output_format == "csv" else None
+    if writer:
+        writer.writerow(("source", "target", "distance", "path") if paths else ("source", "target", "distance"))
+
+    for source, target, distance, path in results:
+        # The weights' type depends on the graph file and the algorithm, the output does not
+        distance = float(distance)
+        reachable = distance != float('inf')
+        if writer:
+            row = [source, target, distance if reachable else ""]
+            if paths:
+                row.append(" ".join(path))
+            writer.writerow(row)
+        else:
+            item = {"source": source, "target": target, "distance": distance if reachable else None}
+            if paths:
+                item["path"] = path
+            stream.write(json.dumps(item) + "\n")
+        stream.flush()
+
+
+def main(arguments: List[str] = None) -> int:
+    args = parse_arguments(arguments)
+    profiler.enabled = args.statistics
+    if args.vectorized and not VectorizedDijkstra.is_available():
+        print("warning: NumPy is not installed, the queries are solved without vectorization", file=sys.stderr)
+    query_file = None
+    output = None
+    try:
+        nodes = GraphFile.read(args.graph)
+        hierarchy = load_hierarchy(args.graph, nodes, args.store_hierarchy) if args.algorithm == "ch" else None
+        runner = QueryRunner(nodes, QueryRunner.ALGORITHMS[args.algorithm], args.paths, hierarchy, args.vectorized)
+        if args.queries is not None:
+            query_file = sys.stdin if args.queries == "-" else open(args.queries, encoding="utf-8", newline="")
+            queries = read_queries(query_file)
+        else:
+            queries = [(args.source, args.target)]
+        output = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+        write_results(runner.batch(queries), output, args.format, args.paths)
+    except BrokenPipeError:
+        # The reader stopped early, e.g. head, the remaining output is discarded instead of failing again at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError, KeyError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    finally:
+        for stream in (query_file, output):
+            if stream and stream not in (sys.stdin, sys.stdout):
+                stream.close()
+
+    if args.statistics:
+        print(profiler.get_summary(), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,7 @@
 from tkinter import messagebox
 
 from controller.CanvasController import CanvasController
+from controller.PlaybackController import PlaybackController
 from view.ButtonFrame import ButtonFrame
 
 
@@ -14,6 +15,11 @@ class ButtonController:
         """
         self.canvas_controller = canvas_controller
         self.button_frame = button_frame
+        self.playback_controller = PlaybackController(button_frame, canvas_controller, self.disable_step_buttons,
+                                                      self.update_timeline)
+
+        button_frame.algorithm_selection.config(values=list(canvas_controller.ALGORITHMS))
+        button_frame.algorithm_selection.current(0)
 
         # Bind correct methods to buttons
         button_frame.button_clear.config(command=self.button_clear_on_click)
@@ -21,6 +27,7 @@ class ButtonController:
         button_frame.button_reset.config(command=self.button_reset_on_click)
         button_frame.button_next.config(command=self.button_next_on_click)
         button_frame.button_skip.config(command=self.button_skip_on_click)
+        button_frame.timeline_scale.config(command=self.timeline_on_change)
 
 
     def button_clear_on_click(self):
@@ -32,36 +39,97 @@ class ButtonController:
 
     def button_start_on_click(self):
         """
-        Starts the Dijkstra algorithm and changes to buttons.
+        Starts the selected algorithm and changes to buttons.
         """
-        if self.canvas_controller.start_dijkstra():
-            self.button_frame.dijkstra_button_frame.tkraise()
+        if self.canvas_controller.start_dijkstra(self.button_frame.algorithm_selection.get(), self.on_started):
+            return
+        if not self.canvas_controller.active_node:
+            messagebox.showinfo("No node selected", "Use a right click to select a node as start "
+                                                    "or control and a right click to add start nodes.")
         else:
-            messagebox.showinfo("No node selected", "Use a right click to select a node as start.")
+            messagebox.showinfo("No target selected", "Use shift and a right click to select a node as target.")
+
+
+    def on_started(self):
+        """
+        Shows the buttons of the visualization mode after the algorithm started.
+        """
+        self.update_timeline()
+        self.button_frame.show(self.button_frame.dijkstra_button_frame)
 
 
     def button_reset_on_click(self):
         """
         Resets to canvas into edit mode.
         """
+        self.playback_controller.pause()
         self.canvas_controller.reset_dijkstra()
-        self.button_frame.button_next.config(state='normal')
-        self.button_frame.button_skip.config(state='normal')
-        self.button_frame.edit_button_frame.tkraise()
+        self.enable_step_buttons()
+        self.button_frame.show(self.button_frame.edit_button_frame)
 
     def button_next_on_click(self):
         """
         Shows the next step of the Dijkstra algorithm.
         """
+        self.playback_controller.pause()
         if not self.canvas_controller.next_dijkstra():
-            self.button_frame.button_next.config(state='disabled')
-            self.button_frame.button_skip.config(state='disabled')
+            self.disable_step_buttons()
+        self.update_timeline()
 
 
     def button_skip_on_click(self):
         """
         Skips all steps and finishes the Dijkstra algorithm.
         """
-        self.canvas_controller.skip_dijkstra()
+        self.playback_controller.pause()
+        self.canvas_controller.skip_dijkstra(self.on_skipped)
+
+
+    def on_skipped(self):
+        """
+        Disables the step buttons and the timeline, the skipped steps are not recorded.
+        """
+        self.disable_step_buttons()
+        self.update_timeline()
+
+
+    def timeline_on_change(self, value: str):
+        """
+        Shows the step selected on the timeline.
+
+        :param value: The scale's value, the number of executed steps
+        """
+        self.playback_controller.pause()
+        if self.canvas_controller.seek_dijkstra(round(float(value))):
+            self.enable_step_buttons()
+
+
+    def update_timeline(self):
+        """
+        Moves the timeline to the current step, it covers all recorded steps.
+        """
+        recorder = self.canvas_controller.step_recorder
+        if recorder:
+            self.button_frame.timeline_scale.config(to=max(recorder.length, 1))
+            self.button_frame.timeline_variable.set(recorder.position)
+            self.button_frame.timeline_scale.state(['!disabled'])
+        else:
+            self.button_frame.timeline_scale.state(['disabled'])
+
+
+    def enable_step_buttons(self):
+        """
+        Enables the buttons to continue the Dijkstra algorithm.
+        """
+        self.button_frame.button_next.config(state='normal')
+        self.button_frame.button_skip.config(state='normal')
+        self.button_frame.button_play.config(state='normal')
+
+
+    def disable_step_buttons(self):
+        """
+        Disables the buttons to continue the finished Dijkstra algorithm.
+        """
         self.button_frame.button_next.config(state='disabled')
-        self.button_frame.button_skip.config(state='disabled')
\ No newline at end of file
+        self.button_frame.button_skip.config(state='disabled')
+        self.button_frame.button_play.config(state='disabled')
\ No newline at end of file
@@ -1,9 +1,23 @@
 import tkinter as tk
 from tkinter import simpledialog
-from typing import List, Union
-
+from typing import List, Union, Tuple, Dict, Type, Callable, Iterable, Set
+
+from controller.TaskController import TaskController
+from model.AStarAlgorithm import AStarAlgorithm
+from model.BidirectionalDijkstraAlgorithm import BidirectionalDijkstraAlgorithm
+from model.CompactGraph import CompactGraph
+from model.ContractionHierarchy import ContractionHierarchy
+from model.ContractionHierarchyAlgorithm import ContractionHierarchyAlgorithm
 from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.LandmarkAlgorithm import LandmarkAlgorithm
+from model.Landmarks import Landmarks
+from model.MultiSourceDijkstraAlgorithm import MultiSourceDijkstraAlgorithm
 from model.Node import Node
+from model.Profiler import profiler
+from model.SearchState import SearchState, SearchView
+from model.ShortestPathCache import ShortestPathCache
+from model.SpatialIndex import SpatialIndex
+from model.StepRecorder import StepRecorder
 from view.GraphCanvas import GraphCanvas
 from view.InfoLabel import InfoLabel
 
@@ -11,28 +25,68 @@ from view.InfoLabel import InfoLabel
 class CanvasController:
     graph_canvas: GraphCanvas
     info_label: InfoLabel
+    task_controller: TaskController
     nodes: List[Node]
+    spatial_index: SpatialIndex
     active_node: Union[Node, None] = None
+    target_node: Union[Node, None] = None
+    source_nodes: Dict[Node, float]
     name_counter: int
+    graph_version: int
+    path_cache: ShortestPathCache
     dijkstra_algorithm: Union[DijkstraAlgorithm, None] = None
-
-
-    def __init__(self, graph_canvas: GraphCanvas, info_label: InfoLabel):
+    step_recorder: Union[StepRecorder, None] = None
+    search_state: Union[SearchState, None] = None
+    search_state_version: int = -1
+    hierarchy: Union[ContractionHierarchy, None] = None
+    hierarchy_version: int = -1
+    landmarks: Union[Landmarks, None] = None
+    landmarks_version: int = -1
+    pan_position: Union[Tuple[int, int], None] = None
+    zoom_redraw: Union[str, None] = None
+    ZOOM_FACTOR: float = 1.2
+    ZOOM_REDRAW_DELAY: int = 200  # Milliseconds after the last zoom step until all items are recreated
+    SOURCE_COLORS: Tuple[str, ...] = ("dark sea green", "light steel blue", "khaki", "light pink", "plum",
+                                      "light salmon", "pale turquoise", "burlywood", "thistle", "light green")
+    ALGORITHMS: Dict[str, Type[DijkstraAlgorithm]] = {
+        "Dijkstra": DijkstraAlgorithm,
+        "Bidirectional Dijkstra": BidirectionalDijkstraAlgorithm,
+        "A*": AStarAlgorithm,
+        "A* with Landmarks": LandmarkAlgorithm,
+        "Contraction Hierarchy": ContractionHierarchyAlgorithm,
+        "Multi-source Dijkstra": MultiSourceDijkstraAlgorithm,
+    }
+
+
+    def __init__(self, graph_canvas: GraphCanvas, info_label: InfoLabel, task_controller: TaskController):
         """
         Controls the canvas and handle the input logic.
         Differentiates between an edit mode and the visualization mode.
 
         :param graph_canvas: The main canvas
         :param info_label: A label to show further infos.
+        :param task_controller: Runs long computations in the background
         """
         self.graph_canvas = graph_canvas
         self.info_label = info_label
+        self.task_controller = task_controller
         self.nodes = []
+        self.spatial_index = SpatialIndex()
+        self.source_nodes = {}
         self.name_counter = 0
+        self.graph_version = 0
+        self.path_cache = ShortestPathCache()
 
         self.graph_canvas.bind("<Button-1>", self.on_left_click)
         self.graph_canvas.bind("<Button-3>", self.on_right_click)
+        self.graph_canvas.bind("<Shift-Button-3>", self.on_shift_right_click)
+        self.graph_canvas.bind("<Control-Button-3>", self.on_control_right_click)
         self.graph_canvas.bind("<Button-2>", self.on_middle_click)
+        self.graph_canvas.bind("<Control-Button-1>", self.on_pan_start)
+        self.graph_canvas.bind("<Control-B1-Motion>", self.on_pan)
+        self.graph_canvas.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.graph_canvas.bind("<Button-4>", self.on_mouse_wheel)
+        self.graph_canvas.bind("<Button-5>", self.on_mouse_wheel)
 
 
     def get_node_on_position(self, x: int, y: int) -> Union[Node, None]:
@@ -44,10 +98,7 @@ class CanvasController:
         :param y: The number of pixel in y-axis (top to bottom)
         :return: The found node or none
         """
-        for node in reversed(self.nodes):
-            if node.is_position_in_node(x, y):
-                return node
-        return None
+        return self.spatial_index.find(x, y)
 
 
     def add_node(self, x: int, y: int, name: str = None) -> Node:
@@ -65,20 +116,42 @@ class CanvasController:
 
         node = Node(name, x, y)
         self.nodes.append(node)
+        self.spatial_index.insert(node)
+        self.graph_version += 1
+        self.path_cache.node_added(self.graph_version)
         return node
 
 
+    def set_nodes(self, nodes: List[Node]):
+        """
+        Replaces all nodes, e.g. after loading a file.
+
+        :param nodes: The new nodes
+        """
+        self.clear()
+        self.nodes = nodes
+        for node in nodes:
+            self.spatial_index.insert(node)
+        self.graph_version += 1
+
+
     def delete_node(self, node: Node):
         """
         Deletes a node and all its connections.
 
         :param node: The node to delete
         """
-        for neighbour in node.neighbours.copy():
+        for neighbour in list(node.neighbours):
             node.delete_neighbour(neighbour)
         if node is self.active_node:
             self.active_node = None
+        if node is self.target_node:
+            self.target_node = None
+        self.source_nodes.pop(node, None)
         self.nodes.remove(node)
+        self.spatial_index.remove(node)
+        self.graph_version += 1
+        self.path_cache.node_deleted(node, self.graph_version)
 
 
     def add_connection(self, start_node: Node, end_node: Node, weight: int = None):
@@ -98,19 +171,80 @@ class CanvasController:
                 minvalue=0)
 
         if weight is not None:
+            old_weight = start_node.get_weight(end_node)
             start_node.add_neighbour(end_node, weight)
+            self.graph_version += 1
+            self.path_cache.connection_changed(start_node, end_node, old_weight, self.graph_version)
+
+
+    def get_visible_nodes(self) -> List[Node]:
+        """
+        :return: All nodes inside the canvas' viewport
+        """
+        return self.spatial_index.find_in_rectangle(*self.graph_canvas.get_viewport())
 
 
     def redraw_canvas(self, nodes: List[Node] = None, active_node: Node = None):
         """
         Redraws the whole canvas.
 
-        :param nodes: A list of node, default are all nodes.
+        :param nodes: A list of node, default are all nodes inside the viewport.
         :param active_node: The currently selected node to emphasize
         """
-        nodes = nodes if nodes else self.nodes
+        nodes = nodes if nodes else self.get_visible_nodes()
         active_node = active_node if active_node else self.active_node
-        self.graph_canvas.redraw_graph(nodes, active_node)
+        self.graph_canvas.redraw_graph(nodes, active_node, self.target_node, self.get_search_view())
+        self.__draw_sources()
+
+
+    def get_search_view(self) -> Union[SearchView, None]:
+        """
+        :return: A read-only view of the running algorithm's state or None in edit mode
+        """
+        steps = self.get_steps()
+        return steps.get_view() if steps else None
+
+
+    def get_steps(self) -> Union[StepRecorder, DijkstraAlgorithm, None]:
+        """
+        :return: The step recorder of the running algorithm, the algorithm itself if it was skipped to the end
+                 or None in edit mode
+        """
+        return self.step_recorder if self.step_recorder else self.dijkstra_algorithm
+
+
+    def get_hierarchy(self) -> Union[ContractionHierarchy, None]:
+        """
+        :return: The contraction hierarchy of the current graph or None if it has not been built since the last change
+        """
+        return self.hierarchy if self.hierarchy_version == self.graph_version else None
+
+
+    def set_hierarchy(self, hierarchy: Union[ContractionHierarchy, None]):
+        """
+        Sets the contraction hierarchy of the current graph, it is used until the graph changes.
+
+        :param hierarchy: The hierarchy
+        """
+        self.hierarchy = hierarchy
+        self.hierarchy_version = self.graph_version
+
+
+    def get_landmarks(self) -> Union[Landmarks, None]:
+        """
+        :return: The landmarks of the current graph or None if they have not been selected since the last change
+        """
+        return self.landmarks if self.landmarks_version == self.graph_version else None
+
+
+    def set_landmarks(self, landmarks: Union[Landmarks, None]):
+        """
+        Sets the landmarks of the current graph, they are reused by all algorithms until the graph changes.
+
+        :param landmarks: The landmarks
+        """
+        self.landmarks = landmarks
+        self.landmarks_version = self.graph_version
 
 
     def clear(self):
@@ -118,9 +252,24 @@ class CanvasController:
         Clears all nodes and the canvas.
         """
         self.nodes = []
+        self.spatial_index.clear()
         self.active_node = None
+        self.target_node = None
+        self.source_nodes = {}
         self.name_counter = 0
-        self.redraw_canvas()
+        self.graph_version += 1
+        self.path_cache.clear()
+        self.graph_canvas.clear()
+
+
+    def is_editable(self) -> bool:
+        """
+        The graph and the selected nodes can only be changed in edit mode and while no task is running,
+        e.g. the landmarks or the contraction hierarchy are calculated for the selected algorithm before it starts.
+
+        :return: True if the graph and the selected nodes can be changed
+        """
+        return not self.dijkstra_algorithm and not self.task_controller.is_running()
 
 
     def on_left_click(self, event: tk.Event):
@@ -130,14 +279,19 @@ class CanvasController:
 
         :param event: The input event
         """
-        node_unser_mouse = self.get_node_on_position(event.x, event.y)
+        x, y = self.graph_canvas.to_world(event.x, event.y)
+        node_unser_mouse = self.get_node_on_position(x, y)
 
         if self.dijkstra_algorithm:
-            self.draw_shortest_path(node_unser_mouse)
+            # The result must not be read while it is calculated in the background
+            if not self.task_controller.is_running():
+                self.draw_shortest_path(node_unser_mouse)
+            return
+        if not self.is_editable():
             return
 
         if not node_unser_mouse:
-            node_unser_mouse = self.add_node(event.x, event.y)
+            node_unser_mouse = self.add_node(x, y)
             if self.active_node:
                 self.add_connection(self.active_node, node_unser_mouse)
             self.active_node = node_unser_mouse
@@ -155,10 +309,10 @@ class CanvasController:
 
         :param event: The input event
         """
-        if self.dijkstra_algorithm:
+        if not self.is_editable():
             return
 
-        node_unser_mouse = self.get_node_on_position(event.x, event.y)
+        node_unser_mouse = self.get_node_on_position(*self.graph_canvas.to_world(event.x, event.y))
         if not node_unser_mouse:
             return
 
@@ -169,6 +323,67 @@ class CanvasController:
         self.redraw_canvas()
 
 
+    def on_shift_right_click(self, event: tk.Event):
+        """
+        Handles input of the right mouse button while shift is pressed.
+        In edit mode it marks the selected node as target.
+
+        :param event: The input event
+        """
+        if not self.is_editable():
+            return
+
+        node_unser_mouse = self.get_node_on_position(*self.graph_canvas.to_world(event.x, event.y))
+        if not node_unser_mouse:
+            return
+
+        if self.target_node is node_unser_mouse:
+            self.target_node = None
+        else:
+            self.target_node = node_unser_mouse
+        self.redraw_canvas()
+
+
+    def on_control_right_click(self, event: tk.Event):
+        """
+        Handles input of the right mouse button while control is pressed.
+        In edit mode it adds the selected node as additional start node of the multi-source algorithm
+        with an initial distance (offset), or removes it if it already is one.
+
+        :param event: The input event
+        """
+        if not self.is_editable():
+            return
+
+        node_unser_mouse = self.get_node_on_position(*self.graph_canvas.to_world(event.x, event.y))
+        if not node_unser_mouse:
+            return
+
+        if node_unser_mouse in self.source_nodes:
+            del self.source_nodes[node_unser_mouse]
+        else:
+            offset = simpledialog.askfloat(
+                "Offset",
+                f"Input the initial distance of start node '{node_unser_mouse.name}'.:",
+                parent=self.graph_canvas,
+                initialvalue=0,
+                minvalue=0)
+            if offset is None:
+                return
+            self.source_nodes[node_unser_mouse] = offset
+        self.redraw_canvas()
+
+
+    def get_sources(self) -> Dict[Node, float]:
+        """
+        :return: The start nodes of the multi-source algorithm with their offsets,
+                 the selected node is the first one with offset 0 unless it was added with another offset
+        """
+        sources = {self.active_node: 0.0} if self.active_node else {}
+        sources.update(self.source_nodes)
+        return sources
+
+
     def on_middle_click(self, event: tk.Event):
         """
         Handles input of the middle mouse button.
@@ -176,10 +391,10 @@ class CanvasController:
 
         :param event: The input event
         """
-        if self.dijkstra_algorithm:
+        if not self.is_editable():
             return
 
-        node_unser_mouse = self.get_node_on_position(event.x, event.y)
+        node_unser_mouse = self.get_node_on_position(*self.graph_canvas.to_world(event.x, event.y))
         if not node_unser_mouse:
             return
 
@@ -187,46 +402,241 @@ class CanvasController:
         self.redraw_canvas()
 
 
-    def start_dijkstra(self) -> bool:
+    def on_pan_start(self, event: tk.Event):
+        """
+        Handles the start of moving the visible area (control and left mouse button).
+
+        :param event: The input event
+        """
+        self.pan_position = (event.x, event.y)
+
+
+    def on_pan(self, event: tk.Event):
+        """
+        Moves the visible area while the mouse is dragged (control and left mouse button).
+
+        :param event: The input event
+        """
+        if self.pan_position:
+            self.graph_canvas.pan(event.x - self.pan_position[0], event.y - self.pan_position[1])
+            self.redraw_view()
+        self.pan_position = (event.x, event.y)
+
+
+    def on_mouse_wheel(self, event: tk.Event):
+        """
+        Zooms in or out at the mouse position.
+        The drawn items are scaled immediately, they are recreated for the new zoom level
+        when the mouse wheel did not move for ZOOM_REDRAW_DELAY.
+
+        :param event: The input event
+        """
+        zoom_in = event.num == 4 or event.delta > 0
+        self.graph_canvas.zoom_at(event.x, event.y, self.ZOOM_FACTOR if zoom_in else 1 / self.ZOOM_FACTOR)
+        self.redraw_view()
+        if self.zoom_redraw:
+            self.graph_canvas.after_cancel(self.zoom_redraw)
+        self.zoom_redraw = self.graph_canvas.after(self.ZOOM_REDRAW_DELAY, self.__finish_zoom)
+
+
+    def __finish_zoom(self):
+        """
+        Recreates all items for the current zoom level, e.g. to show or hide the texts.
+        """
+        self.zoom_redraw = None
+        self.graph_canvas.clear()
+        self.redraw_view()
+
+
+    def redraw_view(self):
+        """
+        Updates the canvas after the visible area changed, only nodes entering or leaving it are drawn or deleted.
+        """
+        self.graph_canvas.update_view(self.get_visible_nodes(), self.active_node, self.target_node,
+                                      self.get_search_view())
+        if self.dijkstra_algorithm:
+            self.draw_dijkstra(changed_nodes=())
+        else:
+            self.__draw_sources()
+
+
+    def start_dijkstra(self, algorithm: str = "Dijkstra", on_started: Callable[[], None] = None) -> bool:
         """
         Initializes the Dijkstra algorithm and switches to visualisation mode.
+        If a target node is selected, the algorithm stops as soon as the target is reached.
+        A missing contraction hierarchy or missing landmarks are calculated in the background before
+        the algorithm starts.
+
+        :param algorithm: The name of the algorithm, a key of ALGORITHMS
+        :param on_started: Called when the algorithm shows its first step
+        :return: False if missing start node or a required target node, else True
+        """
+        algorithm_class = self.ALGORITHMS[algorithm]
+        multi_source = algorithm_class is MultiSourceDijkstraAlgorithm
+        if not (self.get_sources() if multi_source else self.active_node) or \
+                (algorithm_class.requires_target and not self.target_node):
+            return False
+
+        def start(_=None):
+            self.__create_algorithm(algorithm_class)
+            if on_started:
+                on_started()
 
-        :return: False if missing start node, else True
+        if not self.__preprocess(algorithm_class, start):
+            start()
+        return True
+
+
+    def __preprocess(self, algorithm_class: Type[DijkstraAlgorithm], on_done: Callable[[], None]) -> bool:
         """
-        if not self.active_node:
+        Calculates the contraction hierarchy or the landmarks of the current graph in the background,
+        if the algorithm needs them and they are missing.
+        The worker uses a compact copy of the graph, so the graph is not shared with the main thread.
+
+        :param algorithm_class: The algorithm's class
+        :param on_done: Called when the calculation finished and the graph did not change meanwhile
+        :return: False if nothing has to be calculated, else True
+        """
+        if algorithm_class is ContractionHierarchyAlgorithm and not self.get_hierarchy():
+            calculate, store, text = ContractionHierarchy.build, self.set_hierarchy, "Building contraction hierarchy"
+        elif algorithm_class is LandmarkAlgorithm and not self.get_landmarks():
+            calculate, store, text = Landmarks.select, self.set_landmarks, "Selecting landmarks"
+        else:
             return False
-        self.dijkstra_algorithm = DijkstraAlgorithm(self.nodes, self.active_node)
+
+        graph = CompactGraph.from_nodes(self.nodes)
+        version = self.graph_version
+
+        def finished(result):
+            if version == self.graph_version:
+                store(result)
+                on_done()
+
+        self.task_controller.run(lambda task: calculate(graph, progress=task.report_progress), text, finished)
+        return True
+
+
+    def __create_algorithm(self, algorithm_class: Type[DijkstraAlgorithm]):
+        """
+        Creates the algorithm and shows its first step.
+
+        :param algorithm_class: The algorithm's class
+        """
+        # The state is reused until the graph changes, so a new run only touches the nodes it reaches
+        if self.search_state_version != self.graph_version:
+            self.search_state = SearchState(self.nodes)
+            self.search_state_version = self.graph_version
+        if algorithm_class is ContractionHierarchyAlgorithm:
+            self.dijkstra_algorithm = ContractionHierarchyAlgorithm(self.nodes, self.active_node, self.target_node,
+                                                                    self.get_hierarchy(), self.search_state)
+        elif algorithm_class is LandmarkAlgorithm:
+            self.dijkstra_algorithm = LandmarkAlgorithm(self.nodes, self.active_node, self.target_node,
+                                                        self.get_landmarks(), self.search_state)
+        elif algorithm_class is MultiSourceDijkstraAlgorithm:
+            sources = self.get_sources()
+            self.dijkstra_algorithm = MultiSourceDijkstraAlgorithm(self.nodes, list(sources), list(sources.values()),
+                                                                   target_node=self.target_node,
+                                                                   state=self.search_state)
+        else:
+            self.dijkstra_algorithm = algorithm_class(self.nodes, self.active_node, target_node=self.target_node,
+                                                      state=self.search_state)
+        if algorithm_class is ContractionHierarchyAlgorithm:
+            self.graph_canvas.set_checked_color(self.__get_hierarchy_color)
+        elif algorithm_class is MultiSourceDijkstraAlgorithm:
+            self.graph_canvas.set_checked_color(self.__get_owner_color)
+        else:
+            self.graph_canvas.set_checked_color(None)
+        self.step_recorder = StepRecorder(self.dijkstra_algorithm)
         self.next_dijkstra()
         self.info_label.set_text(self.info_label.dijkstra_info)
-        return True
 
 
-    def next_dijkstra(self) -> bool:
+    def next_dijkstra(self, steps: int = 1) -> bool:
         """
         Shows the next step of the Dijkstra algorithm.
+        Multiple steps are coalesced into one update of the canvas, only the last step is highlighted.
 
+        :param steps: The number of steps to execute
         :return: False if no more steps else True
         """
-        try:
-            next(self.dijkstra_algorithm)
-            self.draw_dijkstra()
-            return True
-        except StopIteration:
+        step_iterator = self.get_steps()
+        changed_nodes: Union[Set[Node], None] = set()
+        finished = False
+        with profiler.measure("steps"):
+            for step in range(steps):
+                try:
+                    next(step_iterator)
+                except StopIteration:
+                    finished = True
+                    break
+                if step_iterator.changed_nodes is None:
+                    changed_nodes = None
+                elif changed_nodes is not None:
+                    changed_nodes.update(step_iterator.changed_nodes)
+        profiler.count("steps", step if finished else steps)
+
+        if finished:
+            self.path_cache.store(self.dijkstra_algorithm, self.graph_version)
             self.info_label.set_text(self.info_label.dijkstra_ended_info)
-            return False
+            if step == 0:
+                return False
+        self.draw_dijkstra(changed_nodes is None, changed_nodes)
+        return not finished
 
 
-    def skip_dijkstra(self):
+    def skip_dijkstra(self, on_finished: Callable[[], None] = None):
         """
         Skips all steps of the Dijkstra algorithm and shows the finished algorithm.
+        Uses the cached result if the algorithm already ran from the same start node,
+        otherwise the algorithm is solved in the background.
+        If the background task is cancelled, the algorithm restarts with its first step.
+
+        :param on_finished: Called when the finished algorithm is shown
         """
-        while self.dijkstra_algorithm:
-            try:
-                next(self.dijkstra_algorithm)
-            except StopIteration:
-                self.draw_dijkstra()
-                self.info_label.set_text(self.info_label.dijkstra_ended_info)
-                break
+        if not self.dijkstra_algorithm:
+            return
+        algorithm = self.dijkstra_algorithm
+
+        def finished(_=None):
+            # The recorded steps end before the skipped steps
+            self.step_recorder = None
+            self.path_cache.store(algorithm, self.graph_version)
+            self.draw_dijkstra()
+            self.info_label.set_text(self.info_label.dijkstra_ended_info)
+            if on_finished:
+                on_finished()
+
+        if self.path_cache.load(algorithm, self.graph_version):
+            finished()
+        else:
+            self.task_controller.run(lambda task: algorithm.solve(task.report_progress), "Solving",
+                                     finished, lambda: self.__restart_algorithm(type(algorithm)))
+
+
+    def __restart_algorithm(self, algorithm_class: Type[DijkstraAlgorithm]):
+        """
+        Restarts the algorithm after its background task was cancelled.
+        The cancelled task may still write its state until it notices the cancellation, so a new state is used.
+
+        :param algorithm_class: The algorithm's class
+        """
+        self.search_state_version = -1
+        self.__create_algorithm(algorithm_class)
+
+
+    def seek_dijkstra(self, position: int) -> bool:
+        """
+        Shows the recorded step at the given position of the timeline.
+
+        :param position: The number of executed steps
+        :return: False if the steps are not recorded, e.g. after skipping to the end, else True
+        """
+        if not self.step_recorder:
+            return False
+        self.step_recorder.seek(position)
+        self.draw_dijkstra()
+        self.info_label.set_text(self.info_label.dijkstra_info)
+        return True
 
 
     def reset_dijkstra(self):
@@ -236,22 +646,82 @@ class CanvasController:
         if self.dijkstra_algorithm:
             self.dijkstra_algorithm.reset()
             self.dijkstra_algorithm = None
+            self.step_recorder = None
+        self.graph_canvas.set_checked_color(None)
         self.redraw_canvas()
         self.info_label.set_text(self.info_label.base_info)
 
 
-    def draw_dijkstra(self):
+    def draw_dijkstra(self, redraw: bool = False, changed_nodes: Iterable[Node] = None):
+        """
+        Updates the canvas and draws the current dijkstra step.
+        Only the nodes changed by the last step are updated.
+
+        :param redraw: If true all visible nodes are updated
+        :param changed_nodes: The nodes to update, default are the nodes changed by the last step
+        """
+        steps = self.get_steps()
+        if changed_nodes is None:
+            changed_nodes = steps.changed_nodes
+        if redraw or changed_nodes is None:
+            self.redraw_canvas()
+        else:
+            self.graph_canvas.update_nodes(changed_nodes, self.active_node, self.target_node, self.get_search_view())
+            self.__draw_sources()
+        if steps.current_node:
+            outline_color = "red" if steps.current_node is self.active_node or \
+                steps.current_node in self.source_nodes else None
+            self.graph_canvas.draw_node(steps.current_node, outline_color, "green")
+
+            if steps.current_neighbour:
+                algorithm = self.dijkstra_algorithm
+                shortcut = isinstance(algorithm, ContractionHierarchyAlgorithm) and \
+                    algorithm.is_shortcut(steps.current_node, steps.current_neighbour)
+                self.graph_canvas.draw_node(steps.current_neighbour, "chartreuse")
+                self.graph_canvas.draw_connection(steps.current_node, steps.current_neighbour, color="chartreuse",
+                                                  dash=(6, 4) if shortcut else None)
+
+
+    def __get_hierarchy_color(self, node: Node) -> str:
+        """
+        Distinguishes the searches on the contraction hierarchy.
+
+        :param node: A checked node
+        :return: Dark sea green for the upward search from the start node, light steel blue for the search
+                 from the target node and dark sea green for nodes only reached by unpacking the path
+        """
+        algorithm = self.dijkstra_algorithm
+        if isinstance(algorithm, ContractionHierarchyAlgorithm) and node in algorithm.downward_nodes and \
+                node not in algorithm.upward_nodes:
+            return "light steel blue"
+        return "dark sea green"
+
+
+    def __get_owner_color(self, node: Node) -> str:
         """
-        Redraws the whole canvas and draws the current dijkstra step.
+        Colors the partition of the multi-source algorithm.
+
+        :param node: A checked node
+        :return: The color of the start node owning the node, dark sea green if it is unreachable
         """
-        self.redraw_canvas(self.dijkstra_algorithm.nodes)
-        if self.dijkstra_algorithm.current_node:
-            outline_color = "red" if self.dijkstra_algorithm.current_node is self.active_node else None
-            self.graph_canvas.draw_node(self.dijkstra_algorithm.current_node, outline_color, "green")
+        algorithm = self.dijkstra_algorithm
+        if not isinstance(algorithm, MultiSourceDijkstraAlgorithm):
+            return "dark sea green"
+        owner = algorithm.get_owner(node)
+        if owner is None:
+            return "dark sea green"
+        return self.SOURCE_COLORS[algorithm.start_nodes.index(owner) % len(self.SOURCE_COLORS)]
+
 
-            if self.dijkstra_algorithm.current_neighbour:
-                self.graph_canvas.draw_node(self.dijkstra_algorithm.current_neighbour, "chartreuse")
-                self.graph_canvas.draw_connection(self.dijkstra_algorithm.current_node, self.dijkstra_algorithm.current_neighbour, color="chartreuse")
+    def __draw_sources(self):
+        """
+        Highlights the additional start nodes of the multi-source algorithm with a red outline like the selected node.
+        """
+        search_view = self.get_search_view()
+        for node in self.source_nodes:
+            checked = search_view and search_view.is_checked(node)
+            fill_color = self.graph_canvas.get_checked_color(node) if checked else None
+            self.graph_canvas.draw_node(node, "red", fill_color)
 
 
     def draw_shortest_path(self, target_node: Node):
@@ -264,10 +734,11 @@ class CanvasController:
         if not target_node:
             return
 
+        search_view = self.get_search_view()
         start_node = target_node
-        end_node = target_node.predecessor
+        end_node = search_view.get_predecessor(target_node)
         while end_node:
             self.graph_canvas.draw_connection(start_node, end_node, color="red")
             start_node = end_node
-            end_node = end_node.predecessor
+            end_node = search_view.get_predecessor(end_node)
 
@@ -1,79 +1,107 @@
-import json
 from pathlib import Path
-from tkinter import filedialog
+from tkinter import filedialog, messagebox
+
+from typing import List, Tuple, Union
 
 from controller.CanvasController import CanvasController
+from controller.TaskController import TaskController
+from model.BackgroundTask import BackgroundTask
+from model.CompactGraph import CompactGraph
+from model.ContractionHierarchy import ContractionHierarchy
+from model.GraphFile import GraphFile
+from model.Node import Node
 from view.ButtonFrame import ButtonFrame
 
 
 class FileController:
+    FILE_TYPES = (("Graph Files", "*.jsonl"), ("JSON Files (legacy)", "*.json"), ("Graph Snapshots", "*.graph"), ("All Files", "*.*"))
     last_directory: Path = Path(__file__).parent.parent.parent / "data/"
 
 
-    def __init__(self, canvas_controller: CanvasController, button_frame: ButtonFrame):
+    def __init__(self, canvas_controller: CanvasController, button_frame: ButtonFrame, task_controller: TaskController):
         """
         Controls the functionality of the file menu.
 
         :param canvas_controller: The current canvas controller
         :param button_frame: The current button frame
+        :param task_controller: Runs the loading of files in the background
         """
         self.canvas_controller = canvas_controller
         self.button_frame = button_frame
+        self.task_controller = task_controller
 
 
     def open_file(self, file: Path = None):
         """
-        Reads a file and loads its config.
+        Reads a file in the background and loads its config.
+        A contraction hierarchy stored next to the file is loaded as well if it matches the graph.
         If no file is given a filedialog will be opened.
+        Only one background task can run at a time, the user is told if another task is still running.
 
         :param file: The file to read, if None a filedialog will be opened
         """
         if not file:
             print(self.last_directory)
-            file_name = filedialog.askopenfilename(filetypes=(("JSON Files", "*.json"), ("All Files", "*.*")), initialdir=self.last_directory)
+            file_name = filedialog.askopenfilename(filetypes=self.FILE_TYPES, initialdir=self.last_directory)
             if not file_name:
                 return
             file = Path(file_name)
             self.last_directory = file
 
-        json_string = file.read_text()
-        nodes_dict = json.loads(json_string)
+        if not self.task_controller.run(lambda task: self.__read(file, task), f"Loading {file.name}",
+                                        self.__set_nodes):
+            messagebox.showinfo("Task running", f"{file.name} was not opened, wait until the running task "
+                                                "finished or cancel it.")
+
 
-        self.canvas_controller.clear()
+    @staticmethod
+    def __read(file: Path, task: BackgroundTask) -> Tuple[List[Node], Union[ContractionHierarchy, None]]:
+        """
+        Reads the graph and its contraction hierarchy, runs in the background.
 
-        nodes = []
-        for node_dict in nodes_dict["nodes"]:
-            nodes.append(self.canvas_controller.add_node(node_dict["x"], node_dict["y"], node_dict["name"]))
+        :param file: The graph's file
+        :param task: Receives the progress of reading the graph, reading stops if it was cancelled
+        :return: The nodes and the hierarchy or None if there is no matching hierarchy
+        """
+        nodes = GraphFile.read(file, task.report_progress)
+        hierarchy_file = ContractionHierarchy.get_file(file)
+        hierarchy = ContractionHierarchy.load(file, CompactGraph.from_nodes(nodes)) if hierarchy_file.exists() else None
+        return nodes, hierarchy
 
-        # Add connections
-        for node, node_dict in zip(nodes, nodes_dict["nodes"]):
-            for neighbour_dict, weight in zip(node_dict["neighbours"], node_dict["weights"]):
-                x, y = neighbour_dict["x"], neighbour_dict["y"]
-                neighbour = next((n for n in nodes if n.x == x and n.y == y))
-                self.canvas_controller.add_connection(node, neighbour, weight)
 
-        self.canvas_controller.name_counter = max((int(n.name) for n in nodes if n.name.isdigit())) + 1
+    def __set_nodes(self, result: Tuple[List[Node], Union[ContractionHierarchy, None]]):
+        """
+        Shows the loaded nodes in edit mode.
+
+        :param result: The loaded nodes and their contraction hierarchy
+        """
+        nodes, hierarchy = result
+        self.canvas_controller.set_nodes(nodes)
+        self.canvas_controller.set_hierarchy(hierarchy)
+        self.canvas_controller.name_counter = max((int(n.name) for n in nodes if n.name.isdigit()), default=0) + 1
         self.canvas_controller.reset_dijkstra()
-        self.button_frame.edit_button_frame.tkraise()
+        self.button_frame.show(self.button_frame.edit_button_frame)
 
 
     def save_file(self, file: Path = None):
         """
-        Saves the current graph as JSON file.
+        Saves the current graph as file, files ending with .json are saved in the legacy format.
+        A built contraction hierarchy of the graph is saved next to the file.
         If no file is given a filedialog will be opened.
 
         :param file: The file to write, if None a filedialog will be opened
         """
-        node_dicts = [n.to_dict() for n in self.canvas_controller.nodes]
-        json_string = json.dumps({"nodes": node_dicts})
         if not file:
-            file_name = filedialog.asksaveasfilename(filetypes=(("JSON Files", "*.json"), ("All Files", "*.*")), initialdir=self.last_directory)
+            file_name = filedialog.asksaveasfilename(filetypes=self.FILE_TYPES, defaultextension=".jsonl", initialdir=self.last_directory)
             if not file_name:
                 return
             file = Path(file_name)
             self.last_directory = file
 
-        file.write_text(json_string)
+        GraphFile.write(file, self.canvas_controller.nodes)
+        hierarchy = self.canvas_controller.get_hierarchy()
+        if hierarchy:
+            hierarchy.write(ContractionHierarchy.get_file(file))
 
 
 
@@ -0,0 +1,108 @@
+import time
+from typing import Callable
+
+from controller.CanvasController import CanvasController
+from view.ButtonFrame import ButtonFrame
+
+
+class PlaybackController:
+    FRAME_INTERVAL: int = 33  # Milliseconds between two frames, about 30 frames per second
+    MAX_FRAME_TIME: float = 0.25  # Longer pauses between two frames, e.g. while dragging the window, are ignored
+    MIN_SPEED_EXPONENT: float = 0.0  # 1 step per second
+    MAX_SPEED_EXPONENT: float = 5.0  # 100000 steps per second
+    playing: bool = False
+    speed: float = 10.0
+    step_budget: float = 0.0
+    last_frame_time: float = 0.0
+
+
+    def __init__(self, button_frame: ButtonFrame, canvas_controller: CanvasController,
+                 on_finished: Callable[[], None], on_frame: Callable[[], None]):
+        """
+        Plays the algorithm's steps automatically with the speed selected by the speed scale.
+        A frame is drawn every FRAME_INTERVAL milliseconds, all steps due since the last frame are
+        executed at once and drawn together, so fast speeds do not need one redraw per step.
+        If drawing takes longer than the interval, more steps are coalesced into one frame.
+
+        :param button_frame: The button frame with the play button and the speed scale
+        :param canvas_controller: The canvas controller running the algorithm
+        :param on_finished: Called when the algorithm finished while playing
+        :param on_frame: Called after each drawn frame
+        """
+        self.button_frame = button_frame
+        self.canvas_controller = canvas_controller
+        self.on_finished = on_finished
+        self.on_frame = on_frame
+
+        button_frame.button_play.config(command=self.toggle)
+        button_frame.speed_scale.config(from_=self.MIN_SPEED_EXPONENT, to=self.MAX_SPEED_EXPONENT,
+                                        command=self.on_speed_change)
+        button_frame.speed_scale.set(1.0)
+        self.on_speed_change(button_frame.speed_scale.get())
+
+
+    def on_speed_change(self, value: str):
+        """
+        Sets the speed, the scale is logarithmic.
+
+        :param value: The scale's value, the exponent of the steps per second
+        """
+        self.speed = 10 ** float(value)
+        self.button_frame.speed_label.config(text=f"{self.speed:,.0f} steps/s")
+
+
+    def toggle(self):
+        """
+        Starts or pauses the playback.
+        """
+        if self.playing:
+            self.pause()
+        else:
+            self.play()
+
+
+    def play(self):
+        """
+        Starts the playback.
+        """
+        if self.playing or not self.canvas_controller.dijkstra_algorithm:
+            return
+        self.playing = True
+        self.step_budget = 0.0
+        self.last_frame_time = time.perf_counter()
+        self.button_frame.button_play.config(text="Pause")
+        self.button_frame.after(self.FRAME_INTERVAL, self.__frame)
+
+
+    def pause(self):
+        """
+        Pauses the playback, the already scheduled frame does nothing.
+        """
+        self.playing = False
+        self.button_frame.button_play.config(text="Play")
+
+
+    def __frame(self):
+        """
+        Executes and draws all steps due since the last frame and schedules the next frame.
+        """
+        if not self.playing:
+            return
+        if not self.canvas_controller.dijkstra_algorithm:
+            self.pause()
+            return
+
+        now = time.perf_counter()
+        self.step_budget += self.speed * min(now - self.last_frame_time, self.MAX_FRAME_TIME)
+        self.last_frame_time = now
+        steps = int(self.step_budget)
+        self.step_budget -= steps
+
+        if steps and not self.canvas_controller.next_dijkstra(steps):
+            self.pause()
+            self.on_frame()
+            self.on_finished()
+            return
+        if steps:
+            self.on_frame()
+        self.button_frame.after(self.FRAME_INTERVAL, self.__frame)
@@ -0,0 +1,67 @@
+from pathlib import Path
+from tkinter import filedialog
+
+from model.Profiler import profiler
+from view.GraphCanvas import GraphCanvas
+
+
+class StatisticsController:
+    REFRESH_INTERVAL: int = 500  # Milliseconds between two refreshes of the overlay
+    FILE_TYPES = (("JSON Files", "*.json"), ("All Files", "*.*"))
+    visible: bool = False
+
+
+    def __init__(self, graph_canvas: GraphCanvas):
+        """
+        Controls the profiler from the statistics menu.
+        While the statistics are shown, the profiler records and the canvas shows its summary as overlay.
+
+        :param graph_canvas: The canvas showing the overlay
+        """
+        self.graph_canvas = graph_canvas
+
+
+    def toggle_statistics(self):
+        """
+        Shows or hides the statistics, the profiler only records while they are shown.
+        """
+        self.visible = not self.visible
+        profiler.enabled = self.visible
+        if self.visible:
+            self.__refresh()
+        else:
+            self.graph_canvas.draw_statistics(None)
+
+
+    def reset_statistics(self):
+        """
+        Removes all recorded statistics.
+        """
+        profiler.reset()
+        if self.visible:
+            self.graph_canvas.draw_statistics(profiler.get_summary())
+
+
+    def export_statistics(self, file: Path = None):
+        """
+        Writes the recorded statistics as JSON file.
+        If no file is given a filedialog will be opened.
+
+        :param file: The file to write, if None a filedialog will be opened
+        """
+        if not file:
+            file_name = filedialog.asksaveasfilename(filetypes=self.FILE_TYPES, defaultextension=".json")
+            if not file_name:
+                return
+            file = Path(file_name)
+        profiler.export(file)
+
+
+    def __refresh(self):
+        """
+        Redraws the overlay periodically while the statistics are shown.
+        """
+        if not self.visible:
+            return
+        self.graph_canvas.draw_statistics(profiler.get_summary() or "No statistics recorded yet")
+        self.graph_canvas.after(self.REFRESH_INTERVAL, self.__refresh)
@@ -0,0 +1,85 @@
+from tkinter import messagebox, ttk
+from typing import Callable, Any, Union
+
+from model.BackgroundTask import BackgroundTask, TaskCancelled
+from view.ButtonFrame import ButtonFrame
+from view.InfoLabel import InfoLabel
+
+
+class TaskController:
+    POLL_INTERVAL: int = 50  # Milliseconds between two polls of the running task
+    task: Union[BackgroundTask, None] = None
+
+
+    def __init__(self, button_frame: ButtonFrame, info_label: InfoLabel):
+        """
+        Runs long computations in a background task, so the window stays responsive.
+        The task is polled by the Tk main loop, meanwhile the progress is shown and the task can be cancelled.
+
+        :param button_frame: The button frame, its cancel button is shown while a task is running
+        :param info_label: The label showing the progress
+        """
+        self.button_frame = button_frame
+        self.info_label = info_label
+        button_frame.button_cancel.config(command=self.cancel)
+
+
+    def is_running(self) -> bool:
+        """
+        :return: True if a task is running
+        """
+        return self.task is not None
+
+
+    def run(self, function: Callable[[BackgroundTask], Any], text: str, on_done: Callable[[Any], None],
+            on_cancel: Callable[[], None] = None) -> bool:
+        """
+        Starts a background task, only one task can run at a time.
+        The callbacks are called in the Tk main loop.
+
+        :param function: The function to run in the background, it receives the task to report its progress
+        :param text: The description of the task shown with its progress
+        :param on_done: Called with the function's result if it finished
+        :param on_cancel: Called if the task was cancelled, the function may still be running until it reports
+                          its progress the next time, so it must not share any state with the main thread
+        :return: False if another task is still running, else True
+        """
+        if self.task:
+            return False
+        self.task = BackgroundTask(function).start()
+        previous_frame = self.button_frame.visible_frame
+        self.button_frame.show(self.button_frame.task_button_frame)
+        self.info_label.set_progress(text)
+        self.button_frame.after(self.POLL_INTERVAL, self.__poll, text, previous_frame, on_done, on_cancel)
+        return True
+
+
+    def cancel(self):
+        """
+        Cancels the running task.
+        """
+        if self.task:
+            self.task.cancel()
+
+
+    def __poll(self, text: str, previous_frame: ttk.Frame, on_done: Callable[[Any], None], on_cancel: Callable[[], None]):
+        """
+        Shows the progress of the running task and calls the callbacks if it finished.
+        """
+        task = self.task
+        if not task.done and not task.cancelled:
+            self.info_label.set_progress(text, task.progress)
+            self.button_frame.after(self.POLL_INTERVAL, self.__poll, text, previous_frame, on_done, on_cancel)
+            return
+
+        # A cancelled task which does not report its progress keeps running, its result is discarded
+        self.task = None
+        self.button_frame.show(previous_frame)
+        self.info_label.restore_text()
+        if task.cancelled or isinstance(task.error, TaskCancelled):
+            if on_cancel:
+                on_cancel()
+        elif task.error:
+            messagebox.showerror("Error", str(task.error))
+        else:
+            on_done(task.result)
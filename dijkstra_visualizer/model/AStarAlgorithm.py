@@ -0,0 +1,157 @@
+import heapq
+import math
+import time
+from typing import List, Iterator, Callable
+
+from model.DijkstraAlgorithm import DijkstraAlgorithm, Step
+from model.Node import Node
+from model.SearchState import SearchState, SearchView
+
+
+class EuclideanHeuristic:
+    def __init__(self, factor: float = 1.0):
+        """
+        Estimates the remaining distance by the euclidean distance of the nodes' positions.
+        Consistent as long as every weight is at least the factor times the length of its connection,
+        use from_nodes to get the largest such factor of a graph.
+
+        :param factor: The factor the euclidean distance is multiplied with
+        """
+        self.factor = factor
+
+
+    @classmethod
+    def from_nodes(cls, nodes: List[Node]) -> "EuclideanHeuristic":
+        """
+        Creates the heuristic with the smallest ratio of weight to length of all connections as factor,
+        so it is consistent for any weights, e.g. for weights much smaller than the connections' lengths.
+
+        :param nodes: All nodes of the graph
+        :return: The heuristic, its factor is 0 if no connection has a length
+        """
+        factor = float('inf')
+        for node in nodes:
+            for neighbour, weight in zip(node.neighbours, node.weights):
+                length = math.hypot(node.x - neighbour.x, node.y - neighbour.y)
+                if length > 0:
+                    factor = min(factor, weight / length)
+        return cls(factor if factor != float('inf') else 0.0)
+
+
+    def __call__(self, node: Node, target_node: Node) -> float:
+        return self.factor * math.hypot(node.x - target_node.x, node.y - target_node.y)
+
+
+class AStarAlgorithm(DijkstraAlgorithm):
+    requires_target: bool = True
+
+
+    def __init__(self, nodes: List[Node], start_node: Node, target_node: Node,
+                 heuristic: Callable[[Node, Node], float] = None, state: SearchState = None):
+        """
+        Implements the A* algorithm, the nodes are checked in the order of their distance plus
+        the heuristic's estimation of the remaining distance to the target.
+        Checked nodes are never reopened, so the heuristic has to be consistent to find the shortest path:
+        h(u) <= w(u, v) + h(v) for every connection (u, v) and h(target) = 0.
+
+        :param nodes: All current nodes
+        :param start_node: The start node
+        :param target_node: The target node
+        :param heuristic: A function estimating the distance from a node to the target node,
+                          default is the EuclideanHeuristic with the factor of the graph's weights, see from_nodes
+        :param state: A state of the same nodes to reuse, its previous result is discarded
+        """
+        self.heuristic = heuristic if heuristic else EuclideanHeuristic.from_nodes(nodes)
+        super().__init__(nodes, start_node, target_node=target_node, state=state)
+
+
+    def __initialize(self) -> List:
+        """
+        Starts a new run of the state.
+
+        :return: The heap containing the start node
+        """
+        self.state.reset()
+        self.state.set_distance(self.start_node, 0)
+        return [(self.heuristic(self.start_node, self.target_node), self.state.index[self.start_node], self.start_node)]
+
+
+    def _algorithm(self) -> Iterator[Step]:
+        """
+        The A* algorithm implemented as generator.
+
+        :return: A generator
+        """
+        heap = self.__initialize()
+        state = self.state
+
+        changed_nodes = None
+        while heap:
+            _, _, current_node = heapq.heappop(heap)
+            if state.is_checked(current_node):
+                continue
+            yield current_node, None, changed_nodes
+            changed_nodes = ()
+
+            if current_node is not self.target_node:
+                current_distance = state.get_distance(current_node)
+                for neighbour, weight in zip(current_node.neighbours, current_node.weights):
+                    if not state.is_checked(neighbour):
+                        yield current_node, neighbour, ()
+                        new_distance = current_distance + weight
+                        if new_distance < state.get_distance(neighbour):
+                            state.set_distance(neighbour, new_distance, current_node)
+                            estimation = new_distance + self.heuristic(neighbour, self.target_node)
+                            heapq.heappush(heap, (estimation, state.index[neighbour], neighbour))
+                            yield current_node, neighbour, (neighbour,)
+
+            state.check(current_node)
+            yield None, None, (current_node,)
+            if current_node is self.target_node:
+                break
+
+
+    def solve(self, progress: Callable[[float], None] = None) -> SearchView:
+        """
+        Runs the whole algorithm at once without yielding the single steps.
+
+        :param progress: Called with the fraction of checked nodes every PROGRESS_INTERVAL checked nodes,
+                         an exception raised by it aborts the algorithm
+        :return: A read-only view of the result
+        """
+        start_time = time.perf_counter()
+        heap = self.__initialize()
+        state = self.state
+        stamp, index = state.stamp, state.index
+        distances, predecessors, stamps, checked = state.distances, state.predecessors, state.stamps, state.checked_stamps
+
+        checked_count = relaxed_count = push_count = 0
+        while heap:
+            _, i, current_node = heapq.heappop(heap)
+            if checked[i] == stamp:
+                continue
+            checked[i] = stamp
+            checked_count += 1
+            if current_node is self.target_node:
+                break
+            if progress and checked_count % self.PROGRESS_INTERVAL == 0:
+                progress(checked_count / len(index))
+
+            distance = distances[i]
+            relaxed_count += len(current_node.neighbours)
+            for neighbour, weight in zip(current_node.neighbours, current_node.weights):
+                j = index[neighbour]
+                if checked[j] != stamp:
+                    new_distance = distance + weight
+                    if stamps[j] != stamp or new_distance < distances[j]:
+                        distances[j] = new_distance
+                        predecessors[j] = current_node
+                        stamps[j] = stamp
+                        estimation = new_distance + self.heuristic(neighbour, self.target_node)
+                        heapq.heappush(heap, (estimation, j, neighbour))
+                        push_count += 1
+
+        self._record_statistics(time.perf_counter() - start_time, checked_count, relaxed_count,
+                                push_count + 1, push_count + 1 - len(heap))
+        self.finish()
+        return state.view()
@@ -0,0 +1,98 @@
+import threading
+from typing import Callable, Any, Union
+
+
+class TaskCancelled(Exception):
+    """
+    Raised inside a background task's function to stop it after the task was cancelled.
+    """
+
+
+class BackgroundTask:
+    progress: Union[float, None] = None
+    result: Any = None
+    error: Union[BaseException, None] = None
+    __thread: threading.Thread
+    __cancelled: threading.Event
+    __done: threading.Event
+
+
+    def __init__(self, function: Callable[["BackgroundTask"], Any]):
+        """
+        Runs a function in a worker thread, the result has to be polled, e.g. from the Tk main loop.
+        The function receives this task to report its progress, reporting raises TaskCancelled after the
+        task was cancelled. If the function does not report any progress, cancelling only discards its result.
+
+        :param function: The function to run, it receives the task and returns the result
+        """
+        self.function = function
+        self.__cancelled = threading.Event()
+        self.__done = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+
+
+    def start(self) -> "BackgroundTask":
+        """
+        Starts the worker thread.
+
+        :return: This task
+        """
+        self.__thread.start()
+        return self
+
+
+    def cancel(self):
+        """
+        Requests the function to stop, it is stopped the next time it reports its progress.
+        """
+        self.__cancelled.set()
+
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        :return: True if the task was cancelled
+        """
+        return self.__cancelled.is_set()
+
+
+    @property
+    def done(self) -> bool:
+        """
+        :return: True if the function returned or raised an error
+        """
+        return self.__done.is_set()
+
+
+    def report_progress(self, progress: float):
+        """
+        Called by the function to report its progress.
+
+        :param progress: The finished fraction between 0 and 1
+        :raises TaskCancelled: If the task was cancelled
+        """
+        if self.__cancelled.is_set():
+            raise TaskCancelled()
+        self.progress = progress
+
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Blocks until the function returned.
+
+        :param timeout: The maximum time to wait in seconds, None to wait forever
+        :return: True if the function returned
+        """
+        return self.__done.wait(timeout)
+
+
+    def __run(self):
+        """
+        The worker thread's target, stores the result or the raised error.
+        """
+        try:
+            self.result = self.function(self)
+        except BaseException as error:
+            self.error = error
+        finally:
+            self.__done.set()
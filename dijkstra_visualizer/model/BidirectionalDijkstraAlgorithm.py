@@ -0,0 +1,191 @@
+import heapq
+import time
+from typing import List, Iterator, Dict, Set, Union, Callable, Tuple
+
+from model.DijkstraAlgorithm import DijkstraAlgorithm, Step
+from model.Node import Node
+from model.SearchState import SearchState, SearchView
+
+
+class BidirectionalDijkstraAlgorithm(DijkstraAlgorithm):
+    requires_target: bool = True
+    backward_distance: Dict[Node, float]
+    backward_predecessor: Dict[Node, Node]
+    meeting_node: Union[Node, None] = None
+
+
+    def __init__(self, nodes: List[Node], start_node: Node, target_node: Node, state: SearchState = None):
+        """
+        Searches the shortest path between the start and the target node simultaneously from both sides.
+        The search with the smaller distance is continued, both searches meet in the middle.
+        Works because the graph is undirected.
+
+        The forward search uses the run's state, the backward search backward_distance and backward_predecessor.
+        Nodes checked by either search are marked as checked. When finished, the distances and predecessors
+        of the nodes on the backward part of the shortest path are set, so the path can be followed from the target.
+
+        :param nodes: All current nodes
+        :param start_node: The start node
+        :param target_node: The target node
+        :param state: A state of the same nodes to reuse, its previous result is discarded
+        """
+        self.backward_distance = {}
+        self.backward_predecessor = {}
+        super().__init__(nodes, start_node, target_node=target_node, state=state)
+
+
+    def _algorithm(self) -> Iterator[Step]:
+        """
+        The bidirectional Dijkstra algorithm implemented as generator.
+
+        :return: A generator
+        """
+        state = self.state
+        index = state.index
+        forward_heap, backward_heap, best_distance = self.__initialize()
+        forward_checked: Set[Node] = set()
+        backward_checked: Set[Node] = set()
+
+        changed_nodes = None
+        while True:
+            # Remove outdated entries
+            while forward_heap and forward_heap[0][2] in forward_checked:
+                heapq.heappop(forward_heap)
+            while backward_heap and backward_heap[0][2] in backward_checked:
+                heapq.heappop(backward_heap)
+            if not forward_heap or not backward_heap or forward_heap[0][0] + backward_heap[0][0] >= best_distance:
+                break
+
+            forward = forward_heap[0][0] <= backward_heap[0][0]
+            heap, checked = (forward_heap, forward_checked) if forward else (backward_heap, backward_checked)
+
+            distance, _, current_node = heapq.heappop(heap)
+            yield current_node, None, changed_nodes
+            changed_nodes = ()
+
+            for neighbour, weight in zip(current_node.neighbours, current_node.weights):
+                if neighbour in checked:
+                    continue
+                yield current_node, neighbour, ()
+
+                new_distance = distance + weight
+                if forward and new_distance < state.get_distance(neighbour):
+                    state.set_distance(neighbour, new_distance, current_node)
+                    heapq.heappush(heap, (new_distance, index[neighbour], neighbour))
+                    yield current_node, neighbour, (neighbour,)
+                elif not forward and new_distance < self.backward_distance.get(neighbour, float('inf')):
+                    self.backward_distance[neighbour] = new_distance
+                    self.backward_predecessor[neighbour] = current_node
+                    heapq.heappush(heap, (new_distance, index[neighbour], neighbour))
+                    yield current_node, neighbour, ()
+
+                # Check if the path over the neighbour is shorter if both searches reached it
+                path_distance = state.get_distance(neighbour) + self.backward_distance.get(neighbour, float('inf'))
+                if path_distance < best_distance:
+                    best_distance = path_distance
+                    self.meeting_node = neighbour
+
+            checked.add(current_node)
+            state.check(current_node)
+            yield None, None, (current_node,)
+
+        self.__complete_path()
+        yield None, None, None
+
+
+    def __initialize(self) -> Tuple[List[Tuple[float, int, Node]], List[Tuple[float, int, Node]], float]:
+        """
+        Discards the previous run and sets the distances of the start and the target node.
+
+        :return: The forward heap, the backward heap and the distance of the best path found so far
+        """
+        state = self.state
+        state.reset()
+        state.set_distance(self.start_node, 0)
+        self.backward_distance = {self.target_node: 0}
+        self.backward_predecessor = {}
+        self.meeting_node = self.start_node if self.start_node is self.target_node else None
+
+        forward_heap = [(0, state.index[self.start_node], self.start_node)]
+        backward_heap = [(0, state.index[self.target_node], self.target_node)]
+        return forward_heap, backward_heap, 0 if self.meeting_node else float('inf')
+
+
+    def __complete_path(self):
+        """
+        Sets the distances and predecessors of the nodes on the path from the meeting node to the target.
+        """
+        if self.meeting_node is None:
+            return
+        total_distance = self.state.get_distance(self.meeting_node) + self.backward_distance[self.meeting_node]
+        node = self.meeting_node
+        while node in self.backward_predecessor:
+            next_node = self.backward_predecessor[node]
+            self.state.set_distance(next_node, total_distance - self.backward_distance[next_node], node)
+            node = next_node
+
+
+    def solve(self, progress: Callable[[float], None] = None) -> SearchView:
+        """
+        Runs the whole algorithm at once without yielding the single steps.
+        The loop is the same as in _algorithm, the statistics count the work of both searches together.
+
+        :param progress: Called with the fraction of checked nodes every PROGRESS_INTERVAL checked nodes,
+                         an exception raised by it aborts the algorithm
+        :return: A read-only view of the result
+        """
+        start_time = time.perf_counter()
+        state = self.state
+        index = state.index
+        forward_heap, backward_heap, best_distance = self.__initialize()
+        forward_checked: Set[Node] = set()
+        backward_checked: Set[Node] = set()
+
+        checked_count = relaxed_count = pop_count = 0
+        push_count = 2
+        while True:
+            # Remove outdated entries
+            while forward_heap and forward_heap[0][2] in forward_checked:
+                heapq.heappop(forward_heap)
+                pop_count += 1
+            while backward_heap and backward_heap[0][2] in backward_checked:
+                heapq.heappop(backward_heap)
+                pop_count += 1
+            if not forward_heap or not backward_heap or forward_heap[0][0] + backward_heap[0][0] >= best_distance:
+                break
+
+            forward = forward_heap[0][0] <= backward_heap[0][0]
+            heap, checked = (forward_heap, forward_checked) if forward else (backward_heap, backward_checked)
+            distance, _, current_node = heapq.heappop(heap)
+            pop_count += 1
+
+            relaxed_count += len(current_node.neighbours)
+            for neighbour, weight in zip(current_node.neighbours, current_node.weights):
+                if neighbour in checked:
+                    continue
+                new_distance = distance + weight
+                if forward and new_distance < state.get_distance(neighbour):
+                    state.set_distance(neighbour, new_distance, current_node)
+                    heapq.heappush(heap, (new_distance, index[neighbour], neighbour))
+                    push_count += 1
+                elif not forward and new_distance < self.backward_distance.get(neighbour, float('inf')):
+                    self.backward_distance[neighbour] = new_distance
+                    self.backward_predecessor[neighbour] = current_node
+                    heapq.heappush(heap, (new_distance, index[neighbour], neighbour))
+                    push_count += 1
+
+                path_distance = state.get_distance(neighbour) + self.backward_distance.get(neighbour, float('inf'))
+                if path_distance < best_distance:
+                    best_distance = path_distance
+                    self.meeting_node = neighbour
+
+            checked.add(current_node)
+            state.check(current_node)
+            checked_count += 1
+            if progress and checked_count % self.PROGRESS_INTERVAL == 0:
+                progress(min(checked_count / len(self.nodes), 1.0))
+
+        self.__complete_path()
+        self._record_statistics(time.perf_counter() - start_time, checked_count, relaxed_count, push_count, pop_count)
+        self.finish()
+        return state.view()
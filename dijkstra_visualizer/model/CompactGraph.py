@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from array import array
+from typing import List, Iterator, Tuple
+
+from model.Node import Node
+
+
+class CompactGraph:
+    names: List[str]
+    xs: array
+    ys: array
+    offsets: array
+    targets: array
+    weights: array
+
+
+    def __init__(self, names: List[str], xs: array, ys: array, offsets: array, targets: array, weights: array):
+        """
+        Compressed sparse row (CSR) representation of an undirected graph.
+        Nodes are referenced by their index, the neighbours of node i are
+        targets[offsets[i]:offsets[i + 1]] with the corresponding weights.
+        Every undirected edge is stored once per direction.
+        Instead of arrays read-only memoryviews with the same typecodes can be used, e.g. of a mapped file.
+
+        :param names: The node names
+        :param xs: The nodes' number of pixel in x-axis, typecode 'd'
+        :param ys: The nodes' number of pixel in y-axis, typecode 'd'
+        :param offsets: Start of each node's edges in targets and weights, length is number of nodes + 1, typecode 'q'
+        :param targets: The neighbour indices, typecode 'q'
+        :param weights: The edge weights, typecode 'd'
+        """
+        self.names = names
+        self.xs = xs
+        self.ys = ys
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+
+    @classmethod
+    def from_nodes(cls, nodes: List[Node]) -> CompactGraph:
+        """
+        Creates a compact graph from a list of nodes.
+        The node indices correspond to the position in the list.
+
+        :param nodes: All nodes of the graph
+        :return: A new instance of CompactGraph
+        """
+        index = {node: i for i, node in enumerate(nodes)}
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+        for node in nodes:
+            targets.extend(index[n] for n in node.neighbours)
+            weights.extend(node.weights)
+            offsets.append(len(targets))
+
+        return cls(
+            [n.name for n in nodes],
+            array('d', (n.x for n in nodes)),
+            array('d', (n.y for n in nodes)),
+            offsets,
+            targets,
+            weights
+        )
+
+
+    def to_nodes(self) -> List[Node]:
+        """
+        Converts the compact graph back to a list of nodes.
+        Every connection is stored in both directions, so each node's connections are set at once
+        from its own range without adding the mirrored connection.
+
+        :return: A list of new nodes in index order
+        """
+        nodes = [Node(name, _to_pixel(x), _to_pixel(y)) for name, x, y in zip(self.names, self.xs, self.ys)]
+        targets, weights = self.targets.tolist(), self.weights.tolist()
+        offsets = self.offsets.tolist()
+        for node, start, end in zip(nodes, offsets, offsets[1:]):
+            node.set_neighbours(dict(zip(map(nodes.__getitem__, targets[start:end]), weights[start:end])))
+        return nodes
+
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+    @property
+    def edge_count(self) -> int:
+        """
+        :return: The number of undirected edges
+        """
+        return len(self.targets) // 2
+
+
+    def neighbours(self, index: int) -> Iterator[Tuple[int, float]]:
+        """
+        Iterates over the neighbours of a node.
+
+        :param index: The node's index
+        :return: An iterator of tuples of the neighbour's index and the edge weight
+        """
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+
+def _to_pixel(value: float):
+    return int(value) if value.is_integer() else value
@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+import heapq
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import List, Dict, Tuple, Iterator, Callable, Union
+
+from model.CompactGraph import CompactGraph
+
+
+class ContractionHierarchy:
+    MAGIC: bytes = b"DJKC"
+    VERSION: int = 1
+    HEADER = struct.Struct("<4sIQQQ")  # Magic, version, node count, upward edge count, fingerprint of the graph
+    FILE_SUFFIX: str = ".ch"
+    WITNESS_LIMIT: int = 64  # Maximum number of nodes settled by a witness search
+    WITNESS_HOPS: int = 5  # Maximum number of connections of a witness path
+    PROGRESS_INTERVAL: int = 256  # Number of contracted nodes between two progress reports of build
+    ranks: array
+    offsets: array
+    targets: array
+    weights: array
+    middles: array
+    fingerprint: int
+
+
+    def __init__(self, ranks: array, offsets: array, targets: array, weights: array, middles: array, fingerprint: int):
+        """
+        A contraction hierarchy of an undirected graph, it answers shortest path queries by two small searches.
+        The nodes are contracted one after another in the order of their rank. Contracting a node adds a
+        shortcut between two of its neighbours if the path over the node is the only shortest path between them.
+
+        Only the upward edges are stored, from each node to its neighbours of higher rank at the time it was
+        contracted, in compressed sparse row format like CompactGraph. Because the graph is undirected,
+        the search from the target uses the same upward edges, on the way back to the target they lead downward.
+        middles contains the node bypassed by a shortcut or -1 for an original connection.
+
+        :param ranks: The contraction order of each node, typecode 'q'
+        :param offsets: Start of each node's upward edges, length is number of nodes + 1, typecode 'q'
+        :param targets: The upward neighbours' indices, typecode 'q'
+        :param weights: The weights of the upward edges, typecode 'd'
+        :param middles: The bypassed node of each upward edge or -1, typecode 'q'
+        :param fingerprint: The fingerprint of the graph the hierarchy was built for
+        """
+        self.ranks = ranks
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.middles = middles
+        self.fingerprint = fingerprint
+
+
+    @classmethod
+    def build(cls, graph: CompactGraph, progress: Callable[[float], None] = None) -> ContractionHierarchy:
+        """
+        Contracts all nodes of the graph, the next node is the one with the smallest priority:
+        twice the edge difference (added shortcuts minus removed connections) plus the number of its
+        already contracted neighbours plus its level, the length of the longest hierarchy path below it.
+        So the contracted nodes are spread over the graph and the hierarchy stays flat.
+
+        The priorities are updated lazily: the node with the smallest queued priority is simulated again,
+        it is contracted with the shortcuts of this simulation if its priority is still the smallest,
+        otherwise it is queued with the new priority. The neighbours of a contracted node are not simulated.
+
+        :param graph: The graph to preprocess
+        :param progress: Called with the fraction of contracted nodes every PROGRESS_INTERVAL nodes,
+                         an exception raised by it aborts the preprocessing
+        :return: The hierarchy
+        """
+        node_count = len(graph)
+        # Maps each neighbour of the remaining graph to the weight and the bypassed node
+        adjacency: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(node_count)]
+        for i in range(node_count):
+            edges = adjacency[i]
+            for j, weight in graph.neighbours(i):
+                if j != i and (j not in edges or weight < edges[j][0]):
+                    edges[j] = (weight, -1)
+
+        contracted_neighbours = [0] * node_count
+        levels = [0] * node_count
+        upward: List[List[Tuple[int, float, int]]] = [[] for _ in range(node_count)]
+        ranks = array('q', [0]) * node_count
+
+        def simulate(node: int) -> Tuple[int, List[Tuple[int, int, float]]]:
+            shortcuts = cls.__find_shortcuts(adjacency, node)
+            return 2 * (len(shortcuts) - len(adjacency[node])) + contracted_neighbours[node] + levels[node], shortcuts
+
+        # Every node is queued once, a node is only requeued after it was popped
+        queue = [(simulate(i)[0], i) for i in range(node_count)]
+        heapq.heapify(queue)
+        rank = 0
+        while queue:
+            _, node = heapq.heappop(queue)
+            # Contracting other nodes changed the priority, the shortcuts are used if it is still the smallest
+            priority, shortcuts = simulate(node)
+            if queue and priority > queue[0][0]:
+                heapq.heappush(queue, (priority, node))
+                continue
+
+            edges = adjacency[node]
+            upward[node] = [(neighbour, weight, middle) for neighbour, (weight, middle) in edges.items()]
+            for neighbour in edges:
+                del adjacency[neighbour][node]
+                contracted_neighbours[neighbour] += 1
+                levels[neighbour] = max(levels[neighbour], levels[node] + 1)
+            adjacency[node] = {}
+            for a, b, weight in shortcuts:
+                if b not in adjacency[a] or weight < adjacency[a][b][0]:
+                    adjacency[a][b] = adjacency[b][a] = (weight, node)
+
+            ranks[node] = rank
+            rank += 1
+            if progress and rank % cls.PROGRESS_INTERVAL == 0:
+                progress(rank / node_count)
+
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+        middles = array('q')
+        for edges in upward:
+            for target, weight, middle in edges:
+                targets.append(target)
+                weights.append(weight)
+                middles.append(middle)
+            offsets.append(len(targets))
+        return cls(ranks, offsets, targets, weights, middles, cls.get_fingerprint(graph))
+
+
+    @classmethod
+    def __find_shortcuts(cls, adjacency: List[Dict[int, Tuple[float, int]]],
+                         node: int) -> List[Tuple[int, int, float]]:
+        """
+        Simulates the contraction of a node. One witness search from each neighbour looks for paths to all
+        later neighbours avoiding the node, which are at most as long as the paths over the node.
+        The search only follows paths of up to WITNESS_HOPS connections and settles up to WITNESS_LIMIT nodes.
+        If a witness is missed because of the limits a superfluous shortcut is added, which does not
+        change any result.
+
+        :return: The shortcuts as tuples of both neighbours and the weight
+        """
+        neighbours = list(adjacency[node].items())
+        limit, max_hops = cls.WITNESS_LIMIT, cls.WITNESS_HOPS
+        shortcuts = []
+        for i, (source, (source_weight, _)) in enumerate(neighbours[:-1]):
+            # The later neighbours still missing a witness and the length of their path over the node
+            missing = {target: source_weight + weight for target, (weight, _) in neighbours[i + 1:]}
+            max_distance = max(missing.values())
+            distances = {source: 0.0}
+            heap = [(0.0, source, 0)]
+            settled = 0
+            while heap and missing and settled < limit:
+                distance, current, hops = heapq.heappop(heap)
+                if distance > distances[current] or hops == max_hops:
+                    continue
+                settled += 1
+                for neighbour, (weight, _) in adjacency[current].items():
+                    new_distance = distance + weight
+                    if new_distance <= max_distance and neighbour != node and \
+                            new_distance < distances.get(neighbour, float('inf')):
+                        distances[neighbour] = new_distance
+                        heapq.heappush(heap, (new_distance, neighbour, hops + 1))
+                        # Any path found is a witness, the neighbour does not have to be settled
+                        if new_distance <= missing.get(neighbour, -1.0):
+                            del missing[neighbour]
+
+            shortcuts += [(source, target, via_distance) for target, via_distance in missing.items()]
+        return shortcuts
+
+
+    def __len__(self) -> int:
+        return len(self.ranks)
+
+
+    @property
+    def shortcut_count(self) -> int:
+        """
+        :return: The number of shortcuts
+        """
+        return sum(1 for middle in self.middles if middle >= 0)
+
+
+    def upward(self, index: int) -> Iterator[Tuple[int, float, int]]:
+        """
+        Iterates over the upward edges of a node.
+
+        :param index: The node's index
+        :return: An iterator of tuples of the neighbour's index, the weight and the bypassed node or -1
+        """
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return zip(self.targets[start:end], self.weights[start:end], self.middles[start:end])
+
+
+    def get_middle(self, a: int, b: int) -> int:
+        """
+        :param a: First node of a hierarchy edge
+        :param b: Second node of a hierarchy edge
+        :return: The node bypassed by the edge or -1 if it is an original connection
+        :raises KeyError: If the nodes are not connected in the hierarchy
+        """
+        lower, higher = (a, b) if self.ranks[a] < self.ranks[b] else (b, a)
+        for target, _, middle in self.upward(lower):
+            if target == higher:
+                return middle
+        raise KeyError(f"No hierarchy edge between {a} and {b}")
+
+
+    def unpack(self, a: int, b: int) -> List[int]:
+        """
+        Replaces a hierarchy edge by the path of original connections, shortcuts are unpacked recursively.
+
+        :param a: First node of the edge
+        :param b: Second node of the edge
+        :return: The indices of the nodes on the path from a to b
+        """
+        path = [a]
+        pending = [b]
+        while pending:
+            middle = self.get_middle(path[-1], pending[-1])
+            if middle < 0:
+                path.append(pending.pop())
+            else:
+                pending.append(middle)
+        return path
+
+
+    def query(self, source: int, target: int) -> Tuple[float, List[int]]:
+        """
+        Calculates the shortest path by two upward searches from the source and the target.
+        A search stops as soon as its smallest distance is at least the shortest path found so far.
+        A node is stalled, its edges are not relaxed, if a node of higher rank reached by the same search
+        leads to it by a shorter downward edge, then the node's distance is too large anyway.
+
+        :param source: The source's index
+        :param target: The target's index
+        :return: The distance (inf if unreachable) and the indices of the nodes on the path (empty if unreachable)
+        """
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        infinity = float('inf')
+        distances = ({source: 0.0}, {target: 0.0})
+        predecessors: Tuple[Dict[int, int], Dict[int, int]] = ({}, {})
+        heaps = ([(0.0, source)], [(0.0, target)])
+        best_distance = infinity
+        meeting_node = -1
+
+        while True:
+            active = [side for side in (0, 1) if heaps[side] and heaps[side][0][0] < best_distance]
+            if not active:
+                break
+            side = active[0] if len(active) == 1 or heaps[0][0][0] <= heaps[1][0][0] else 1
+            distance, current = heapq.heappop(heaps[side])
+            side_distances, other_distances = distances[side], distances[1 - side]
+            if distance > side_distances[current]:
+                continue
+            if current in other_distances and distance + other_distances[current] < best_distance:
+                best_distance = distance + other_distances[current]
+                meeting_node = current
+
+            edges = range(offsets[current], offsets[current + 1])
+            if any(distance > side_distances.get(targets[edge], distance) + weights[edge] for edge in edges):
+                continue
+            side_heap, side_predecessors = heaps[side], predecessors[side]
+            for edge in edges:
+                neighbour = targets[edge]
+                new_distance = distance + weights[edge]
+                if new_distance < side_distances.get(neighbour, infinity):
+                    side_distances[neighbour] = new_distance
+                    side_predecessors[neighbour] = current
+                    heapq.heappush(side_heap, (new_distance, neighbour))
+
+        if meeting_node < 0:
+            return float('inf'), []
+        return best_distance, self.get_path(meeting_node, *predecessors)
+
+
+    def get_path(self, meeting_node: int, forward_predecessors: Dict[int, int],
+                 backward_predecessors: Dict[int, int]) -> List[int]:
+        """
+        Unpacks the path of both searches over the meeting node.
+
+        :param meeting_node: The node where both searches met
+        :param forward_predecessors: The predecessors of the search from the source
+        :param backward_predecessors: The predecessors of the search from the target
+        :return: The indices of the nodes on the path from the source to the target
+        """
+        hierarchy_path = [meeting_node]
+        while hierarchy_path[-1] in forward_predecessors:
+            hierarchy_path.append(forward_predecessors[hierarchy_path[-1]])
+        hierarchy_path.reverse()
+        while hierarchy_path[-1] in backward_predecessors:
+            hierarchy_path.append(backward_predecessors[hierarchy_path[-1]])
+
+        path = hierarchy_path[:1]
+        for a, b in zip(hierarchy_path, hierarchy_path[1:]):
+            path += self.unpack(a, b)[1:]
+        return path
+
+
+    @staticmethod
+    def get_fingerprint(graph: CompactGraph) -> int:
+        """
+        :param graph: The graph
+        :return: A checksum of the graph's connections, a hierarchy is only valid for a graph with the same one.
+                 It does not depend on the order of each node's connections, which changes when a file is loaded.
+        """
+        fingerprint = zlib.crc32(struct.pack("<Q", len(graph)))
+        for i in range(len(graph)):
+            edges = sorted(graph.neighbours(i))
+            fingerprint = zlib.crc32(array('d', (value for edge in edges for value in edge)), fingerprint)
+        return fingerprint
+
+
+    def matches(self, graph: CompactGraph) -> bool:
+        """
+        :param graph: The graph
+        :return: True if the hierarchy was built for this graph
+        """
+        return len(self) == len(graph) and self.fingerprint == self.get_fingerprint(graph)
+
+
+    @classmethod
+    def get_file(cls, graph_file: Path) -> Path:
+        """
+        :param graph_file: The file of the graph
+        :return: The file storing the graph's hierarchy next to it
+        """
+        return graph_file.with_name(graph_file.name + cls.FILE_SUFFIX)
+
+
+    @classmethod
+    def load(cls, graph_file: Path, graph: CompactGraph) -> Union[ContractionHierarchy, None]:
+        """
+        Reads the hierarchy stored next to a graph file.
+
+        :param graph_file: The file of the graph
+        :param graph: The graph read from the file
+        :return: The hierarchy or None if there is no valid hierarchy for the graph
+        """
+        return cls.load_file(cls.get_file(graph_file), graph)
+
+
+    @classmethod
+    def load_file(cls, file: Path, graph: CompactGraph) -> Union[ContractionHierarchy, None]:
+        """
+        Reads a hierarchy file if it belongs to the graph.
+
+        :param file: The hierarchy's file
+        :param graph: The graph the hierarchy must match
+        :return: The hierarchy or None if the file is missing, invalid or belongs to another graph
+        """
+        if not file.exists():
+            return None
+        try:
+            hierarchy = cls.read(file)
+        except (OSError, ValueError):
+            return None
+        return hierarchy if hierarchy.matches(graph) else None
+
+
+    def write(self, file: Path):
+        """
+        Writes the hierarchy as binary file.
+        The header is followed by the packed arrays ranks, offsets, targets, weights and middles.
+        All arrays consist of 8 byte values in native (little-endian) order.
+        The file is replaced at once, because the arrays may be views of the mapped file itself.
+
+        :param file: The file to write
+        """
+        ContractionHierarchy.__check_byteorder()
+        temporary_file = file.with_name(file.name + ".tmp")
+        with temporary_file.open("wb") as stream:
+            stream.write(self.HEADER.pack(self.MAGIC, self.VERSION, len(self), len(self.targets), self.fingerprint))
+            for values in (self.ranks, self.offsets, self.targets, self.weights, self.middles):
+                stream.write(values)
+        os.replace(temporary_file, file)
+
+
+    @classmethod
+    def read(cls, file: Path) -> ContractionHierarchy:
+        """
+        Maps a binary hierarchy file into memory, the arrays are read-only views of the mapped file.
+
+        :param file: The file to read
+        :return: The hierarchy
+        """
+        ContractionHierarchy.__check_byteorder()
+        with file.open("rb") as stream:
+            buffer = memoryview(mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ))
+
+        if len(buffer) < cls.HEADER.size:
+            raise ValueError(f"Not a contraction hierarchy ({file})")
+        magic, version, node_count, edge_count, fingerprint = cls.HEADER.unpack_from(buffer)
+        if magic != cls.MAGIC:
+            raise ValueError(f"Not a contraction hierarchy ({file})")
+        if version > cls.VERSION:
+            raise ValueError(f"Unsupported contraction hierarchy version {version} ({file})")
+
+        position = cls.HEADER.size
+        arrays = []
+        for typecode, length in (('q', node_count), ('q', node_count + 1), ('q', edge_count), ('d', edge_count),
+                                 ('q', edge_count)):
+            end = position + 8 * length
+            if end > len(buffer):
+                raise ValueError(f"Truncated contraction hierarchy ({file})")
+            arrays.append(buffer[position:end].cast(typecode))
+            position = end
+        return cls(*arrays, fingerprint)
+
+
+    @staticmethod
+    def __check_byteorder():
+        if sys.byteorder != "little":
+            raise ValueError("Contraction hierarchies are only supported on little-endian machines")
@@ -0,0 +1,204 @@
+import heapq
+import time
+from functools import cached_property
+from typing import List, Iterator, Dict, Set, Union, Callable
+
+from model.CompactGraph import CompactGraph
+from model.ContractionHierarchy import ContractionHierarchy
+from model.DijkstraAlgorithm import DijkstraAlgorithm, Step
+from model.Node import Node
+from model.Profiler import profiler
+from model.SearchState import SearchState, SearchView
+
+
+class ContractionHierarchyAlgorithm(DijkstraAlgorithm):
+    requires_target: bool = True
+    backward_distance: Dict[Node, float]
+    backward_predecessor: Dict[Node, Node]
+    meeting_node: Union[Node, None] = None
+
+
+    def __init__(self, nodes: List[Node], start_node: Node, target_node: Node,
+                 hierarchy: ContractionHierarchy = None, state: SearchState = None):
+        """
+        Searches the shortest path on a contraction hierarchy, see ContractionHierarchy.
+        The upward search from the start and the search from the target only follow edges to nodes of
+        higher rank, including shortcuts. They are alternated like the bidirectional Dijkstra algorithm
+        and both run until their smallest distance is at least the shortest path found so far.
+
+        The upward search uses the run's state, the search from the target backward_distance and
+        backward_predecessor. When finished, the shortcuts on the shortest path are unpacked and the
+        distances and predecessors of all nodes on the path are set, so the path can be followed from the target.
+
+        :param nodes: All current nodes
+        :param start_node: The start node
+        :param target_node: The target node
+        :param hierarchy: The hierarchy of the nodes, built if None
+        :param state: A state of the same nodes to reuse, its previous result is discarded
+        """
+        self.hierarchy = hierarchy if hierarchy else ContractionHierarchy.build(CompactGraph.from_nodes(nodes))
+        self.backward_distance = {}
+        self.backward_predecessor = {}
+        super().__init__(nodes, start_node, target_node=target_node, state=state)
+
+
+    @cached_property
+    def upward_nodes(self) -> Set[Node]:
+        """
+        Calculated on first use, it is only needed to color the searches.
+
+        :return: All nodes reachable from the start node by upward edges
+        """
+        return self.__get_search_space(self.start_node)
+
+
+    @cached_property
+    def downward_nodes(self) -> Set[Node]:
+        """
+        Calculated on first use, it is only needed to color the searches.
+
+        :return: All nodes reachable from the target node by upward edges
+        """
+        return self.__get_search_space(self.target_node)
+
+
+    def __get_search_space(self, node: Node) -> Set[Node]:
+        """
+        :param node: The node to start from
+        :return: All nodes reachable from the node by upward edges, a superset of the nodes one search checks
+        """
+        index = self.state.index[node]
+        reached = {index}
+        pending = [index]
+        while pending:
+            for neighbour, _, _ in self.hierarchy.upward(pending.pop()):
+                if neighbour not in reached:
+                    reached.add(neighbour)
+                    pending.append(neighbour)
+        return {self.nodes[i] for i in reached}
+
+
+    def is_shortcut(self, node: Node, neighbour: Node) -> bool:
+        """
+        :param node: First node of a hierarchy edge
+        :param neighbour: Second node of a hierarchy edge
+        :return: True if the edge between the nodes is a shortcut
+        """
+        return self.hierarchy.get_middle(self.state.index[node], self.state.index[neighbour]) >= 0
+
+
+    def _algorithm(self) -> Iterator[Step]:
+        """
+        The search on the contraction hierarchy implemented as generator.
+
+        :return: A generator
+        """
+        state = self.state
+        state.reset()
+        state.set_distance(self.start_node, 0)
+        self.backward_distance = {self.target_node: 0}
+        self.backward_predecessor = {}
+        self.meeting_node = None
+
+        index = state.index
+        heaps = ([(0, index[self.start_node], self.start_node)], [(0, index[self.target_node], self.target_node)])
+        best_distance = float('inf')
+
+        changed_nodes = None
+        while True:
+            active = [heap for heap in heaps if heap and heap[0][0] < best_distance]
+            if not active:
+                break
+            heap = min(active, key=lambda h: h[0][0])
+            forward = heap is heaps[0]
+
+            distance, i, current_node = heapq.heappop(heap)
+            # Skip outdated entries
+            if forward and distance > state.get_distance(current_node) or \
+                    not forward and distance > self.backward_distance[current_node]:
+                continue
+            yield current_node, None, changed_nodes
+            changed_nodes = ()
+
+            # Check if the path over the node is shorter if both searches reached it
+            if forward:
+                path_distance = distance + self.backward_distance.get(current_node, float('inf'))
+            else:
+                path_distance = distance + state.get_distance(current_node)
+            if path_distance < best_distance:
+                best_distance = path_distance
+                self.meeting_node = current_node
+
+            for j, weight, _ in self.hierarchy.upward(i):
+                neighbour = self.nodes[j]
+                yield current_node, neighbour, ()
+
+                new_distance = distance + weight
+                if forward and new_distance < state.get_distance(neighbour):
+                    state.set_distance(neighbour, new_distance, current_node)
+                    heapq.heappush(heap, (new_distance, j, neighbour))
+                    yield current_node, neighbour, (neighbour,)
+                elif not forward and new_distance < self.backward_distance.get(neighbour, float('inf')):
+                    self.backward_distance[neighbour] = new_distance
+                    self.backward_predecessor[neighbour] = current_node
+                    heapq.heappush(heap, (new_distance, j, neighbour))
+                    yield current_node, neighbour, ()
+
+            state.check(current_node)
+            yield None, None, (current_node,)
+
+        if self.meeting_node is not None:
+            self.__set_path(self.__unpack_path())
+        yield None, None, None
+
+
+    def __unpack_path(self) -> List[int]:
+        """
+        :return: The indices of the nodes on the shortest path over the meeting node
+        """
+        index = self.state.index
+        forward_predecessors = {}
+        node = self.meeting_node
+        while self.state.get_predecessor(node):
+            forward_predecessors[index[node]] = index[self.state.get_predecessor(node)]
+            node = self.state.get_predecessor(node)
+        backward_predecessors = {index[node]: index[predecessor]
+                                 for node, predecessor in self.backward_predecessor.items()}
+        return self.hierarchy.get_path(index[self.meeting_node], forward_predecessors, backward_predecessors)
+
+
+    def __set_path(self, path: List[int]):
+        """
+        Sets the distances and predecessors of the nodes on the path and marks them as checked.
+
+        :param path: The indices of the nodes on the path from the start to the target
+        """
+        distance = 0
+        predecessor = None
+        for i in path:
+            node = self.nodes[i]
+            if predecessor:
+                distance += node.get_weight(predecessor)
+            self.state.set_distance(node, distance, predecessor)
+            self.state.check(node)
+            predecessor = node
+
+
+    def solve(self, progress: Callable[[float], None] = None) -> SearchView:
+        """
+        Runs the query on the hierarchy's arrays without any Node, only the nodes on the path are set.
+
+        :param progress: Not called, the searches are small
+        :return: A read-only view of the result
+        """
+        start_time = time.perf_counter()
+        self.state.reset()
+        index = self.state.index
+        _, path = self.hierarchy.query(index[self.start_node], index[self.target_node])
+        self.__set_path(path)
+        if not path:
+            self.state.check_all()
+
+        profiler.add_time("solve", time.perf_counter() - start_time)
+        self.finish()
+        return self.state.view()
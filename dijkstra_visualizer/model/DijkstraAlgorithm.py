@@ -1,84 +1,345 @@
-from typing import List, Tuple, Union, Iterator
+import heapq
+import math
+import time
+from array import array
+from typing import List, Tuple, Union, Iterator, Type, Callable
 
+from model.CompactGraph import CompactGraph
 from model.Node import Node
+from model.PriorityQueue import PriorityQueue, HeapPriorityQueue, BucketPriorityQueue
+from model.Profiler import profiler
+from model.SearchState import SearchState, SearchView
+
+# The active node, the checked neighbour and the changed nodes (None if all nodes may have changed)
+Step = Tuple[Union[Node, None], Union[Node, None], Union[Tuple[Node, ...], None]]
 
 
 class DijkstraAlgorithm:
+    PROGRESS_INTERVAL: int = 1024  # Number of checked nodes between two progress reports of solve
+    requires_target: bool = False
     current_node: Union[Node, None] = None
     current_neighbour: Union[Node, None] = None
-    __generator: Iterator[Tuple[Union[Node, None], Union[Node, None]]]
+    changed_nodes: Union[Tuple[Node, ...], None] = None
+    state: SearchState
+    __generator: Iterator[Step]
 
 
-    def __init__(self, nodes: List[Node], start_node: Node):
+    def __init__(self, nodes: List[Node], start_node: Node, queue_class: Type[PriorityQueue] = HeapPriorityQueue,
+                 target_node: Node = None, state: SearchState = None):
         """
         Implements the Dijkstra algorithm and servers as iterator.
+        Subclasses implement other algorithms by overriding _algorithm.
+        The distances, predecessors and checked flags are stored in the run's own state, not in the nodes.
 
         :param nodes: All current nodes
         :param start_node: The start node
+        :param queue_class: The priority queue selecting the next node,
+                            use LinearPriorityQueue for the reference implementation
+        :param target_node: If given, the algorithm stops as soon as this node is checked
+        :param state: A state of the same nodes to reuse, its previous result is discarded
         """
         self.nodes = nodes
         self.start_node = start_node
-        self.__generator = self.__dijkstra_algorithm()
+        self.queue_class = queue_class
+        self.target_node = target_node
+        self.state = state if state else SearchState(nodes)
+        self.__generator = self._algorithm()
 
 
     def reset(self):
         """
-        Resets all nodes' Dijkstra specific attributs
+        Discards the result and the current step.
         """
-        for node in self.nodes:
-            node.reset_dijkstra_attributes()
+        self.state.reset()
         self.current_node = None
         self.current_neighbour = None
+        self.changed_nodes = None
+
+
+    def get_view(self) -> SearchView:
+        """
+        :return: A read-only view of the distances, predecessors and checked flags
+        """
+        return self.state.view()
 
 
-    def __initialize_nodes(self) -> List[Node]:
+    def _get_sources(self) -> List[Tuple[Node, float]]:
         """
-        Initializes all nodes for the algorithm.
+        Called at the start of every run, subclasses override it to start from several nodes.
 
-        :return: A (shallow) copy of the current list
+        :return: The nodes the search starts from with their initial distances
         """
-        for node in self.nodes:
-            node.distance = float('inf')
-            node.predecessor = None
-            node.checked = False
-        self.start_node.distance = 0
-        return self.nodes.copy()
+        return [(self.start_node, 0)]
+
 
+    def __initialize_nodes(self) -> PriorityQueue:
+        """
+        Starts a new run of the state.
 
-    def __dijkstra_algorithm(self) -> Iterator[Tuple[Union[Node, None], Union[Node, None]]]:
+        :return: A priority queue containing all nodes
+        """
+        self.state.reset()
+        for node, distance in self._get_sources():
+            if distance < self.state.get_distance(node):
+                self.state.set_distance(node, distance)
+        return self.queue_class(self.state)
+
+
+    def _algorithm(self) -> Iterator[Step]:
         """
         The Dijkstra algorithm implemented as generator.
-        Yields every step the currently active node and the currently checked neighbour.
+        Yields every step the currently active node, the currently checked neighbour
+        and the nodes whose attributes changed in this step (None if all nodes may have changed).
 
         :return: A generator
         """
-        unchecked_nodes = self.__initialize_nodes()
+        queue = self.__initialize_nodes()
+        state = self.state
 
-        while len(unchecked_nodes):
-            current_node = min(unchecked_nodes, key=lambda n: n.distance)
-            yield current_node, None
+        changed_nodes = None
+        current_node = queue.pop()
+        while current_node is not None:
+            yield current_node, None, changed_nodes
 
             # If the smallest distance is inf, the graph is  not connected
-            if current_node.distance == float('inf'):
-                for node in unchecked_nodes:
-                    node.checked = True
-                unchecked_nodes.clear()
-                yield None, None
+            current_distance = state.get_distance(current_node)
+            if current_distance == float('inf'):
+                state.check_all()
+                yield None, None, None
+                break
+
+            for neighbour, weight in zip(current_node.neighbours, current_node.weights):
+                if not state.is_checked(neighbour):
+                    yield current_node, neighbour, ()
+                    new_distance = current_distance + weight
+                    if new_distance < state.get_distance(neighbour):
+                        state.set_distance(neighbour, new_distance, current_node)
+                        queue.decrease(neighbour)
+                        yield current_node, neighbour, (neighbour,)
+
+            state.check(current_node)
+
+            yield None, None, (current_node,)
+            if current_node is self.target_node:
+                break
+            changed_nodes = ()
+            current_node = queue.pop()
+
+
+    def solve(self, progress: Callable[[float], None] = None) -> SearchView:
+        """
+        Runs the whole algorithm at once without yielding the single steps.
+        Much faster than iterating if only the final distances and predecessors are needed.
+        Only the reached nodes are touched. Afterwards the iterator is exhausted.
+        Without a target node and with integer weights up to BucketPriorityQueue.MAX_WEIGHT,
+        Dial's buckets are used instead of the heap.
+
+        :param progress: Called with the fraction of checked nodes every PROGRESS_INTERVAL checked nodes,
+                         an exception raised by it aborts the algorithm
+        :return: A read-only view of the result
+        """
+        start_time = time.perf_counter()
+        state = self.state
+        stamp = state.reset()
+        index = state.index
+        distances, predecessors, stamps = state.distances, state.predecessors, state.stamps
+
+        # The index breaks ties in the same order as the step-by-step algorithm
+        entries = []
+        for start_node, start_distance in self._get_sources():
+            i = index[start_node]
+            if stamps[i] != stamp or start_distance < distances[i]:
+                distances[i] = start_distance
+                predecessors[i] = None
+                stamps[i] = stamp
+                entries.append((start_distance, i, start_node))
+
+        # Checking the weights costs as much as searching a few nodes, so it is only done for whole graphs
+        max_weight = BucketPriorityQueue.get_max_weight(self.nodes) if not self.target_node else None
+        if max_weight is None:
+            counts = self.__solve_heap(entries, stamp, progress)
+        else:
+            counts = self.__solve_buckets(entries, stamp, max_weight + 1, progress)
+
+        # Unreachable nodes are marked as checked as well
+        if not self.target_node or not state.is_checked(self.target_node):
+            state.check_all()
+
+        self._record_statistics(time.perf_counter() - start_time, *counts)
+        self.finish()
+        return state.view()
+
+
+    def __solve_heap(self, heap: List[Tuple[float, int, Node]], stamp: int,
+                     progress: Union[Callable[[float], None], None]) -> Tuple[int, int, int, int]:
+        """
+        The loop of solve using a binary heap, O((V+E) log V).
+
+        :param heap: The entries (distance, index, node) of the start nodes
+        :param stamp: The stamp of the run
+        :param progress: See solve
+        :return: The number of checked nodes, relaxed connections, pushes and pops
+        """
+        state = self.state
+        index = state.index
+        distances, predecessors, stamps, checked = state.distances, state.predecessors, state.stamps, state.checked_stamps
+
+        heapq.heapify(heap)
+        checked_count = relaxed_count = 0
+        push_count = len(heap)
+        while heap:
+            distance, i, current_node = heapq.heappop(heap)
+            if checked[i] == stamp:
+                continue
+            checked[i] = stamp
+            checked_count += 1
+            if current_node is self.target_node:
                 break
+            if progress and checked_count % self.PROGRESS_INTERVAL == 0:
+                progress(checked_count / len(index))
 
+            relaxed_count += len(current_node.neighbours)
             for neighbour, weight in zip(current_node.neighbours, current_node.weights):
-                if not neighbour.checked:
-                    yield current_node, neighbour
-                    new_distance = current_node.distance + weight
-                    if new_distance < neighbour.distance:
-                        neighbour.distance = new_distance
-                        neighbour.predecessor = current_node
-                        yield current_node, neighbour
+                j = index[neighbour]
+                if checked[j] != stamp:
+                    new_distance = distance + weight
+                    if stamps[j] != stamp or new_distance < distances[j]:
+                        distances[j] = new_distance
+                        predecessors[j] = current_node
+                        stamps[j] = stamp
+                        heapq.heappush(heap, (new_distance, j, neighbour))
+                        push_count += 1
+
+        return checked_count, relaxed_count, push_count, push_count - len(heap)
+
+
+    def __solve_buckets(self, entries: List[Tuple[float, int, Node]], stamp: int, bucket_count: int,
+                        progress: Union[Callable[[float], None], None]) -> Tuple[int, int, int, int]:
+        """
+        The loop of solve using Dial's buckets like the BucketPriorityQueue, O(E + V·C) for integer weights up to C.
+        The buckets are sorted before they are emptied, so ties are broken like by the heap.
+
+        :param entries: The entries (distance, index, node) of the start nodes
+        :param stamp: The stamp of the run
+        :param bucket_count: The largest weight + 1
+        :param progress: See solve
+        :return: The number of checked nodes, relaxed connections, pushes and pops
+        """
+        state = self.state
+        index = state.index
+        distances, predecessors, stamps, checked = state.distances, state.predecessors, state.stamps, state.checked_stamps
+
+        buckets = [[] for _ in range(bucket_count)]
+        for entry in entries:
+            buckets[math.floor(entry[0]) % bucket_count].append(entry)
+        size = push_count = len(entries)
+        position = math.floor(min(entries)[0]) if entries else 0
+        checked_count = relaxed_count = 0
+        while size:
+            bucket = buckets[position % bucket_count]
+            while not bucket:
+                position += 1
+                bucket = buckets[position % bucket_count]
+
+            # Only start distances can be more than C apart and belong to a later round over the buckets
+            end = position + 1
+            bucket.sort(reverse=True)
+            while bucket and bucket[-1][0] < end:
+                distance, i, current_node = bucket.pop()
+                size -= 1
+                if checked[i] == stamp:
+                    continue
+                checked[i] = stamp
+                checked_count += 1
+                if progress and checked_count % self.PROGRESS_INTERVAL == 0:
+                    progress(checked_count / len(index))
+
+                relaxed_count += len(current_node.neighbours)
+                resort = False
+                for neighbour, weight in zip(current_node.neighbours, current_node.weights):
+                    j = index[neighbour]
+                    if checked[j] != stamp:
+                        new_distance = distance + weight
+                        if stamps[j] != stamp or new_distance < distances[j]:
+                            distances[j] = new_distance
+                            predecessors[j] = current_node
+                            stamps[j] = stamp
+                            target_position = math.floor(new_distance)
+                            buckets[target_position % bucket_count].append((new_distance, j, neighbour))
+                            size += 1
+                            push_count += 1
+                            resort = resort or target_position == position
+                # Zero weights add nodes to the bucket which is emptied
+                if resort:
+                    bucket.sort(reverse=True)
+            position += 1
+
+        return checked_count, relaxed_count, push_count, push_count - size
+
+
+    @staticmethod
+    def _record_statistics(seconds: float, checked_count: int, relaxed_count: int, push_count: int, pop_count: int):
+        """
+        Reports the statistics of a solved run to the profiler.
+
+        :param seconds: The time of the run
+        :param checked_count: The number of settled nodes
+        :param relaxed_count: The number of relaxed connections
+        :param push_count: The number of heap pushes
+        :param pop_count: The number of heap pops
+        """
+        if not profiler.enabled:
+            return
+        profiler.add_time("solve", seconds)
+        profiler.count("nodes settled", checked_count)
+        profiler.count("edges relaxed", relaxed_count)
+        profiler.count("heap pushes", push_count)
+        profiler.count("heap pops", pop_count)
+
+
+    def finish(self):
+        """
+        Ends the iteration, e.g. after the result has been calculated at once or loaded.
+        """
+        self.current_node = None
+        self.current_neighbour = None
+        self.changed_nodes = None
+        self.__generator = iter(())
+
+
+    @staticmethod
+    def solve_compact(graph: CompactGraph, start_index: int) -> Tuple[array, array]:
+        """
+        Runs the whole algorithm directly on a compact graph without using any Node.
+
+        :param graph: The graph in CSR representation
+        :param start_index: The index of the start node
+        :return: A tuple of the distance array and the predecessor array (-1 if none), both indexed by node
+        """
+        node_count = len(graph)
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        distance = array('d', [float('inf')]) * node_count
+        predecessor = array('q', [-1]) * node_count
+        checked = bytearray(node_count)
+
+        distance[start_index] = 0
+        heap = [(0.0, start_index)]
+        while heap:
+            current_distance, current = heapq.heappop(heap)
+            if checked[current]:
+                continue
+            checked[current] = 1
 
-            current_node.checked = True
-            unchecked_nodes.remove(current_node)
+            for edge in range(offsets[current], offsets[current + 1]):
+                neighbour = targets[edge]
+                if not checked[neighbour]:
+                    new_distance = current_distance + weights[edge]
+                    if new_distance < distance[neighbour]:
+                        distance[neighbour] = new_distance
+                        predecessor[neighbour] = current
+                        heapq.heappush(heap, (new_distance, neighbour))
 
-            yield None, None
+        return distance, predecessor
 
 
     def next(self) -> Tuple[List[Node], Union[Node, None], Union[Node, None]]:
@@ -86,7 +347,7 @@ class DijkstraAlgorithm:
         Loads and returns the next algorithm's step.
         :return: A tuple of a list with all nodes, the currently active node and the currently checked neighbour
         """
-        self.current_node, self.current_neighbour = next(self.__generator)
+        self.current_node, self.current_neighbour, self.changed_nodes = next(self.__generator)
         return self.nodes, self.current_node, self.current_neighbour
 
 
@@ -0,0 +1,76 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Union
+
+from model.CompactGraph import CompactGraph
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.GraphSnapshot import GraphSnapshot
+from model.Node import Node
+
+# The graph and targets of a worker process, set by _initialize_worker
+_worker_graph: Union[CompactGraph, None] = None
+_worker_targets: List[int] = []
+
+
+def _initialize_worker(snapshot: Path, targets: List[int]):
+    global _worker_graph, _worker_targets
+    _worker_graph = GraphSnapshot.read(snapshot)
+    _worker_targets = targets
+
+
+def _calculate_row(source: int) -> List[float]:
+    distance, _ = DijkstraAlgorithm.solve_compact(_worker_graph, source)
+    return [distance[target] for target in _worker_targets]
+
+
+class DistanceMatrix:
+    @staticmethod
+    def calculate(graph: CompactGraph, sources: List[int], targets: List[int], processes: int = None,
+                  snapshot: Path = None) -> List[List[float]]:
+        """
+        Calculates the shortest distances from every source to every target.
+        Every source is solved by an independent single-source run, the runs are distributed over a process pool.
+        The workers map the same binary snapshot of the graph, so the graph is shared read-only instead of copied.
+
+        :param graph: The graph in CSR representation
+        :param sources: The indices of the source nodes
+        :param targets: The indices of the target nodes
+        :param processes: The number of worker processes, default is the number of CPUs, 1 runs in this process
+        :param snapshot: An existing snapshot file of the graph, if None a temporary one is written
+        :return: A matrix with one row per source and one column per target, unreachable targets are inf
+        """
+        if processes == 1 or len(sources) <= 1:
+            rows = []
+            for source in sources:
+                distance, _ = DijkstraAlgorithm.solve_compact(graph, source)
+                rows.append([distance[target] for target in targets])
+            return rows
+
+        processes = min(processes or os.cpu_count() or 1, len(sources))
+        # Several sources per task reduce the communication, some tasks per process balance the load
+        chunk_size = max(1, len(sources) // (4 * processes))
+        with tempfile.TemporaryDirectory() as directory:
+            if not snapshot:
+                snapshot = Path(directory) / "graph.graph"
+                GraphSnapshot.write(snapshot, graph)
+            with ProcessPoolExecutor(processes, initializer=_initialize_worker, initargs=(snapshot, targets)) as executor:
+                return list(executor.map(_calculate_row, sources, chunksize=chunk_size))
+
+
+    @staticmethod
+    def calculate_for_nodes(nodes: List[Node], sources: List[Node], targets: List[Node],
+                            processes: int = None) -> List[List[float]]:
+        """
+        Calculates the shortest distances from every source to every target node.
+
+        :param nodes: All nodes of the graph
+        :param sources: The source nodes
+        :param targets: The target nodes
+        :param processes: The number of worker processes, default is the number of CPUs, 1 runs in this process
+        :return: A matrix with one row per source and one column per target, unreachable targets are inf
+        """
+        index = {node: i for i, node in enumerate(nodes)}
+        return DistanceMatrix.calculate(CompactGraph.from_nodes(nodes), [index[n] for n in sources],
+                                        [index[n] for n in targets], processes)
@@ -0,0 +1,183 @@
+import json
+from pathlib import Path
+from typing import List, Dict, Tuple, TextIO, Callable
+
+from model.CompactGraph import CompactGraph
+from model.GraphSnapshot import GraphSnapshot
+from model.Node import Node
+from model.Profiler import profiler
+
+
+class GraphFile:
+    FORMAT: str = "dijkstra_visualizer"
+    VERSION: int = 2
+    LEGACY_SUFFIX: str = ".json"
+    SNAPSHOT_SUFFIX: str = ".graph"
+    CHUNK_SIZE: int = 1 << 20
+    PROGRESS_INTERVAL: int = 10000
+
+
+    @staticmethod
+    def read(file: Path, progress: Callable[[float], None] = None) -> List[Node]:
+        """
+        Reads a graph file, the format is detected by the file's first bytes or line.
+
+        Version 2 files are line-delimited JSON and parsed in a single streaming pass:
+        A header object, one object per node and one array [node index, node index, weight] per connection.
+        Legacy files are a single JSON object {"nodes": [...]}, neighbours are referenced by their coordinates.
+        Binary snapshots are described in GraphSnapshot.
+
+        :param file: The file to read
+        :param progress: Called with the read fraction of the file's bytes, it may raise an exception to cancel
+        :return: A list of all nodes
+        """
+        with profiler.measure("read file"):
+            nodes = GraphFile.__read(file, progress)
+        if profiler.enabled:
+            profiler.count("bytes read", file.stat().st_size)
+        return nodes
+
+
+    @staticmethod
+    def __read(file: Path, progress: Callable[[float], None] = None) -> List[Node]:
+        """
+        Reads a graph file in the detected format.
+        """
+        if GraphSnapshot.is_snapshot(file):
+            return GraphSnapshot.read(file).to_nodes()
+
+        # The files are written as ASCII, so the read characters are counted as bytes
+        size = max(file.stat().st_size, 1)
+        with file.open() as stream:
+            first_line = GraphFile.__read_chunks(stream, 0, size, progress, True)
+            try:
+                first_item = json.loads(first_line)
+            except json.JSONDecodeError:
+                # A legacy file spanning multiple lines
+                rest = GraphFile.__read_chunks(stream, len(first_line), size, progress, False)
+                return GraphFile.__read_legacy(json.loads(first_line + rest))
+
+            if not isinstance(first_item, dict) or first_item.get("format") != GraphFile.FORMAT:
+                return GraphFile.__read_legacy(first_item)
+            if first_item["version"] > GraphFile.VERSION:
+                raise ValueError(f"Unsupported file version {first_item['version']} ({file})")
+            return GraphFile.__read_lines(stream, len(first_line), size, progress)
+
+
+    @staticmethod
+    def __read_chunks(stream: TextIO, position: int, size: int, progress: Callable[[float], None], line: bool) -> str:
+        """
+        Reads a line or the rest of the file in chunks and reports the progress after each chunk.
+        Legacy files are written as a single line, so even their first line may be the whole file.
+
+        :param stream: The opened file
+        :param position: The number of bytes read before
+        :param size: The file's size in bytes
+        :param progress: See read
+        :param line: True to read until the end of the line, False to read until the end of the file
+        :return: The read text
+        """
+        chunks = []
+        while True:
+            chunk = stream.readline(GraphFile.CHUNK_SIZE) if line else stream.read(GraphFile.CHUNK_SIZE)
+            chunks.append(chunk)
+            position += len(chunk)
+            if progress:
+                progress(min(position / size, 1.0))
+            if not chunk or (line and chunk.endswith("\n")):
+                return "".join(chunks)
+
+
+    @staticmethod
+    def write(file: Path, nodes: List[Node]):
+        """
+        Writes the nodes to a file.
+        Files with the legacy suffix (.json) are written in the legacy format, files with the snapshot suffix (.graph)
+        as binary snapshot and all others in the current version.
+
+        :param file: The file to write
+        :param nodes: All nodes of the graph
+        """
+        with profiler.measure("write file"):
+            GraphFile.__write(file, nodes)
+        if profiler.enabled:
+            profiler.count("bytes written", file.stat().st_size)
+
+
+    @staticmethod
+    def __write(file: Path, nodes: List[Node]):
+        """
+        Writes the nodes in the format given by the file's suffix.
+        """
+        if file.suffix == GraphFile.LEGACY_SUFFIX:
+            file.write_text(json.dumps({"nodes": [n.to_dict() for n in nodes]}))
+            return
+        if file.suffix == GraphFile.SNAPSHOT_SUFFIX:
+            GraphSnapshot.write(file, CompactGraph.from_nodes(nodes))
+            return
+
+        index = {node: i for i, node in enumerate(nodes)}
+        with file.open("w") as stream:
+            stream.write(json.dumps({"format": GraphFile.FORMAT, "version": GraphFile.VERSION, "nodes": len(nodes)}) + "\n")
+            for node in nodes:
+                stream.write(json.dumps({"name": node.name, "x": node.x, "y": node.y}) + "\n")
+
+            # Every undirected connection is stored once
+            for i, node in enumerate(nodes):
+                for neighbour, weight in zip(node.neighbours, node.weights):
+                    if i < index[neighbour]:
+                        stream.write(json.dumps([i, index[neighbour], weight]) + "\n")
+
+
+    @staticmethod
+    def __read_lines(stream: TextIO, position: int, size: int, progress: Callable[[float], None]) -> List[Node]:
+        """
+        Reads the nodes and connections of the current version line by line.
+
+        :param stream: The opened file after the header
+        :param position: The number of bytes of the header
+        :param size: The file's size in bytes
+        :param progress: See read
+        :return: A list of all nodes
+        """
+        nodes = []
+        for line_count, line in enumerate(stream, 1):
+            position += len(line)
+            if progress and line_count % GraphFile.PROGRESS_INTERVAL == 0:
+                progress(min(position / size, 1.0))
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if isinstance(item, list):
+                source, target, weight = item
+                nodes[source].add_neighbour(nodes[target], weight)
+            else:
+                nodes.append(Node(item["name"], item["x"], item["y"]))
+        return nodes
+
+
+    @staticmethod
+    def __read_legacy(nodes_dict: Dict) -> List[Node]:
+        """
+        Creates the nodes of a legacy file.
+        Neighbours are resolved by a hash map of their coordinates and name,
+        if no node matches the name the first node on the coordinates is used.
+
+        :param nodes_dict: The parsed file
+        :return: A list of all nodes
+        """
+        nodes = [Node(node_dict["name"], node_dict["x"], node_dict["y"]) for node_dict in nodes_dict["nodes"]]
+
+        nodes_by_key: Dict[Tuple, Node] = {}
+        for node in nodes:
+            nodes_by_key.setdefault((node.x, node.y, node.name), node)
+            nodes_by_key.setdefault((node.x, node.y), node)
+
+        for node, node_dict in zip(nodes, nodes_dict["nodes"]):
+            for neighbour_dict, weight in zip(node_dict["neighbours"], node_dict["weights"]):
+                x, y = neighbour_dict["x"], neighbour_dict["y"]
+                neighbour = nodes_by_key.get((x, y, neighbour_dict.get("name")), nodes_by_key.get((x, y)))
+                if neighbour is None:
+                    raise ValueError(f"No node at position ({x}, {y})")
+                node.add_neighbour(neighbour, weight)
+        return nodes
@@ -0,0 +1,92 @@
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from model.CompactGraph import CompactGraph
+
+
+class GraphSnapshot:
+    MAGIC: bytes = b"DJKG"
+    VERSION: int = 1
+    HEADER = struct.Struct("<4sIQQQ")  # Magic, version, node count, edge entry count, size of the names in bytes
+
+
+    @staticmethod
+    def is_snapshot(file: Path) -> bool:
+        """
+        :param file: The file to check
+        :return: True if the file starts with the snapshot's magic bytes
+        """
+        with file.open("rb") as stream:
+            return stream.read(len(GraphSnapshot.MAGIC)) == GraphSnapshot.MAGIC
+
+
+    @staticmethod
+    def write(file: Path, graph: CompactGraph):
+        """
+        Writes a compact graph as binary snapshot.
+        The header is followed by the packed arrays x, y, offsets, targets, weights, name offsets
+        and the UTF-8 encoded names. All arrays consist of 8 byte values in native (little-endian) order.
+
+        :param file: The file to write
+        :param graph: The graph to write
+        """
+        GraphSnapshot.__check_byteorder()
+        encoded_names = [name.encode() for name in graph.names]
+        name_offsets = array('q', [0])
+        for name in encoded_names:
+            name_offsets.append(name_offsets[-1] + len(name))
+
+        with file.open("wb") as stream:
+            stream.write(GraphSnapshot.HEADER.pack(
+                GraphSnapshot.MAGIC, GraphSnapshot.VERSION, len(graph), len(graph.targets), name_offsets[-1]))
+            for values in (graph.xs, graph.ys, graph.offsets, graph.targets, graph.weights, name_offsets):
+                stream.write(values)
+            stream.write(b"".join(encoded_names))
+
+
+    @staticmethod
+    def read(file: Path) -> CompactGraph:
+        """
+        Maps a binary snapshot into memory.
+        The arrays of the returned graph are read-only views of the mapped file, only the names are copied.
+
+        :param file: The file to read
+        :return: The graph
+        """
+        GraphSnapshot.__check_byteorder()
+        with file.open("rb") as stream:
+            buffer = memoryview(mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ))
+
+        if len(buffer) < GraphSnapshot.HEADER.size:
+            raise ValueError(f"Truncated graph snapshot ({file})")
+        magic, version, node_count, entry_count, names_size = GraphSnapshot.HEADER.unpack_from(buffer)
+        if magic != GraphSnapshot.MAGIC:
+            raise ValueError(f"Not a graph snapshot ({file})")
+        if version > GraphSnapshot.VERSION:
+            raise ValueError(f"Unsupported snapshot version {version} ({file})")
+
+        position = GraphSnapshot.HEADER.size
+        arrays = []
+        for typecode, length in (('d', node_count), ('d', node_count), ('q', node_count + 1), ('q', entry_count),
+                                 ('d', entry_count), ('q', node_count + 1)):
+            end = position + 8 * length
+            if end > len(buffer):
+                raise ValueError(f"Truncated graph snapshot ({file})")
+            arrays.append(buffer[position:end].cast(typecode))
+            position = end
+        xs, ys, offsets, targets, weights, name_offsets = arrays
+
+        if position + names_size > len(buffer):
+            raise ValueError(f"Truncated graph snapshot ({file})")
+        names_bytes = bytes(buffer[position:position + names_size])
+        names = [names_bytes[start:end].decode() for start, end in zip(name_offsets, name_offsets[1:])]
+        return CompactGraph(names, xs, ys, offsets, targets, weights)
+
+
+    @staticmethod
+    def __check_byteorder():
+        if sys.byteorder != "little":
+            raise ValueError("Graph snapshots are only supported on little-endian machines")
@@ -0,0 +1,25 @@
+from typing import List
+
+from model.AStarAlgorithm import AStarAlgorithm
+from model.CompactGraph import CompactGraph
+from model.Landmarks import Landmarks, LandmarkHeuristic
+from model.Node import Node
+from model.SearchState import SearchState
+
+
+class LandmarkAlgorithm(AStarAlgorithm):
+    def __init__(self, nodes: List[Node], start_node: Node, target_node: Node, landmarks: Landmarks = None,
+                 state: SearchState = None):
+        """
+        Implements the A* algorithm with the landmarks' lower bounds as heuristic (ALT),
+        so the search is goal-directed even if the weights do not correspond to the nodes' positions.
+
+        :param nodes: All current nodes
+        :param start_node: The start node
+        :param target_node: The target node
+        :param landmarks: The landmarks of the nodes, selected if None
+        :param state: A state of the same nodes to reuse, its previous result is discarded
+        """
+        state = state if state else SearchState(nodes)
+        self.landmarks = landmarks if landmarks else Landmarks.select(CompactGraph.from_nodes(nodes))
+        super().__init__(nodes, start_node, target_node, LandmarkHeuristic(self.landmarks, state.index), state)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from array import array
+from typing import List, Dict, Tuple, Callable, Union
+
+from model.CompactGraph import CompactGraph
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.Node import Node
+
+
+class Landmarks:
+    DEFAULT_COUNT: int = 8
+    landmarks: List[int]
+    distances: array
+
+
+    def __init__(self, landmarks: List[int], distances: array):
+        """
+        The distances from a few landmark nodes to all nodes, used as lower bounds by goal-directed searches (ALT).
+        By the triangle inequality the distance between two nodes is at least the difference of their
+        distances to any landmark, this holds for any weights and does not depend on the nodes' positions.
+
+        The distances are stored node by node, the distances of node i are distances[i * k:(i + 1) * k]
+        for k landmarks, inf if the landmark cannot be reached.
+
+        :param landmarks: The indices of the landmark nodes
+        :param distances: The distances from each landmark to each node, typecode 'd'
+        """
+        self.landmarks = landmarks
+        self.distances = distances
+
+
+    @classmethod
+    def select(cls, graph: CompactGraph, count: int = DEFAULT_COUNT,
+               progress: Callable[[float], None] = None) -> Landmarks:
+        """
+        Selects the landmarks by the farthest-point strategy and calculates their distances.
+        The first landmark is the node farthest from a node of the largest connected component,
+        every further landmark is the node farthest from all previous landmarks.
+        A component without landmark is preferred if it has at least the number of nodes per landmark,
+        smaller components do not get a landmark, their queries are not goal-directed.
+
+        :param graph: The graph
+        :param count: The maximum number of landmarks
+        :param progress: Called with the fraction of calculated landmarks, an exception raised by it aborts
+        :return: The landmarks
+        """
+        node_count = len(graph)
+        if node_count == 0:
+            return cls([], array('d'))
+
+        count = min(count, node_count)
+        component_sizes = cls.__get_component_sizes(graph)
+        closest = [float('inf')] * node_count  # The distance of each node to the closest landmark
+
+        def get_priority(i: int) -> Tuple[int, float]:
+            if closest[i] != float('inf'):
+                return 0, closest[i]
+            return (1, component_sizes[i]) if component_sizes[i] * count >= node_count else (-1, 0)
+
+        first_distances, _ = DijkstraAlgorithm.solve_compact(graph, component_sizes.index(max(component_sizes)))
+        candidate = max((i for i in range(node_count) if first_distances[i] != float('inf')),
+                        key=first_distances.__getitem__)
+        landmarks = []
+        tables = []
+        while len(landmarks) < count:
+            distances, _ = DijkstraAlgorithm.solve_compact(graph, candidate)
+            landmarks.append(candidate)
+            tables.append(distances)
+            closest = [min(a, b) for a, b in zip(closest, distances)]
+            if progress:
+                progress(len(landmarks) / count)
+
+            candidate = max(range(node_count), key=get_priority)
+            if get_priority(candidate) <= (0, 0):
+                break
+
+        distances = array('d', (table[i] for i in range(node_count) for table in tables))
+        return cls(landmarks, distances)
+
+
+    @staticmethod
+    def __get_component_sizes(graph: CompactGraph) -> List[int]:
+        """
+        :param graph: The graph
+        :return: The number of nodes of each node's connected component
+        """
+        sizes = [0] * len(graph)
+        for start in range(len(graph)):
+            if sizes[start]:
+                continue
+            component = [start]
+            sizes[start] = -1
+            for node in component:
+                for neighbour, _ in graph.neighbours(node):
+                    if not sizes[neighbour]:
+                        sizes[neighbour] = -1
+                        component.append(neighbour)
+            for node in component:
+                sizes[node] = len(component)
+        return sizes
+
+
+    def __len__(self) -> int:
+        return len(self.landmarks)
+
+
+    def get_distances(self, index: int) -> array:
+        """
+        :param index: The index of a node
+        :return: The distances from each landmark to the node
+        """
+        k = len(self.landmarks)
+        return self.distances[index * k:(index + 1) * k]
+
+
+    def lower_bound(self, index: int, target_distances: array) -> float:
+        """
+        :param index: The index of a node
+        :param target_distances: The distances from each landmark to the target, see get_distances
+        :return: A lower bound of the distance between the node and the target, inf if they are not connected
+        """
+        bound = 0.0
+        for target_distance, distance in zip(target_distances, self.get_distances(index)):
+            # If a landmark reaches only one of the nodes, they are not connected and the difference is inf
+            if target_distance != distance:
+                difference = abs(target_distance - distance)
+                if difference > bound:
+                    bound = difference
+        return bound
+
+
+class LandmarkHeuristic:
+    __target_node: Union[Node, None] = None
+    __target_distances: array
+
+
+    def __init__(self, landmarks: Landmarks, index: Dict[Node, int]):
+        """
+        Estimates the remaining distance by the lower bound of the landmarks.
+        Admissible and consistent for any non-negative weights.
+
+        :param landmarks: The landmarks of the graph
+        :param index: Maps each node to its index in the landmarks' graph
+        """
+        self.landmarks = landmarks
+        self.index = index
+
+
+    def __call__(self, node: Node, target_node: Node) -> float:
+        if target_node is not self.__target_node:
+            self.__target_distances = self.landmarks.get_distances(self.index[target_node])
+            self.__target_node = target_node
+        return self.landmarks.lower_bound(self.index[node], self.__target_distances)
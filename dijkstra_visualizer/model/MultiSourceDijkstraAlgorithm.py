@@ -0,0 +1,69 @@
+from typing import List, Tuple, Dict, Union, Type
+
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.Node import Node
+from model.PriorityQueue import PriorityQueue, HeapPriorityQueue
+from model.SearchState import SearchState
+
+
+class MultiSourceDijkstraAlgorithm(DijkstraAlgorithm):
+    start_nodes: List[Node]
+    offsets: List[float]
+    owners: Dict[Node, Node]
+
+
+    def __init__(self, nodes: List[Node], start_nodes: List[Node], offsets: List[float] = None,
+                 queue_class: Type[PriorityQueue] = HeapPriorityQueue, target_node: Node = None,
+                 state: SearchState = None):
+        """
+        Runs one Dijkstra algorithm from several start nodes at once, as if a super source was connected
+        to every start node by a connection of its offset.
+        Every node gets the distance to its nearest start node including the offset, the start node owning
+        a node is the first node of its shortest path. The owners partition the graph like a Voronoi diagram.
+
+        :param nodes: All current nodes
+        :param start_nodes: The start nodes, at least one
+        :param offsets: The initial distance of each start node, default is 0 for all
+        :param queue_class: The priority queue selecting the next node
+        :param target_node: If given, the algorithm stops as soon as this node is checked
+        :param state: A state of the same nodes to reuse, its previous result is discarded
+        """
+        self.start_nodes = list(start_nodes)
+        self.offsets = list(offsets) if offsets is not None else [0.0] * len(self.start_nodes)
+        if len(self.offsets) != len(self.start_nodes):
+            raise ValueError("Every start node needs one offset")
+        self.owners = {}
+        super().__init__(nodes, self.start_nodes[0], queue_class, target_node, state)
+
+
+    def _get_sources(self) -> List[Tuple[Node, float]]:
+        """
+        Called at the start of every run, the owners of the previous run are discarded.
+
+        :return: All start nodes with their offsets
+        """
+        self.owners = {}
+        return list(zip(self.start_nodes, self.offsets))
+
+
+    def get_owner(self, node: Node) -> Union[Node, None]:
+        """
+        Follows the predecessors to the start node of the node's shortest path.
+        The predecessors of a checked node are final, so the owners of checked nodes are cached.
+
+        :param node: The node
+        :return: The start node owning the node, None if it has not been reached
+        """
+        state = self.state
+        if state.get_distance(node) == float('inf'):
+            return None
+        path = []
+        while node not in self.owners and state.get_predecessor(node):
+            path.append(node)
+            node = state.get_predecessor(node)
+        owner = self.owners.get(node, node)
+        path.append(node)
+        for path_node in path:
+            if state.is_checked(path_node):
+                self.owners[path_node] = owner
+        return owner
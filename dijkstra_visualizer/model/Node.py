@@ -1,19 +1,16 @@
 from __future__ import annotations
 
 import math
-from typing import List, Union, Dict
+from typing import Union, Dict, KeysView, ValuesView
 
 
 class Node:
+    __slots__ = ('name', 'x', 'y', '__edges')
     radius: int = 25
     name: str
     x: int
     y: int
-    neighbours: List[Node]
-    weights: List[float]
-    distance: Union[float, None] = None
-    predecessor: Union[Node, None] = None
-    checked: bool = False
+    __edges: Dict[Node, float]
 
 
     def __init__(self, name: str, x: int, y: int):
@@ -25,12 +22,37 @@ class Node:
         :param y: The number of pixel in y-axis (top to bottom)
         """
         self.name = name
-        self.neighbours = []
-        self.weights = []
+        self.__edges = {}  # Maps each neighbour to the weight, keeps the insertion order
         self.x = x
         self.y = y
 
 
+    @property
+    def neighbours(self) -> KeysView[Node]:
+        """
+        :return: A read-only view of all neighbours
+        """
+        return self.__edges.keys()
+
+
+    @property
+    def weights(self) -> ValuesView[float]:
+        """
+        :return: A read-only view of all weights in the same order as the neighbours
+        """
+        return self.__edges.values()
+
+
+    def get_weight(self, node: Node) -> Union[float, None]:
+        """
+        Returns the weight of the connection to the given node.
+
+        :param node: The neighbour node
+        :return: The weight or None if the nodes are not connected
+        """
+        return self.__edges.get(node)
+
+
     def is_position_in_node(self, x: int, y: int) -> bool:
         """
         Checks if the given position is inside this node.
@@ -58,6 +80,16 @@ class Node:
         node.__add_neighbour(self, weight)
 
 
+    def set_neighbours(self, edges: Dict[Node, float]):
+        """
+        Replaces all connections of this node, the neighbours are not changed.
+        Only for creating graphs whose connections are given in both directions, e.g. CompactGraph.to_nodes.
+
+        :param edges: Maps each neighbour to the weight of the connection, all weights must be positive
+        """
+        self.__edges = edges
+
+
     def delete_neighbour(self, node: Node):
         """
         Deletes a connection between this and the given node and vice versa.
@@ -68,15 +100,6 @@ class Node:
         node.__delete_neighbour(self)
 
 
-    def reset_dijkstra_attributes(self):
-        """
-        Resets all attributes related to the Dijkstra algorithm.
-        """
-        self.distance = None
-        self.predecessor = None
-        self.checked = False
-
-
     def __add_neighbour(self, node: Node, weight: int):
         """
         Adds the given node as neighbour.
@@ -88,12 +111,7 @@ class Node:
             self.__delete_neighbour(node)
             return
 
-        if node in self.neighbours:
-            index = self.neighbours.index(node)
-            self.weights[index] = weight
-        else:
-            self.neighbours.append(node)
-            self.weights.append(weight)
+        self.__edges[node] = weight
 
 
     def __delete_neighbour(self, node: Node):
@@ -102,16 +120,12 @@ class Node:
 
         :param node: The neighbour node
         """
-        if node in self.neighbours:
-            index = self.neighbours.index(node)
-            self.neighbours.pop(index)
-            self.weights.pop(index)
+        self.__edges.pop(node, None)
 
 
     def to_dict(self) -> Dict:
         """
         Returns the important attributes as dictionary.
-        Ignores the Dijkstra related attributs.
 
         :return: A dictionary of all important attributes
         """
@@ -120,5 +134,5 @@ class Node:
             "x": self.x,
             "y": self.y,
             "neighbours": [{"x": n.x, "y": n.y, "name": n.name} for n in self.neighbours],
-            "weights": self.weights
+            "weights": list(self.weights)
         }
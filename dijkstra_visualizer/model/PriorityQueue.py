@@ -0,0 +1,202 @@
+import heapq
+import itertools
+import math
+from typing import List, Tuple, Union, Dict
+
+from model.Node import Node
+from model.SearchState import SearchState
+
+
+class PriorityQueue:
+    def __init__(self, state: SearchState):
+        """
+        Base class of the queues used by the Dijkstra algorithm to select the next node.
+        Nodes with the same distance are returned in the order of the state's node list.
+
+        :param state: The state of the run, the distances have to be initialized
+        """
+        self.state = state
+        self.nodes = state.nodes
+
+
+    def decrease(self, node: Node):
+        """
+        Notifies the queue that the distance of the given node has been decreased.
+
+        :param node: The updated node
+        """
+        raise NotImplementedError
+
+
+    def pop(self) -> Union[Node, None]:
+        """
+        Removes and returns the unchecked node with the smallest distance.
+        If all remaining nodes are unreachable the first of them is returned.
+
+        :return: The next node or None if the queue is empty
+        """
+        raise NotImplementedError
+
+
+class LinearPriorityQueue(PriorityQueue):
+    unchecked_nodes: List[Node]
+
+
+    def __init__(self, state: SearchState):
+        """
+        Reference implementation scanning all unchecked nodes on every pop, O(V²) per run.
+
+        :param state: The state of the run, the distances have to be initialized
+        """
+        super().__init__(state)
+        self.unchecked_nodes = self.nodes.copy()
+
+
+    def decrease(self, node: Node):
+        pass
+
+
+    def pop(self) -> Union[Node, None]:
+        if not self.unchecked_nodes:
+            return None
+        node = min(self.unchecked_nodes, key=self.state.get_distance)
+        self.unchecked_nodes.remove(node)
+        return node
+
+
+class HeapPriorityQueue(PriorityQueue):
+    heap: List[Tuple[float, int, Node]]
+    index: Dict[Node, int]
+    cursor: int
+
+
+    def __init__(self, state: SearchState):
+        """
+        Binary heap with lazy deletion, O((V+E) log V) per run.
+        Only reachable nodes are pushed, unreachable ones are found by a cursor over the node list.
+
+        :param state: The state of the run, the distances have to be initialized
+        """
+        super().__init__(state)
+        self.index = state.index
+        self.heap = []
+        for i, node in enumerate(self.nodes):
+            distance = state.get_distance(node)
+            if distance != float('inf'):
+                self.heap.append((distance, i, node))
+        heapq.heapify(self.heap)
+        self.cursor = 0
+
+
+    def decrease(self, node: Node):
+        heapq.heappush(self.heap, (self.state.get_distance(node), self.index[node], node))
+
+
+    def pop(self) -> Union[Node, None]:
+        while self.heap:
+            distance, _, node = heapq.heappop(self.heap)
+            # Skip outdated entries
+            if not self.state.is_checked(node) and distance == self.state.get_distance(node):
+                return node
+
+        # Only unreachable nodes are left
+        while self.cursor < len(self.nodes):
+            node = self.nodes[self.cursor]
+            self.cursor += 1
+            if not self.state.is_checked(node):
+                return node
+        return None
+
+
+class BucketPriorityQueue(PriorityQueue):
+    MAX_WEIGHT: int = 64  # Largest weight for which solve uses buckets, above the empty buckets cost too much
+    buckets: List[List[Tuple[float, int, Node]]]
+    index: Dict[Node, int]
+    size: int
+    position: int
+    cursor: int
+    sorted: bool
+
+
+    def __init__(self, state: SearchState):
+        """
+        Dial's algorithm for graphs with small non-negative integer weights up to C, O(E + V·C) per run.
+        The queued nodes are at most C apart, so C + 1 buckets are used circularly,
+        a node is stored in the bucket of its rounded down distance modulo C + 1.
+        The bucket of the smallest distance is found by moving forward over the buckets.
+        A bucket is sorted before it is emptied, so nodes with the same distance keep the order of the node list
+        and start distances do not have to be integers.
+        Only reachable nodes are pushed, unreachable ones are found by a cursor over the node list.
+
+        :param state: The state of the run, the distances have to be initialized
+        """
+        super().__init__(state)
+        self.index = state.index
+        max_weight = max(itertools.chain.from_iterable(node.weights for node in self.nodes), default=0)
+        self.buckets = [[] for _ in range(math.ceil(max_weight) + 1)]
+        self.cursor = 0
+        self.sorted = False
+
+        # The start nodes may be further apart than C, the smallest one is returned first
+        entries = [(state.get_distance(node), i, node) for i, node in enumerate(self.nodes)]
+        entries = [entry for entry in entries if entry[0] != float('inf')]
+        self.position = math.floor(min(entries)[0]) if entries else 0
+        for entry in entries:
+            self.buckets[math.floor(entry[0]) % len(self.buckets)].append(entry)
+        self.size = len(entries)
+
+
+    @classmethod
+    def get_max_weight(cls, nodes: List[Node]) -> Union[int, None]:
+        """
+        :param nodes: All nodes of the graph
+        :return: The largest weight if all weights are integers between 0 and MAX_WEIGHT, else None
+        """
+        weights = set(itertools.chain.from_iterable(node.weights for node in nodes))
+        if all(0 <= weight <= cls.MAX_WEIGHT and float(weight).is_integer() for weight in weights):
+            return int(max(weights, default=0))
+        return None
+
+
+    def decrease(self, node: Node):
+        distance = self.state.get_distance(node)
+        position = math.floor(distance)
+        if position == self.position:
+            self.sorted = False
+        self.buckets[position % len(self.buckets)].append((distance, self.index[node], node))
+        self.size += 1
+
+
+    def pop(self) -> Union[Node, None]:
+        buckets, bucket_count, state = self.buckets, len(self.buckets), self.state
+        position = self.position
+        while self.size:
+            bucket = buckets[position % bucket_count]
+            while not bucket:
+                position += 1
+                bucket = buckets[position % bucket_count]
+                self.sorted = False
+            if not self.sorted:
+                # Sorted descending, so the smallest entry is removed from the end
+                bucket.sort(reverse=True)
+                self.sorted = True
+            # Only start distances can be more than C apart and belong to a later round over the buckets
+            end = position + 1
+            while bucket and bucket[-1][0] < end:
+                distance, _, node = bucket.pop()
+                self.size -= 1
+                # Skip outdated entries
+                if not state.is_checked(node) and distance == state.get_distance(node):
+                    self.position = position
+                    return node
+            position += 1
+            self.sorted = False
+        self.position = position
+
+        # Only unreachable nodes are left
+        while self.cursor < len(self.nodes):
+            node = self.nodes[self.cursor]
+            self.cursor += 1
+            if not self.state.is_checked(node):
+                return node
+        return None
@@ -0,0 +1,145 @@
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Callable, Deque, Tuple
+
+# The kind ("counter" or "timer"), the name and the value (count or seconds) of a recorded event
+Hook = Callable[[str, str, float], None]
+
+
+class Profiler:
+    MAX_EVENTS: int = 100000
+    enabled: bool = False
+    counters: Dict[str, int]
+    timings: Dict[str, List[float]]
+    events: Deque[Tuple[float, str, str, float]]
+    hooks: List[Hook]
+
+
+    def __init__(self):
+        """
+        Opt-in instrumentation recording counters and timings, e.g. the settled nodes or the redraw time.
+        While disabled nothing is recorded, so the instrumented code only pays for checking the enabled flag.
+        Events can be reported from background threads, the hooks are called in the reporting thread.
+        """
+        self.counters = {}
+        self.timings = {}  # Maps each name to the number of measurements, the total and the maximum seconds
+        self.events = deque(maxlen=self.MAX_EVENTS)
+        self.hooks = []
+        self.__lock = threading.Lock()
+
+
+    def add_hook(self, hook: Hook):
+        """
+        Adds a function called for every recorded counter and timing.
+
+        :param hook: The function receiving the kind ("counter" or "timer"), the name and the value
+        """
+        self.hooks.append(hook)
+
+
+    def remove_hook(self, hook: Hook):
+        """
+        Removes a function added by add_hook.
+
+        :param hook: The function to remove
+        """
+        self.hooks.remove(hook)
+
+
+    def count(self, name: str, value: int = 1):
+        """
+        Increases a counter if enabled.
+
+        :param name: The counter's name
+        :param value: The value to add
+        """
+        if not self.enabled:
+            return
+        with self.__lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+            self.events.append((time.time(), "counter", name, value))
+        for hook in self.hooks:
+            hook("counter", name, value)
+
+
+    def add_time(self, name: str, seconds: float):
+        """
+        Records a measured time if enabled.
+
+        :param name: The timer's name
+        :param seconds: The measured time in seconds
+        """
+        if not self.enabled:
+            return
+        with self.__lock:
+            timing = self.timings.setdefault(name, [0, 0.0, 0.0])
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = max(timing[2], seconds)
+            self.events.append((time.time(), "timer", name, seconds))
+        for hook in self.hooks:
+            hook("timer", name, seconds)
+
+
+    @contextmanager
+    def measure(self, name: str):
+        """
+        Measures the time of a with block if enabled.
+
+        :param name: The timer's name
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+
+    def reset(self):
+        """
+        Removes all recorded counters, timings and events.
+        """
+        with self.__lock:
+            self.counters.clear()
+            self.timings.clear()
+            self.events.clear()
+
+
+    def get_summary(self) -> str:
+        """
+        :return: A text with one line per counter and timer
+        """
+        with self.__lock:
+            lines = [f"{name}: {value:,}" for name, value in sorted(self.counters.items())]
+            lines += [f"{name}: {count}x, {total * 1000:.1f} ms total, {maximum * 1000:.1f} ms max"
+                      for name, (count, total, maximum) in sorted(self.timings.items())]
+        return "\n".join(lines)
+
+
+    def export(self, file: Path):
+        """
+        Writes all counters, timings and the latest MAX_EVENTS events as JSON.
+
+        :param file: The file to write
+        """
+        with self.__lock:
+            data = {
+                "counters": dict(self.counters),
+                "timings": {name: {"count": count, "total_seconds": total, "max_seconds": maximum}
+                            for name, (count, total, maximum) in self.timings.items()},
+                "events": [{"time": t, "kind": kind, "name": name, "value": value}
+                           for t, kind, name, value in self.events],
+            }
+        with open(file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+
+# The profiler used by the whole application
+profiler = Profiler()
@@ -0,0 +1,162 @@
+from typing import List, Dict, Tuple, Union, Iterable, Iterator, Type
+
+from model.AStarAlgorithm import AStarAlgorithm, EuclideanHeuristic
+from model.BidirectionalDijkstraAlgorithm import BidirectionalDijkstraAlgorithm
+from model.CompactGraph import CompactGraph
+from model.ContractionHierarchy import ContractionHierarchy
+from model.ContractionHierarchyAlgorithm import ContractionHierarchyAlgorithm
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.LandmarkAlgorithm import LandmarkAlgorithm
+from model.Landmarks import Landmarks
+from model.Node import Node
+from model.SearchState import SearchState, SearchView
+from model.VectorizedDijkstra import VectorizedDijkstra
+
+# The source's name, the target's name, the distance (inf if unreachable) and the path's names (None if not requested)
+QueryResult = Tuple[str, str, float, Union[List[str], None]]
+
+
+class QueryRunner:
+    ALGORITHMS: Dict[str, Type[DijkstraAlgorithm]] = {
+        "dijkstra": DijkstraAlgorithm,
+        "astar": AStarAlgorithm,
+        "alt": LandmarkAlgorithm,
+        "bidirectional": BidirectionalDijkstraAlgorithm,
+        "ch": ContractionHierarchyAlgorithm,
+    }
+    nodes_by_name: Dict[str, Node]
+    __source: Union[Node, None] = None
+    __view: Union[SearchView, None] = None
+
+
+    def __init__(self, nodes: List[Node], algorithm_class: Type[DijkstraAlgorithm] = DijkstraAlgorithm,
+                 paths: bool = False, hierarchy: ContractionHierarchy = None, vectorized: bool = False):
+        """
+        Answers shortest path queries between nodes given by their names, e.g. for the command line.
+        All queries share one search state. As long as consecutive Dijkstra queries have the same source,
+        the distances already checked by the previous query are reused instead of searching again.
+
+        :param nodes: All nodes of the graph
+        :param algorithm_class: The algorithm answering point-to-point queries,
+                                single-source queries always use the Dijkstra algorithm
+        :param paths: If True the results contain the names of the nodes on the shortest paths
+        :param hierarchy: The contraction hierarchy of the nodes used by the ContractionHierarchyAlgorithm,
+                          built if None
+        :param vectorized: If True single-source queries use the VectorizedDijkstra,
+                           it only runs vectorized if NumPy is installed
+        """
+        self.nodes = nodes
+        self.algorithm_class = algorithm_class
+        self.paths = paths
+        self.nodes_by_name = {node.name: node for node in nodes}
+        self.state = SearchState(nodes)
+        self.hierarchy = hierarchy
+        if algorithm_class is ContractionHierarchyAlgorithm and not hierarchy:
+            self.hierarchy = ContractionHierarchy.build(CompactGraph.from_nodes(nodes))
+        # The heuristic's factor and the landmarks are calculated once and reused by all queries
+        self.heuristic = EuclideanHeuristic.from_nodes(nodes) if algorithm_class is AStarAlgorithm else None
+        self.landmarks = None
+        if algorithm_class is LandmarkAlgorithm:
+            self.landmarks = Landmarks.select(CompactGraph.from_nodes(nodes))
+        # The graph's arrays are converted once and reused by all single-source queries
+        self.vectorized = VectorizedDijkstra(CompactGraph.from_nodes(nodes)) if vectorized else None
+
+
+    def get_node(self, name: str) -> Node:
+        """
+        :param name: The node's name
+        :return: The node with the given name
+        :raises ValueError: If there is no node with this name
+        """
+        node = self.nodes_by_name.get(name)
+        if node is None:
+            raise ValueError(f"Unknown node '{name}'")
+        return node
+
+
+    def single_source(self, source_name: str) -> Iterator[QueryResult]:
+        """
+        Calculates the distances from the source to all nodes.
+
+        :param source_name: The source's name
+        :return: The results of all reachable nodes in the order of the nodes
+        """
+        source = self.get_node(source_name)
+        if self.vectorized:
+            view = self.vectorized.solve_nodes(self.nodes, [source], self.state)
+            self.__source, self.__view = source, view
+        else:
+            view = self.__solve(source, None, DijkstraAlgorithm)
+        for node in self.nodes:
+            distance = view.get_distance(node)
+            if distance != float('inf'):
+                yield source.name, node.name, distance, self.__get_path(view, node)
+
+
+    def point_to_point(self, source_name: str, target_name: str) -> QueryResult:
+        """
+        Calculates the shortest path from the source to the target.
+
+        :param source_name: The source's name
+        :param target_name: The target's name
+        :return: The result, the distance is inf if the target is unreachable
+        """
+        source, target = self.get_node(source_name), self.get_node(target_name)
+        if self.__source is source and self.__view.is_checked(target):
+            view = self.__view
+        else:
+            view = self.__solve(source, target, self.algorithm_class)
+        return source.name, target.name, view.get_distance(target), self.__get_path(view, target)
+
+
+    def batch(self, queries: Iterable[Tuple[str, Union[str, None]]]) -> Iterator[QueryResult]:
+        """
+        Answers the queries one after another, so results can be written while later queries are read.
+
+        :param queries: Pairs of the source's and the target's name, a target of None requests all distances
+        :return: The results in the order of the queries
+        """
+        for source_name, target_name in queries:
+            if target_name is None:
+                yield from self.single_source(source_name)
+            else:
+                yield self.point_to_point(source_name, target_name)
+
+
+    def __solve(self, source: Node, target: Union[Node, None], algorithm_class: Type[DijkstraAlgorithm]) -> SearchView:
+        """
+        Runs an algorithm on the shared state.
+
+        :return: A view of the result
+        """
+        if algorithm_class is ContractionHierarchyAlgorithm:
+            algorithm = ContractionHierarchyAlgorithm(self.nodes, source, target, self.hierarchy, self.state)
+        elif algorithm_class is LandmarkAlgorithm:
+            algorithm = LandmarkAlgorithm(self.nodes, source, target, self.landmarks, self.state)
+        elif algorithm_class is AStarAlgorithm:
+            algorithm = AStarAlgorithm(self.nodes, source, target, self.heuristic, self.state)
+        else:
+            algorithm = algorithm_class(self.nodes, source, target_node=target, state=self.state)
+        view = algorithm.solve()
+
+        # Only the checked distances of the Dijkstra algorithm are final for other targets as well
+        self.__source = source if not algorithm_class.requires_target else None
+        self.__view = view
+        return view
+
+
+    def __get_path(self, view: SearchView, target: Node) -> Union[List[str], None]:
+        """
+        :return: The names of the nodes on the shortest path to the target or None if paths are not requested
+        """
+        if not self.paths:
+            return None
+        if view.get_distance(target) == float('inf'):
+            return []
+        path = [target.name]
+        node = view.get_predecessor(target)
+        while node is not None:
+            path.append(node.name)
+            node = view.get_predecessor(node)
+        path.reverse()
+        return path
@@ -0,0 +1,153 @@
+from typing import List, Dict, Union
+
+from model.Node import Node
+
+
+class SearchState:
+    nodes: List[Node]
+    index: Dict[Node, int]
+    distances: List[float]
+    predecessors: List[Union[Node, None]]
+    stamps: List[int]
+    checked_stamps: List[int]
+    stamp: int = 0
+    all_checked: bool = False
+
+
+    def __init__(self, nodes: List[Node]):
+        """
+        The distances, predecessors and checked flags of a single algorithm run, stored in arrays indexed
+        by the nodes' position in the list. Each run owns its state, so runs on the same graph do not collide.
+
+        An entry is only valid if its stamp equals the stamp of the current run, so starting a new run
+        does not have to reset all entries. The state can be reused as long as the nodes do not change.
+
+        :param nodes: All nodes of the graph
+        """
+        self.nodes = nodes
+        self.index = {node: i for i, node in enumerate(nodes)}
+        self.distances = [float('inf')] * len(nodes)
+        self.predecessors = [None] * len(nodes)
+        self.stamps = [0] * len(nodes)
+        self.checked_stamps = [0] * len(nodes)
+        self.reset()
+
+
+    def reset(self) -> int:
+        """
+        Starts a new run, all nodes are unreachable and unchecked afterwards.
+
+        :return: The stamp of the new run
+        """
+        self.stamp += 1
+        self.all_checked = False
+        return self.stamp
+
+
+    def get_distance(self, node: Node) -> float:
+        """
+        :param node: The node
+        :return: The node's current distance, inf if it has not been reached
+        """
+        i = self.index[node]
+        return self.distances[i] if self.stamps[i] == self.stamp else float('inf')
+
+
+    def get_predecessor(self, node: Node) -> Union[Node, None]:
+        """
+        :param node: The node
+        :return: The node's predecessor on the current shortest path or None
+        """
+        i = self.index[node]
+        return self.predecessors[i] if self.stamps[i] == self.stamp else None
+
+
+    def is_checked(self, node: Node) -> bool:
+        """
+        :param node: The node
+        :return: True if the node's distance is final
+        """
+        return self.all_checked or self.checked_stamps[self.index[node]] == self.stamp
+
+
+    def set_distance(self, node: Node, distance: float, predecessor: Union[Node, None] = None):
+        """
+        Sets the node's distance and predecessor.
+
+        :param node: The node
+        :param distance: The new distance
+        :param predecessor: The new predecessor
+        """
+        i = self.index[node]
+        self.distances[i] = distance
+        self.predecessors[i] = predecessor
+        self.stamps[i] = self.stamp
+
+
+    def check(self, node: Node):
+        """
+        Marks the node's distance as final.
+
+        :param node: The node
+        """
+        self.checked_stamps[self.index[node]] = self.stamp
+
+
+    def uncheck(self, node: Node):
+        """
+        Marks the node's distance as not final.
+
+        :param node: The node
+        """
+        self.checked_stamps[self.index[node]] = 0
+
+
+    def check_all(self):
+        """
+        Marks all nodes as checked, e.g. if the remaining nodes are unreachable.
+        """
+        self.all_checked = True
+
+
+    def view(self) -> "SearchView":
+        """
+        :return: A read-only view of this state
+        """
+        return SearchView(self)
+
+
+class SearchView:
+    __slots__ = ('__state',)
+
+
+    def __init__(self, state: SearchState):
+        """
+        Read-only access to the state of an algorithm run, e.g. to draw it.
+
+        :param state: The viewed state
+        """
+        self.__state = state
+
+
+    def get_distance(self, node: Node) -> float:
+        """
+        :param node: The node
+        :return: The node's current distance, inf if it has not been reached
+        """
+        return self.__state.get_distance(node)
+
+
+    def get_predecessor(self, node: Node) -> Union[Node, None]:
+        """
+        :param node: The node
+        :return: The node's predecessor on the current shortest path or None
+        """
+        return self.__state.get_predecessor(node)
+
+
+    def is_checked(self, node: Node) -> bool:
+        """
+        :param node: The node
+        :return: True if the node's distance is final
+        """
+        return self.__state.is_checked(node)
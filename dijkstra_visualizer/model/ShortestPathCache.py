@@ -0,0 +1,254 @@
+import heapq
+from collections import OrderedDict
+from typing import Dict, List, Set, Union, Iterable, Tuple
+
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.Node import Node
+from model.SearchState import SearchState, SearchView
+
+
+class ShortestPathTree:
+    start_node: Node
+    distance: Dict[Node, float]
+    predecessor: Dict[Node, Node]
+    children: Dict[Node, Set[Node]]
+    version: int
+
+
+    def __init__(self, start_node: Node, nodes: List[Node], result: SearchView, version: int):
+        """
+        The distances and predecessors of a finished Dijkstra algorithm.
+        After the graph changed the tree can be repaired incrementally, only the affected nodes are recalculated.
+
+        :param start_node: The start node of the algorithm
+        :param nodes: All nodes
+        :param result: The algorithm's result
+        :param version: The graph version of the result
+        """
+        self.start_node = start_node
+        self.distance = {}
+        self.predecessor = {}
+        self.children = {}
+        self.version = version
+        for node in nodes:
+            distance = result.get_distance(node)
+            if distance != float('inf'):
+                self.distance[node] = distance
+            predecessor = result.get_predecessor(node)
+            if predecessor:
+                self.__set_predecessor(node, predecessor)
+
+
+    def apply(self, state: SearchState):
+        """
+        Writes the result to a new run of the state, only the reached nodes are touched.
+
+        :param state: The state of the nodes
+        """
+        state.reset()
+        for node, distance in self.distance.items():
+            state.set_distance(node, distance, self.predecessor.get(node))
+        state.check_all()
+
+
+    def connection_changed(self, node: Node, other_node: Node, old_weight: Union[float, None]):
+        """
+        Repairs the tree after a connection was added, deleted or its weight changed.
+        The nodes already have to contain the new connection.
+
+        :param node: First node of the connection
+        :param other_node: Second node of the connection
+        :param old_weight: The weight before the change or None if the connection did not exist
+        """
+        new_weight = node.get_weight(other_node)
+        if new_weight is not None and (old_weight is None or new_weight < old_weight):
+            self.__propagate(self.__relax([(node, other_node, new_weight), (other_node, node, new_weight)]))
+        elif old_weight is not None and new_weight != old_weight:
+            # Only a longer or deleted connection of the tree changes any distance
+            if self.predecessor.get(other_node) is node:
+                self.__repair_subtree(other_node)
+            elif self.predecessor.get(node) is other_node:
+                self.__repair_subtree(node)
+
+
+    def node_deleted(self, node: Node):
+        """
+        Repairs the tree after a node was deleted, the node must not have any connections left.
+
+        :param node: The deleted node
+        """
+        self.__repair_subtree(node)
+        self.distance.pop(node, None)
+        self.children.pop(node, None)
+
+
+    def __set_predecessor(self, node: Node, predecessor: Union[Node, None]):
+        """
+        Sets the predecessor of a node and updates the children.
+        """
+        old_predecessor = self.predecessor.pop(node, None)
+        if old_predecessor:
+            self.children[old_predecessor].discard(node)
+        if predecessor:
+            self.predecessor[node] = predecessor
+            self.children.setdefault(predecessor, set()).add(node)
+
+
+    def __relax(self, connections: Iterable[Tuple[Node, Node, float]]) -> List:
+        """
+        Relaxes the given connections.
+
+        :param connections: Tuples of start node, end node and weight
+        :return: A heap of all improved nodes
+        """
+        heap = []
+        for start_node, end_node, weight in connections:
+            new_distance = self.distance.get(start_node, float('inf')) + weight
+            if new_distance < self.distance.get(end_node, float('inf')):
+                self.distance[end_node] = new_distance
+                self.__set_predecessor(end_node, start_node)
+                heap.append((new_distance, id(end_node), end_node))
+        heapq.heapify(heap)
+        return heap
+
+
+    def __propagate(self, heap: List):
+        """
+        Continues the Dijkstra algorithm from the improved nodes in the heap.
+        """
+        while heap:
+            distance, _, node = heapq.heappop(heap)
+            if distance > self.distance[node]:
+                continue
+            for neighbour, weight in zip(node.neighbours, node.weights):
+                new_distance = distance + weight
+                if new_distance < self.distance.get(neighbour, float('inf')):
+                    self.distance[neighbour] = new_distance
+                    self.__set_predecessor(neighbour, node)
+                    heapq.heappush(heap, (new_distance, id(neighbour), neighbour))
+
+
+    def __repair_subtree(self, root: Node):
+        """
+        Recalculates the distances of the given node and all nodes whose shortest path passes it.
+        All other distances cannot change if a connection got longer or was deleted.
+
+        :param root: The root of the affected subtree
+        """
+        affected = set()
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            affected.add(node)
+            stack.extend(self.children.get(node, ()))
+
+        for node in affected:
+            self.distance.pop(node, None)
+            self.__set_predecessor(node, None)
+
+        # Connect the affected nodes to the unaffected part of the tree
+        self.__propagate(self.__relax(
+            (neighbour, node, weight)
+            for node in affected
+            for neighbour, weight in zip(node.neighbours, node.weights)
+            if neighbour not in affected
+        ))
+
+
+class ShortestPathCache:
+    trees: "OrderedDict[Node, ShortestPathTree]"
+
+
+    def __init__(self, max_size: int = 8):
+        """
+        Caches the results of finished Dijkstra algorithms per start node.
+        Changes of the graph have to be reported to repair or invalidate the cached results.
+
+        :param max_size: The maximum number of cached start nodes, the least recently used is removed first
+        """
+        self.max_size = max_size
+        self.trees = OrderedDict()
+
+
+    @staticmethod
+    def is_cacheable(algorithm: DijkstraAlgorithm) -> bool:
+        """
+        :return: True if the algorithm calculates all shortest paths from its start node
+        """
+        return type(algorithm) is DijkstraAlgorithm and algorithm.target_node is None
+
+
+    def load(self, algorithm: DijkstraAlgorithm, version: int) -> bool:
+        """
+        Writes a cached result to the algorithm's state and finishes the algorithm.
+
+        :param algorithm: The algorithm to load the result for
+        :param version: The current graph version
+        :return: True if a valid result was cached
+        """
+        tree = self.trees.get(algorithm.start_node)
+        if not self.is_cacheable(algorithm) or not tree or tree.version != version:
+            return False
+        self.trees.move_to_end(algorithm.start_node)
+        tree.apply(algorithm.state)
+        algorithm.finish()
+        return True
+
+
+    def store(self, algorithm: DijkstraAlgorithm, version: int):
+        """
+        Caches the result of a finished algorithm.
+
+        :param algorithm: The finished algorithm
+        :param version: The current graph version
+        """
+        if not self.is_cacheable(algorithm):
+            return
+        self.trees[algorithm.start_node] = ShortestPathTree(algorithm.start_node, algorithm.nodes, algorithm.get_view(), version)
+        self.trees.move_to_end(algorithm.start_node)
+        while len(self.trees) > self.max_size:
+            self.trees.popitem(last=False)
+
+
+    def node_added(self, version: int):
+        """
+        A new node has no connections and does not change any result.
+
+        :param version: The new graph version
+        """
+        for tree in self.trees.values():
+            tree.version = version
+
+
+    def node_deleted(self, node: Node, version: int):
+        """
+        Repairs all cached results after a node and its connections were deleted.
+
+        :param node: The deleted node
+        :param version: The new graph version
+        """
+        self.trees.pop(node, None)
+        for tree in self.trees.values():
+            tree.node_deleted(node)
+            tree.version = version
+
+
+    def connection_changed(self, node: Node, other_node: Node, old_weight: Union[float, None], version: int):
+        """
+        Repairs all cached results after a connection was added, deleted or its weight changed.
+
+        :param node: First node of the connection
+        :param other_node: Second node of the connection
+        :param old_weight: The weight before the change or None if the connection did not exist
+        :param version: The new graph version
+        """
+        for tree in self.trees.values():
+            tree.connection_changed(node, other_node, old_weight)
+            tree.version = version
+
+
+    def clear(self):
+        """
+        Removes all cached results.
+        """
+        self.trees.clear()
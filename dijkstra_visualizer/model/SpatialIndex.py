@@ -0,0 +1,126 @@
+import math
+from typing import Dict, List, Tuple, Union, Iterator
+
+from model.Node import Node
+
+
+class SpatialIndex:
+    cell_size: float
+    cells: Dict[Tuple[int, int], List[Node]]
+    insertion_order: Dict[Node, int]
+    counter: int
+
+
+    def __init__(self, cell_size: float = None):
+        """
+        A uniform grid to find the node on a position without checking every node.
+        Each node is stored in all cells overlapped by its bounding box.
+
+        :param cell_size: The width and height of a cell, default is the node's diameter
+        """
+        self.cell_size = cell_size if cell_size else 2 * Node.radius
+        self.cells = {}
+        self.insertion_order = {}
+        self.counter = 0
+
+
+    def __cells_of_node(self, node: Node) -> Iterator[Tuple[int, int]]:
+        """
+        Returns all cells overlapped by the node's bounding box.
+
+        :param node: The node
+        :return: An iterator of cell coordinates
+        """
+        min_column, min_row = self.__cell_of_position(node.x - node.radius, node.y - node.radius)
+        max_column, max_row = self.__cell_of_position(node.x + node.radius, node.y + node.radius)
+        for column in range(min_column, max_column + 1):
+            for row in range(min_row, max_row + 1):
+                yield column, row
+
+
+    def __cell_of_position(self, x: float, y: float) -> Tuple[int, int]:
+        """
+        :param x: The number of pixel in x-axis (left to right)
+        :param y: The number of pixel in y-axis (top to bottom)
+        :return: The cell containing the position
+        """
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+
+    def insert(self, node: Node):
+        """
+        Adds a node to the index.
+
+        :param node: The node to add
+        """
+        self.counter += 1
+        self.insertion_order[node] = self.counter
+        for cell in self.__cells_of_node(node):
+            self.cells.setdefault(cell, []).append(node)
+
+
+    def remove(self, node: Node):
+        """
+        Removes a node from the index.
+
+        :param node: The node to remove
+        """
+        if self.insertion_order.pop(node, None) is None:
+            return
+        for cell in self.__cells_of_node(node):
+            cell_nodes = self.cells[cell]
+            cell_nodes.remove(node)
+            if not cell_nodes:
+                del self.cells[cell]
+
+
+    def clear(self):
+        """
+        Removes all nodes from the index.
+        """
+        self.cells = {}
+        self.insertion_order = {}
+        self.counter = 0
+
+
+    def find(self, x: int, y: int) -> Union[Node, None]:
+        """
+        Searches for a node on this position.
+        If multiple nodes overlap the last one added will be returned.
+
+        :param x: The number of pixel in x-axis (left to right)
+        :param y: The number of pixel in y-axis (top to bottom)
+        :return: The found node or none
+        """
+        candidates = (n for n in self.cells.get(self.__cell_of_position(x, y), ()) if n.is_position_in_node(x, y))
+        return max(candidates, key=self.insertion_order.get, default=None)
+
+
+    def find_in_rectangle(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[Node]:
+        """
+        Searches for all nodes overlapping the given rectangle.
+
+        :param min_x: The left border
+        :param min_y: The top border
+        :param max_x: The right border
+        :param max_y: The bottom border
+        :return: A list of all found nodes in insertion order
+        """
+        min_column, min_row = self.__cell_of_position(min_x, min_y)
+        max_column, max_row = self.__cell_of_position(max_x, max_y)
+
+        # Iterate over the occupied cells if the rectangle contains more cells than that
+        if (max_column - min_column + 1) * (max_row - min_row + 1) > len(self.cells):
+            cells = (nodes for (column, row), nodes in self.cells.items()
+                     if min_column <= column <= max_column and min_row <= row <= max_row)
+        else:
+            cells = (self.cells[cell] for cell in
+                     ((column, row) for column in range(min_column, max_column + 1) for row in range(min_row, max_row + 1))
+                     if cell in self.cells)
+
+        found = {}
+        for cell_nodes in cells:
+            for node in cell_nodes:
+                if min_x - node.radius <= node.x <= max_x + node.radius and min_y - node.radius <= node.y <= max_y + node.radius:
+                    found[node] = self.insertion_order[node]
+        return sorted(found, key=found.get)
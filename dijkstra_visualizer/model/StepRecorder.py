@@ -0,0 +1,246 @@
+from array import array
+from typing import List, Tuple, Union, Set, Iterable
+
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.Node import Node
+from model.SearchState import SearchState, SearchView
+
+
+class StepRecorder:
+    MIN_CHECKPOINT_INTERVAL: int = 1024
+    current_node: Union[Node, None] = None
+    current_neighbour: Union[Node, None] = None
+    changed_nodes: Union[Tuple[Node, ...], None] = None
+    position: int = 0
+    finished: bool = False
+    checkpoints: List[Tuple[array, array, bytearray]]
+
+
+    def __init__(self, algorithm: DijkstraAlgorithm):
+        """
+        Records the steps of an algorithm, so they can be replayed backward and forward.
+        Every step is stored as delta of the nodes whose distance, predecessor or checked flag changed,
+        with the old and the new values, so moving by one step only costs the size of its delta.
+        The values are kept in packed arrays, predecessors are stored as node index (-1 if none).
+
+        Every checkpoint interval steps all values are stored as checkpoint, so distant steps are reached
+        without replaying all steps in between. The interval is at least the number of nodes,
+        so the checkpoints never need more memory than the steps.
+
+        :param algorithm: The algorithm to record, it must not have been started
+        """
+        self.algorithm = algorithm
+        self.nodes = algorithm.nodes
+        self.state = SearchState(self.nodes)
+        self.index = self.state.index
+        self.checkpoint_interval = max(self.MIN_CHECKPOINT_INTERVAL, len(self.nodes))
+
+        # The deltas of step i are stored from step_offsets[i] to step_offsets[i + 1]
+        self.step_offsets = array('q', [0])
+        self.step_nodes = array('q')
+        self.step_neighbours = array('q')
+        self.delta_nodes = array('q')
+        self.old_distances = array('d')
+        self.new_distances = array('d')
+        self.old_predecessors = array('q')
+        self.new_predecessors = array('q')
+        self.old_checked = bytearray()
+        self.new_checked = bytearray()
+        self.checkpoints = []
+        self.__store_checkpoint()
+
+
+    @property
+    def length(self) -> int:
+        """
+        :return: The number of recorded steps
+        """
+        return len(self.step_nodes)
+
+
+    def get_view(self) -> SearchView:
+        """
+        :return: A read-only view of the values at the current position
+        """
+        return self.state.view()
+
+
+    def next(self) -> Tuple[List[Node], Union[Node, None], Union[Node, None]]:
+        """
+        Moves to the next step, the algorithm is continued if the last recorded step is reached.
+
+        :return: A tuple of a list with all nodes, the currently active node and the currently checked neighbour
+        """
+        if self.position < self.length:
+            self.changed_nodes = tuple(self.__redo())
+        elif self.finished:
+            raise StopIteration
+        else:
+            try:
+                self.algorithm.next()
+            except StopIteration:
+                self.finished = True
+                raise
+            self.changed_nodes = tuple(self.__record())
+        self.__load_step()
+        return self.nodes, self.current_node, self.current_neighbour
+
+
+    def seek(self, position: int):
+        """
+        Moves to the given position of the recorded steps.
+        Distant positions are reached from the closest checkpoint.
+        Afterwards changed_nodes contains the changed nodes or None if all nodes may have changed.
+
+        :param position: The number of executed steps, clipped to the recorded steps
+        """
+        position = min(max(position, 0), self.length)
+        checkpoint = position // self.checkpoint_interval
+        checkpoint_position = checkpoint * self.checkpoint_interval
+        changed_nodes: Union[Set[Node], None] = set()
+        if abs(position - self.position) > self.checkpoint_interval and \
+                (position < self.position or checkpoint_position > self.position):
+            self.__load_checkpoint(checkpoint)
+            changed_nodes = None
+
+        while self.position < position:
+            changed = self.__redo()
+            if changed_nodes is not None:
+                changed_nodes.update(changed)
+        while self.position > position:
+            changed = self.__undo()
+            if changed_nodes is not None:
+                changed_nodes.update(changed)
+
+        self.changed_nodes = tuple(changed_nodes) if changed_nodes is not None else None
+        self.__load_step()
+
+
+    def __record(self) -> Iterable[Node]:
+        """
+        Stores the changes of the algorithm's last step and applies them.
+
+        :return: The changed nodes
+        """
+        view = self.algorithm.get_view()
+        changed_nodes = self.algorithm.changed_nodes
+        changed = []
+        for node in self.nodes if changed_nodes is None else changed_nodes:
+            i = self.index[node]
+            predecessor = view.get_predecessor(node)
+            new_values = (view.get_distance(node), self.index[predecessor] if predecessor else -1,
+                          view.is_checked(node))
+            old_values = self.__get_values(node)
+            if new_values != old_values:
+                self.delta_nodes.append(i)
+                self.old_distances.append(old_values[0])
+                self.new_distances.append(new_values[0])
+                self.old_predecessors.append(old_values[1])
+                self.new_predecessors.append(new_values[1])
+                self.old_checked.append(old_values[2])
+                self.new_checked.append(new_values[2])
+                self.__set_values(node, *new_values)
+                changed.append(node)
+
+        current_node, current_neighbour = self.algorithm.current_node, self.algorithm.current_neighbour
+        self.step_nodes.append(self.index[current_node] if current_node else -1)
+        self.step_neighbours.append(self.index[current_neighbour] if current_neighbour else -1)
+        self.step_offsets.append(len(self.delta_nodes))
+        self.position += 1
+        if self.position % self.checkpoint_interval == 0:
+            self.__store_checkpoint()
+        return changed
+
+
+    def __redo(self) -> List[Node]:
+        """
+        Applies the new values of the next recorded step.
+
+        :return: The changed nodes
+        """
+        changed = []
+        for delta in range(self.step_offsets[self.position], self.step_offsets[self.position + 1]):
+            node = self.nodes[self.delta_nodes[delta]]
+            self.__set_values(node, self.new_distances[delta], self.new_predecessors[delta], self.new_checked[delta])
+            changed.append(node)
+        self.position += 1
+        return changed
+
+
+    def __undo(self) -> List[Node]:
+        """
+        Applies the old values of the current step.
+
+        :return: The changed nodes
+        """
+        self.position -= 1
+        changed = []
+        for delta in reversed(range(self.step_offsets[self.position], self.step_offsets[self.position + 1])):
+            node = self.nodes[self.delta_nodes[delta]]
+            self.__set_values(node, self.old_distances[delta], self.old_predecessors[delta], self.old_checked[delta])
+            changed.append(node)
+        return changed
+
+
+    def __load_step(self):
+        """
+        Loads the active node and the checked neighbour of the current step.
+        """
+        if self.position == 0:
+            self.current_node = self.current_neighbour = None
+            return
+        current_node, current_neighbour = self.step_nodes[self.position - 1], self.step_neighbours[self.position - 1]
+        self.current_node = self.nodes[current_node] if current_node >= 0 else None
+        self.current_neighbour = self.nodes[current_neighbour] if current_neighbour >= 0 else None
+
+
+    def __store_checkpoint(self):
+        """
+        Stores all values of the current position as checkpoint.
+        """
+        values = [self.__get_values(node) for node in self.nodes]
+        self.checkpoints.append((
+            array('d', (v[0] for v in values)),
+            array('q', (v[1] for v in values)),
+            bytearray(v[2] for v in values)
+        ))
+
+
+    def __load_checkpoint(self, checkpoint: int):
+        """
+        Sets all values to the given checkpoint.
+
+        :param checkpoint: The checkpoint's number
+        """
+        distances, predecessors, checked = self.checkpoints[checkpoint]
+        for i, node in enumerate(self.nodes):
+            self.__set_values(node, distances[i], predecessors[i], checked[i])
+        self.position = checkpoint * self.checkpoint_interval
+
+
+    def __get_values(self, node: Node) -> Tuple[float, int, bool]:
+        """
+        :return: The distance, the predecessor's index and the checked flag at the current position
+        """
+        predecessor = self.state.get_predecessor(node)
+        return self.state.get_distance(node), self.index[predecessor] if predecessor else -1, \
+            self.state.is_checked(node)
+
+
+    def __set_values(self, node: Node, distance: float, predecessor: int, checked: bool):
+        """
+        Sets the distance, the predecessor given by its index and the checked flag of a node.
+        """
+        self.state.set_distance(node, distance, self.nodes[predecessor] if predecessor >= 0 else None)
+        if checked:
+            self.state.check(node)
+        else:
+            self.state.uncheck(node)
+
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self):
+        return self.next()
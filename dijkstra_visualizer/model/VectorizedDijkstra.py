@@ -0,0 +1,249 @@
+import heapq
+from array import array
+from typing import List, Tuple, Sequence
+
+from model.CompactGraph import CompactGraph
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.Node import Node
+from model.SearchState import SearchState, SearchView
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, the pure Python fallback is used
+    numpy = None
+
+
+class VectorizedDijkstra:
+    graph: CompactGraph
+    delta: float
+
+
+    def __init__(self, graph: CompactGraph, delta: float = None):
+        """
+        Solves single- and multi-source shortest paths of a whole graph at once, e.g. for headless bulk runs.
+        The graph's CSR arrays are converted to NumPy arrays once and reused by all runs.
+
+        With NumPy the runs use delta-stepping: the unchecked nodes are grouped into buckets of width delta
+        by their distance, and all edges of a bucket's nodes are relaxed by one vectorized operation.
+        Edges of at most delta are relaxed until the bucket does not change, then the longer edges once.
+        Without NumPy the same results are calculated by a Dijkstra search on the CSR arrays.
+
+        :param graph: The graph in CSR representation
+        :param delta: The width of a bucket, default is four times the average edge weight
+        """
+        self.graph = graph
+        self.delta = delta
+        if numpy is None:
+            return
+
+        self.__offsets = numpy.frombuffer(graph.offsets, dtype=numpy.int64)
+        self.__targets = numpy.frombuffer(graph.targets, dtype=numpy.int64)
+        self.__weights = numpy.frombuffer(graph.weights, dtype=numpy.float64)
+        if self.delta is None:
+            positive = self.__weights[self.__weights > 0]
+            self.delta = 4 * float(positive.mean()) if len(positive) else 1.0
+        self.__light = self.__weights <= self.delta
+
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        :return: True if NumPy is installed and the runs are vectorized
+        """
+        return numpy is not None
+
+
+    def solve(self, sources: Sequence[int], source_distances: Sequence[float] = None) -> Tuple[array, array]:
+        """
+        Calculates the shortest distances from the nearest source to all nodes.
+
+        :param sources: The indices of the source nodes
+        :param source_distances: The initial distance of each source, default is 0 for all
+        :return: A tuple of the distance array and the predecessor array (-1 if none), both indexed by node
+        """
+        if source_distances is None:
+            source_distances = [0.0] * len(sources)
+        if numpy is None:
+            if len(sources) == 1 and source_distances[0] == 0:
+                return DijkstraAlgorithm.solve_compact(self.graph, sources[0])
+            return self.__solve_python(sources, source_distances)
+
+        distance, predecessor = self.__solve_numpy(sources, source_distances)
+        distances, predecessors = array('d'), array('q')
+        distances.frombytes(distance.tobytes())
+        predecessors.frombytes(predecessor.tobytes())
+        return distances, predecessors
+
+
+    def solve_nodes(self, nodes: List[Node], start_nodes: List[Node], state: SearchState = None) -> SearchView:
+        """
+        Runs solve for nodes and writes the distances and predecessors back to a search state.
+        All nodes are checked afterwards, like after DijkstraAlgorithm.solve.
+
+        :param nodes: All nodes of the graph, in the order of the graph's indices
+        :param start_nodes: The source nodes
+        :param state: A state of the same nodes to reuse, its previous result is discarded
+        :return: A read-only view of the result
+        """
+        state = state if state else SearchState(nodes)
+        distances, predecessors = self.solve([state.index[node] for node in start_nodes])
+
+        state.reset()
+        if numpy is not None:
+            reached = numpy.flatnonzero(numpy.isfinite(numpy.frombuffer(distances, dtype=numpy.float64))).tolist()
+        else:
+            reached = [i for i, distance in enumerate(distances) if distance != float('inf')]
+        for i in reached:
+            predecessor = predecessors[i]
+            state.set_distance(nodes[i], distances[i], nodes[predecessor] if predecessor >= 0 else None)
+        state.check_all()
+        return state.view()
+
+
+    def __solve_numpy(self, sources: Sequence[int], source_distances: Sequence[float]):
+        """
+        Delta-stepping with vectorized relaxations.
+        The buckets store arrays of the node indices added to them, a node may be added several times
+        and outdated entries are skipped, so no step has to scan all nodes or all edges.
+
+        :return: A tuple of the NumPy distance and predecessor arrays
+        """
+        node_count = len(self.graph)
+        distance = numpy.full(node_count, numpy.inf)
+        predecessor = numpy.full(node_count, -1, dtype=numpy.int64)
+        checked = numpy.zeros(node_count, dtype=bool)
+        source_indices = numpy.asarray(sources, dtype=numpy.int64)
+        numpy.minimum.at(distance, source_indices, numpy.asarray(source_distances, dtype=numpy.float64))
+
+        buckets = {}  # Maps the bucket number to the added node arrays
+        bucket_numbers = []  # Heap of the bucket numbers in buckets
+        self.__add_to_buckets(buckets, bucket_numbers, distance, numpy.unique(source_indices))
+        while bucket_numbers:
+            number = heapq.heappop(bucket_numbers)
+            candidates = numpy.unique(numpy.concatenate(buckets.pop(number)))
+            active = candidates[~checked[candidates] & (self.__get_bucket_numbers(distance[candidates]) == number)]
+
+            # Edges of at most delta may add nodes to the current bucket, they are relaxed until it is stable
+            bucket = []
+            while len(active):
+                bucket.append(active)
+                improved = self.__relax(distance, predecessor, active, True)
+                in_bucket = self.__get_bucket_numbers(distance[improved]) == number
+                self.__add_to_buckets(buckets, bucket_numbers, distance, improved[~in_bucket])
+                active = improved[in_bucket]
+            if not bucket:
+                continue
+
+            # Longer edges only reach later buckets, so they are relaxed once
+            bucket = numpy.unique(numpy.concatenate(bucket))
+            improved = self.__relax(distance, predecessor, bucket, False)
+            self.__add_to_buckets(buckets, bucket_numbers, distance, improved)
+            checked[bucket] = True
+
+        return distance, predecessor
+
+
+    def __get_bucket_numbers(self, distances):
+        """
+        :param distances: The distances of some nodes
+        :return: The numbers of the buckets containing the distances
+        """
+        return numpy.floor(distances / self.delta).astype(numpy.int64)
+
+
+    def __add_to_buckets(self, buckets, bucket_numbers, distance, nodes):
+        """
+        Adds nodes to the buckets of their distances.
+
+        :param buckets: Maps the bucket number to the added node arrays
+        :param bucket_numbers: Heap of the bucket numbers in buckets
+        :param distance: The distances of all nodes
+        :param nodes: The indices of the nodes to add
+        """
+        if not len(nodes):
+            return
+        numbers = self.__get_bucket_numbers(distance[nodes])
+        order = numpy.argsort(numbers, kind='stable')
+        numbers, nodes = numbers[order], nodes[order]
+        unique_numbers, starts = numpy.unique(numbers, return_index=True)
+        for number, part in zip(unique_numbers.tolist(), numpy.split(nodes, starts[1:])):
+            if number not in buckets:
+                buckets[number] = []
+                heapq.heappush(bucket_numbers, number)
+            buckets[number].append(part)
+
+
+    def __relax(self, distance, predecessor, nodes, light: bool):
+        """
+        Relaxes the light or the heavy edges of the given nodes, only their CSR ranges are read.
+        Of several edges to the same node the shortest one is used.
+
+        :param distance: The distances, updated in place
+        :param predecessor: The predecessors, updated in place
+        :param nodes: The indices of the nodes whose edges are relaxed
+        :param light: True to relax the edges of at most delta, False for the longer ones
+        :return: The indices of the nodes whose distance decreased
+        """
+        starts = self.__offsets[nodes]
+        counts = self.__offsets[nodes + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            return nodes[:0]
+        # The edge indices of all ranges, each range is shifted to its start
+        edges = numpy.arange(total) + numpy.repeat(starts - (numpy.cumsum(counts) - counts), counts)
+        sources = numpy.repeat(nodes, counts)
+        selected = self.__light[edges] if light else ~self.__light[edges]
+        edges, sources = edges[selected], sources[selected]
+
+        targets = self.__targets[edges]
+        new_distances = distance[sources] + self.__weights[edges]
+        shorter = new_distances < distance[targets]
+        sources, targets, new_distances = sources[shorter], targets[shorter], new_distances[shorter]
+        if not len(targets):
+            return targets
+
+        # Sorts by target and distance, the first edge of each target is the shortest one
+        order = numpy.lexsort((new_distances, targets))
+        sources, targets, new_distances = sources[order], targets[order], new_distances[order]
+        first = numpy.ones(len(targets), dtype=bool)
+        first[1:] = targets[1:] != targets[:-1]
+        targets = targets[first]
+        distance[targets] = new_distances[first]
+        predecessor[targets] = sources[first]
+        return targets
+
+
+    def __solve_python(self, sources: Sequence[int], source_distances: Sequence[float]) -> Tuple[array, array]:
+        """
+        The Dijkstra algorithm on the CSR arrays starting with all sources in the heap.
+
+        :return: A tuple of the distance array and the predecessor array (-1 if none), both indexed by node
+        """
+        node_count = len(self.graph)
+        offsets, targets, weights = self.graph.offsets, self.graph.targets, self.graph.weights
+        distance = array('d', [float('inf')]) * node_count
+        predecessor = array('q', [-1]) * node_count
+        checked = bytearray(node_count)
+
+        heap = []
+        for source, source_distance in zip(sources, source_distances):
+            if source_distance < distance[source]:
+                distance[source] = source_distance
+                heap.append((source_distance, source))
+        heapq.heapify(heap)
+        while heap:
+            current_distance, current = heapq.heappop(heap)
+            if checked[current]:
+                continue
+            checked[current] = 1
+
+            for edge in range(offsets[current], offsets[current + 1]):
+                neighbour = targets[edge]
+                if not checked[neighbour]:
+                    new_distance = current_distance + weights[edge]
+                    if new_distance < distance[neighbour]:
+                        distance[neighbour] = new_distance
+                        predecessor[neighbour] = current
+                        heapq.heappush(heap, (new_distance, neighbour))
+
+        return distance, predecessor
@@ -3,10 +3,13 @@ from tkinter import ttk
 
 
 class ButtonFrame(ttk.Frame):
+    visible_frame: ttk.Frame
+
+
     def __init__(self, root: tk.Misc):
         """
         A frame containing all buttons of the application.
-        Divided in two button groups.
+        Divided in three button groups, only one is visible at a time.
 
         :param root: The frame's parent
         """
@@ -18,25 +21,54 @@ class ButtonFrame(ttk.Frame):
         self.edit_button_frame.grid(row=0, sticky='EW')
         self.edit_button_frame.columnconfigure(0, weight=1)
         self.edit_button_frame.columnconfigure(1, weight=1)
+        self.edit_button_frame.columnconfigure(2, weight=1)
 
         self.button_clear = ttk.Button(self.edit_button_frame, text="Clear")
         self.button_clear.grid(column=0, row=0, sticky='EW')
-        self.button_start = ttk.Button(self.edit_button_frame, text="Start Dijkstra")
-        self.button_start.grid(column=1, row=0, sticky='EW')
+        self.algorithm_selection = ttk.Combobox(self.edit_button_frame, state='readonly')
+        self.algorithm_selection.grid(column=1, row=0, sticky='EW')
+        self.button_start = ttk.Button(self.edit_button_frame, text="Start")
+        self.button_start.grid(column=2, row=0, sticky='EW')
 
         # Dijkstra-button group
         self.dijkstra_button_frame = ttk.Frame(self)
         self.dijkstra_button_frame.grid(row=0, column=0, sticky='EW')
-        self.dijkstra_button_frame.columnconfigure(0, weight=1)
-        self.dijkstra_button_frame.columnconfigure(1, weight=1)
-        self.dijkstra_button_frame.columnconfigure(2, weight=1)
+        for column in range(6):
+            self.dijkstra_button_frame.columnconfigure(column, weight=1)
 
         self.button_reset = ttk.Button(self.dijkstra_button_frame, text="Reset")
         self.button_reset.grid(column=0, row=1, sticky='EW')
+        self.button_play = ttk.Button(self.dijkstra_button_frame, text="Play")
+        self.button_play.grid(column=1, row=1, sticky='EW')
+        self.speed_scale = ttk.Scale(self.dijkstra_button_frame, orient='horizontal')
+        self.speed_scale.grid(column=2, row=1, sticky='EW', padx=4)
+        self.speed_label = ttk.Label(self.dijkstra_button_frame, width=16)
+        self.speed_label.grid(column=3, row=1, sticky='W')
         self.button_skip = ttk.Button(self.dijkstra_button_frame, text="Skip to End")
-        self.button_skip.grid(column=1, row=1, sticky='EW')
+        self.button_skip.grid(column=4, row=1, sticky='EW')
         self.button_next = ttk.Button(self.dijkstra_button_frame, text="Next Step")
-        self.button_next.grid(column=2, row=1, sticky='EW')
+        self.button_next.grid(column=5, row=1, sticky='EW')
+        self.timeline_variable = tk.DoubleVar(self)
+        self.timeline_scale = ttk.Scale(self.dijkstra_button_frame, orient='horizontal', variable=self.timeline_variable)
+        self.timeline_scale.grid(column=0, row=2, columnspan=6, sticky='EW')
+
+        # Task-button group, visible while a background task is running
+        self.task_button_frame = ttk.Frame(self)
+        self.task_button_frame.grid(row=0, column=0, sticky='EW')
+        self.task_button_frame.columnconfigure(0, weight=1)
+
+        self.button_cancel = ttk.Button(self.task_button_frame, text="Cancel")
+        self.button_cancel.grid(column=0, row=0, sticky='EW')
+
+        self.show(self.edit_button_frame)
 
-        self.edit_button_frame.tkraise()
+
+    def show(self, frame: ttk.Frame):
+        """
+        Shows the given button group.
+
+        :param frame: One of the button groups
+        """
+        frame.tkraise()
+        self.visible_frame = frame
 
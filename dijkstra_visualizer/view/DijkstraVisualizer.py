@@ -5,6 +5,8 @@ from pathlib import Path
 from controller.ButtonController import ButtonController
 from controller.CanvasController import CanvasController
 from controller.FileController import FileController
+from controller.StatisticsController import StatisticsController
+from controller.TaskController import TaskController
 from view.ButtonFrame import ButtonFrame
 from view.GraphCanvas import GraphCanvas
 from view.InfoLabel import InfoLabel
@@ -29,19 +31,21 @@ class DijkstraVisualizer(tk.Tk):
         self.info_label = InfoLabel(self)
         self.info_label.grid(row=0, sticky='EW', pady=2, padx=4)
 
-        # Main canvas
-        self.graph_canvas = GraphCanvas(self, self.CANVAS_WIDTH, self.CANVAS_HEIGHT)
-        self.graph_canvas.grid(row=1)
-        self.canvas_controller = CanvasController(self.graph_canvas, self.info_label)
-
         # Button bar
         self.button_frame = ButtonFrame(self)
         self.button_frame.grid(row=2, sticky='EW')
+        self.task_controller = TaskController(self.button_frame, self.info_label)
+
+        # Main canvas
+        self.graph_canvas = GraphCanvas(self, self.CANVAS_WIDTH, self.CANVAS_HEIGHT)
+        self.graph_canvas.grid(row=1)
+        self.canvas_controller = CanvasController(self.graph_canvas, self.info_label, self.task_controller)
         self.button_controller = ButtonController(self.button_frame, self.canvas_controller)
 
         # Menu bar
-        self.file_controller = FileController(self.canvas_controller, self.button_frame)
-        self.menu = MenuBar(self, self.file_controller)
+        self.file_controller = FileController(self.canvas_controller, self.button_frame, self.task_controller)
+        self.statistics_controller = StatisticsController(self.graph_canvas)
+        self.menu = MenuBar(self, self.file_controller, self.statistics_controller)
         self.config(menu=self.menu)
 
         # Load default example if it exists
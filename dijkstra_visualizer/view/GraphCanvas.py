@@ -1,95 +1,404 @@
 import math
 import tkinter as tk
-from typing import List
+from typing import List, Dict, Tuple, FrozenSet, Iterable, Union, Callable
 
 from model.Node import Node
+from model.Profiler import profiler
+from model.SearchState import SearchView
 
 
 class GraphCanvas(tk.Canvas):
+    HIGHLIGHT_TAG: str = "highlight"
+    STATISTICS_TAG: str = "statistics"
+    MIN_ZOOM: float = 0.01
+    MAX_ZOOM: float = 4.0
+    LABEL_ZOOM: float = 0.5  # Below this zoom level no texts are drawn
+    POINT_ZOOM: float = 0.2  # Below this zoom level nodes are drawn as points
+    POINT_RADIUS: int = 2
+    zoom: float = 1.0
+    offset_x: float = 0.0
+    offset_y: float = 0.0
+    node_items: Dict[Node, Tuple[int, Union[int, None]]]
+    node_states: Dict[Node, Tuple[str, str, str]]
+    connection_items: Dict[FrozenSet[Node], Tuple[int, Union[int, None]]]
+    connection_weights: Dict[FrozenSet[Node], float]
+    search_view: Union[SearchView, None] = None
+    statistics_text: Union[str, None] = None
+    checked_color: Union[Callable[[Node], str], None] = None
+
+
     def __init__(self, root: tk.Misc, width: int = None, height: int = None):
         """
         The main canvas displays all nodes.
         Servers methods to draw needed figures.
+        The canvas items of nodes and connections are kept and only reconfigured if they changed.
+        The nodes' pixel positions are transformed by the current zoom level and offset,
+        depending on the zoom level texts are hidden and nodes are drawn as points.
 
         :param root: The canvas parent
         :param width: The width of the canvas
         :param height: The height of the canvas
         """
         super().__init__(root, width=width, height=height, bg="white")
+        self.node_items = {}
+        self.node_states = {}
+        self.connection_items = {}
+        self.connection_weights = {}
+
+
+    def to_world(self, x: int, y: int) -> Tuple[int, int]:
+        """
+        Converts a position on the canvas to the nodes' coordinate system.
+
+        :param x: The number of pixel on the canvas in x-axis (left to right)
+        :param y: The number of pixel on the canvas in y-axis (top to bottom)
+        :return: The rounded position in the nodes' coordinate system
+        """
+        return round(x / self.zoom + self.offset_x), round(y / self.zoom + self.offset_y)
+
+
+    def __to_screen(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Converts a position in the nodes' coordinate system to the canvas.
+        """
+        return (x - self.offset_x) * self.zoom, (y - self.offset_y) * self.zoom
+
+
+    def get_viewport(self) -> Tuple[float, float, float, float]:
+        """
+        :return: The visible rectangle (min x, min y, max x, max y) in the nodes' coordinate system
+        """
+        width, height = int(self.cget("width")), int(self.cget("height"))
+        return self.offset_x, self.offset_y, self.offset_x + width / self.zoom, self.offset_y + height / self.zoom
+
+
+    def zoom_at(self, x: int, y: int, factor: float):
+        """
+        Zooms in or out while keeping the given canvas position fixed.
+        The existing items are only scaled, their line widths, texts and level of detail are not adapted
+        until they are recreated, e.g. by clear and update_view when the zooming stopped.
+        Use update_view to draw the nodes which became visible.
+
+        :param x: The number of pixel on the canvas in x-axis (left to right)
+        :param y: The number of pixel on the canvas in y-axis (top to bottom)
+        :param factor: The zoom factor, greater 1 to zoom in
+        """
+        world_x, world_y = x / self.zoom + self.offset_x, y / self.zoom + self.offset_y
+        old_zoom = self.zoom
+        self.zoom = min(max(self.zoom * factor, self.MIN_ZOOM), self.MAX_ZOOM)
+        self.offset_x = world_x - x / self.zoom
+        self.offset_y = world_y - y / self.zoom
+        self.scale("all", x, y, self.zoom / old_zoom, self.zoom / old_zoom)
+        self.coords(self.STATISTICS_TAG, 8, 8)
 
 
-    def redraw_graph(self, nodes: List[Node], active_node: Node = None):
+    def pan(self, dx: int, dy: int):
         """
-        Clears the canvas and redraws all given nodes and connections.
+        Moves the visible area, the existing items are moved.
+        Use update_view to draw the nodes which became visible and to delete the ones which left the view.
+
+        :param dx: The number of canvas pixel to move in x-axis
+        :param dy: The number of canvas pixel to move in y-axis
+        """
+        self.offset_x -= dx / self.zoom
+        self.offset_y -= dy / self.zoom
+        self.move("all", dx, dy)
+        self.move(self.STATISTICS_TAG, -dx, -dy)
+
+
+    def redraw_graph(self, nodes: List[Node], active_node: Node = None, target_node: Node = None,
+                     search_view: SearchView = None):
+        """
+        Synchronizes the canvas with all given nodes and connections.
+        Removes highlights and items of deleted nodes or connections, creates missing items
+        and reconfigures changed ones.
+        Nodes which are not passed are not drawn, use this to skip nodes outside the viewport.
 
         :param nodes: All nodes to draw on canvas
         :param active_node: The currently selected node will be highlighted
+        :param target_node: The selected target node will be highlighted
+        :param search_view: The state of the running algorithm, if None no distances are drawn
         """
-        self.delete("all")
+        with profiler.measure("redraw"):
+            self.__redraw_graph(nodes, active_node, target_node, search_view)
 
-        finished_nodes = []  # Save finished node to prevent connections from being drawn multiple times
-        for node in nodes:
-            outline_color = "red" if node is active_node else None
-            fill_color = "dark sea green" if node.checked else None
-            self.draw_node(node, outline_color, fill_color)
 
+    def __redraw_graph(self, nodes: List[Node], active_node: Union[Node, None], target_node: Union[Node, None],
+                       search_view: Union[SearchView, None]):
+        """
+        Synchronizes the canvas with all given nodes and connections, see redraw_graph.
+        """
+        self.delete(self.HIGHLIGHT_TAG)
+        self.search_view = search_view
+
+        node_set = set(nodes)
+        for node in [n for n in self.node_items if n not in node_set]:
+            self.delete(*(item for item in self.node_items.pop(node) if item))
+            del self.node_states[node]
+
+        connections = {}
+        for node in nodes:
+            self.__update_node(node, active_node, target_node)
             for neighbour, weight in zip(node.neighbours, node.weights):
-                if neighbour not in finished_nodes:
-                    self.draw_connection(node, neighbour, weight)
+                connections[frozenset((node, neighbour))] = (node, neighbour, weight)
+
+        for key in [k for k in self.connection_items if k not in connections]:
+            self.delete(*(item for item in self.connection_items.pop(key) if item))
+            del self.connection_weights[key]
 
-            finished_nodes.append(node)
+        for key, (start_node, end_node, weight) in connections.items():
+            if self.connection_weights.get(key) != weight:
+                self.__create_connection(key, start_node, end_node, weight)
+
+
+    def update_view(self, nodes: List[Node], active_node: Node = None, target_node: Node = None,
+                    search_view: SearchView = None):
+        """
+        Synchronizes the canvas after the visible area moved, e.g. by pan or zoom_at.
+        Only the items of nodes which left the visible area are deleted and only the items of nodes which
+        entered it are created, the other items are kept. Use redraw_graph after editing the graph.
+
+        :param nodes: All nodes to draw on canvas, usually the nodes inside the viewport
+        :param active_node: The currently selected node will be highlighted
+        :param target_node: The selected target node will be highlighted
+        :param search_view: The state of the running algorithm, if None no distances are drawn
+        """
+        with profiler.measure("redraw"):
+            self.delete(self.HIGHLIGHT_TAG)
+            self.search_view = search_view
+            node_set = set(nodes)
+            for node in [n for n in self.node_items if n not in node_set]:
+                self.delete(*(item for item in self.node_items.pop(node) if item))
+                del self.node_states[node]
+                for neighbour in node.neighbours:
+                    key = frozenset((node, neighbour))
+                    if neighbour not in node_set and key in self.connection_items:
+                        self.delete(*(item for item in self.connection_items.pop(key) if item))
+                        del self.connection_weights[key]
+
+            for node in [n for n in nodes if n not in self.node_items]:
+                self.__update_node(node, active_node, target_node)
+                for neighbour, weight in zip(node.neighbours, node.weights):
+                    key = frozenset((node, neighbour))
+                    if key not in self.connection_items:
+                        self.__create_connection(key, node, neighbour, weight)
+
+
+    def update_nodes(self, nodes: Iterable[Node], active_node: Node = None, target_node: Node = None,
+                     search_view: SearchView = None):
+        """
+        Removes all highlights and reconfigures only the given nodes if they are drawn.
+        The connections are not updated, use redraw_graph after editing the graph.
+
+        :param nodes: The nodes whose distance, predecessor or checked flag changed
+        :param active_node: The currently selected node will be highlighted
+        :param target_node: The selected target node will be highlighted
+        :param search_view: The state of the running algorithm, if None no distances are drawn
+        """
+        with profiler.measure("update"):
+            self.delete(self.HIGHLIGHT_TAG)
+            self.search_view = search_view
+            for node in nodes:
+                if node in self.node_items:
+                    self.__update_node(node, active_node, target_node)
+
+
+    def set_checked_color(self, checked_color: Callable[[Node], str] = None):
+        """
+        Sets the background color of checked nodes, e.g. to distinguish the searches of an algorithm.
+        The nodes are reconfigured by the next update.
+
+        :param checked_color: A function returning the color of a checked node, if None all are dark sea green
+        """
+        self.checked_color = checked_color
+
+
+    def get_checked_color(self, node: Node) -> str:
+        """
+        :param node: A checked node
+        :return: The node's background color
+        """
+        return self.checked_color(node) if self.checked_color else "dark sea green"
+
+
+    def draw_statistics(self, text: str = None):
+        """
+        Draws a text in the upper left corner above all other items.
+
+        :param text: The text to draw, None removes the text
+        """
+        self.delete(self.STATISTICS_TAG)
+        self.statistics_text = text
+        if text:
+            self.create_text(8, 8, text=text, anchor='nw', justify='left', fill="dim gray", font=("TkFixedFont", 9),
+                             tags=self.STATISTICS_TAG)
+
+
+    def clear(self):
+        """
+        Deletes all items of the canvas, the statistics are drawn again.
+        """
+        self.delete("all")
+        self.node_items = {}
+        self.node_states = {}
+        self.connection_items = {}
+        self.connection_weights = {}
+        self.draw_statistics(self.statistics_text)
+
+
+    def __update_node(self, node: Node, active_node: Union[Node, None], target_node: Union[Node, None]):
+        """
+        Creates the items of a node or reconfigures them if its state changed.
+
+        :param node: The node to update
+        :param active_node: The currently selected node
+        :param target_node: The selected target node
+        """
+        state = (
+            "red" if node is active_node else "blue" if node is target_node else "black",
+            self.get_checked_color(node) if self.search_view and self.search_view.is_checked(node) else "",
+            self.__node_text(node)
+        )
+        if self.node_states.get(node) == state:
+            return
+
+        outline_color, fill_color, text = state
+        if node in self.node_items:
+            oval, text_item = self.node_items[node]
+            if self.zoom < self.POINT_ZOOM:
+                fill_color = fill_color if fill_color else outline_color
+            self.itemconfig(oval, outline=outline_color, fill=fill_color)
+            if text_item:
+                self.itemconfig(text_item, text=text)
+        else:
+            self.node_items[node] = self.__create_node_items(node, outline_color, fill_color)
+        self.node_states[node] = state
+
+
+    def __create_connection(self, key: FrozenSet[Node], start_node: Node, end_node: Node, weight: float):
+        """
+        Creates or replaces the items of a connection, lines are placed below all nodes.
+
+        :param key: The connection's key
+        :param start_node: First node
+        :param end_node: Second node
+        :param weight: Weight of the connection
+        """
+        if key in self.connection_items:
+            self.delete(*(item for item in self.connection_items[key] if item))
+
+        items = self.__create_connection_items(start_node, end_node, weight, "black")
+        for item in items:
+            if item:
+                self.tag_lower(item)
+        self.connection_items[key] = items
+        self.connection_weights[key] = weight
 
 
     def draw_node(self, node: Node, outline_color: str = None, fill_color: str = None):
         """
-        Draws a single node on the canvas.
+        Draws a single node as highlight on the canvas.
+        Highlights are removed by the next update.
 
         :param node: The node to draw
         :param outline_color: Color of the node's outline
         :param fill_color: Color of the node's background
         """
         outline_color = outline_color if outline_color else "black"
-        fill_color = fill_color if outline_color else "black"
-
-        self.create_oval(
-            (node.x - node.radius, node.y - node.radius),
-            (node.x + node.radius, node.y + node.radius),
-            width=2,
-            outline=outline_color,
-            fill=fill_color
-        )
-        text = node.name if node.distance is None else f"{node.name}\n<{node.distance}>"
-        self.create_text(node.x, node.y, text=text, justify='center')
+        fill_color = fill_color if fill_color else ""
+        self.__create_node_items(node, outline_color, fill_color, self.HIGHLIGHT_TAG)
 
 
-    def draw_connection(self, start_node: Node, end_node: Node, weight: float = 0.0, color: str = None):
+    def draw_connection(self, start_node: Node, end_node: Node, weight: float = 0.0, color: str = None,
+                        dash: Tuple[int, ...] = None):
         """
-        Draws a single connection.
+        Draws a single connection as highlight.
         Order of start and end node is unimportant.
+        Highlights are removed by the next update.
 
         :param start_node: First node
         :param end_node: Second node
         :param weight: Weight of the connection
         :param color: The line's color
+        :param dash: The line's dash pattern, e.g. for shortcuts which are no connection of the graph
         """
         color = color if color else "black"
+        self.__create_connection_items(start_node, end_node, weight, color, self.HIGHLIGHT_TAG, dash)
+
 
-        dx = end_node.x - start_node.x
-        dy = end_node.y - start_node.y
+    def __create_node_items(self, node: Node, outline_color: str, fill_color: str,
+                            tag: str = None) -> Tuple[int, Union[int, None]]:
+        """
+        Creates the oval and the text of a node depending on the zoom level.
+
+        :return: A tuple of the item ids, the text's id is None if no text is drawn
+        """
+        x, y = self.__to_screen(node.x, node.y)
+        if self.zoom < self.POINT_ZOOM:
+            oval = self.create_oval(
+                (x - self.POINT_RADIUS, y - self.POINT_RADIUS),
+                (x + self.POINT_RADIUS, y + self.POINT_RADIUS),
+                width=1,
+                outline=outline_color,
+                fill=fill_color if fill_color else outline_color,
+                tags=tag
+            )
+            profiler.count("canvas items created")
+            return oval, None
+
+        radius = node.radius * self.zoom
+        oval = self.create_oval(
+            (x - radius, y - radius),
+            (x + radius, y + radius),
+            width=2,
+            outline=outline_color,
+            fill=fill_color,
+            tags=tag
+        )
+        text = None
+        if self.zoom >= self.LABEL_ZOOM:
+            text = self.create_text(x, y, text=self.__node_text(node), justify='center', tags=tag)
+        profiler.count("canvas items created", 2 if text else 1)
+        return oval, text
+
+
+    def __create_connection_items(self, start_node: Node, end_node: Node, weight: float, color: str,
+                                  tag: str = None, dash: Tuple[int, ...] = None) -> Tuple[int, Union[int, None]]:
+        """
+        Creates the line and the weight's text of a connection.
+
+        :return: A tuple of the item ids, the text's id is None if no weight or no text is drawn
+        """
+        start_node_x, start_node_y = self.__to_screen(start_node.x, start_node.y)
+        end_node_x, end_node_y = self.__to_screen(end_node.x, end_node.y)
+        dx = end_node_x - start_node_x
+        dy = end_node_y - start_node_y
         phi = math.atan(dy / dx) if dx != 0 else math.copysign(math.pi / 2, dy)
         sign = math.copysign(1, dx)
 
-        start_x = start_node.x + sign * start_node.radius * math.cos(phi)
-        start_y = start_node.y + sign * start_node.radius * math.sin(phi)
-        end_x = end_node.x - sign * end_node.radius * math.cos(phi)
-        end_y = end_node.y - sign * end_node.radius * math.sin(phi)
-        self.create_line((start_x, start_y), (end_x, end_y), width=2, fill=color)
+        start_radius = start_node.radius * self.zoom if self.zoom >= self.POINT_ZOOM else self.POINT_RADIUS
+        end_radius = end_node.radius * self.zoom if self.zoom >= self.POINT_ZOOM else self.POINT_RADIUS
+        start_x = start_node_x + sign * start_radius * math.cos(phi)
+        start_y = start_node_y + sign * start_radius * math.sin(phi)
+        end_x = end_node_x - sign * end_radius * math.cos(phi)
+        end_y = end_node_y - sign * end_radius * math.sin(phi)
+        line_width = 2 if self.zoom >= self.POINT_ZOOM else 1
+        line = self.create_line((start_x, start_y), (end_x, end_y), width=line_width, fill=color, dash=dash,
+                                tags=tag)
 
-        if weight:
+        text = None
+        if weight and self.zoom >= self.LABEL_ZOOM:
             text_height = 7
             mid_x = (start_x + end_x) / 2 + math.sin(phi) * text_height
             mid_y = (start_y + end_y) / 2 - math.cos(phi) * text_height
-            self.create_text((mid_x, mid_y), text=str(weight), angle=phi * -180 / math.pi)
-
+            text = self.create_text((mid_x, mid_y), text=str(weight), angle=phi * -180 / math.pi, tags=tag)
+        profiler.count("canvas items created", 2 if text else 1)
+        return line, text
 
 
+    def __node_text(self, node: Node) -> str:
+        """
+        :param node: The node
+        :return: The node's name and the current distance if an algorithm is running
+        """
+        return node.name if not self.search_view else f"{node.name}\n<{self.search_view.get_distance(node)}>"
@@ -3,7 +3,10 @@ from tkinter import ttk
 
 
 class InfoLabel(ttk.Label):
+    text: str = ""
     base_info = "Use the right mouse button to select a node and press start to run the Dijkstra algorithm. \n" \
+                "Use shift and the right mouse button to select a target node. \n" \
+                "Use control and the right mouse button to add start nodes of the multi-source algorithm. \n" \
                 "Use left the mouse button to add more nodes or connections. \n" \
                 "Use the middle mouse button to delete nodes or click clear to delete all. \n" \
                 "To save and load files use the file menu."
@@ -16,6 +19,8 @@ class InfoLabel(ttk.Label):
                           "Use left click to select a node and to show the shortest path. \n" \
                           "Click reset to switch back to the edit mode."
 
+    PROGRESS_WIDTH: int = 30  # Number of characters of the progress bar
+
     def __init__(self, root: tk.Misc):
         """
         A label for some user info.
@@ -32,4 +37,27 @@ class InfoLabel(ttk.Label):
 
         :param text: The text to display
         """
+        self.text = text
         self.config(text=text)
+
+
+    def set_progress(self, text: str, progress: float = None):
+        """
+        Shows the progress of a running task, the previous text is kept and can be restored by restore_text.
+
+        :param text: The description of the task
+        :param progress: The finished fraction between 0 and 1, None if unknown
+        """
+        if progress is None:
+            self.config(text=f"{text} ...")
+            return
+        done = round(progress * self.PROGRESS_WIDTH)
+        bar = "█" * done + "░" * (self.PROGRESS_WIDTH - done)
+        self.config(text=f"{text} ... {progress:.0%}\n{bar}")
+
+
+    def restore_text(self):
+        """
+        Shows the last text set by set_text again.
+        """
+        self.config(text=self.text)
@@ -1,15 +1,17 @@
 import tkinter as tk
 
 from controller.FileController import FileController
+from controller.StatisticsController import StatisticsController
 
 
 class MenuBar(tk.Menu):
-    def __init__(self, root: tk.Misc, file_controller: FileController):
+    def __init__(self, root: tk.Misc, file_controller: FileController, statistics_controller: StatisticsController):
         """
-        A simple menu bar with open and save functionality.
+        A simple menu bar with open and save functionality and the profiling statistics.
 
         :param root: The menu's parent
         :param file_controller: The current file controller
+        :param statistics_controller: The current statistics controller
         """
         super().__init__(root)
         self.file_menu = tk.Menu(self, tearoff=False)
@@ -19,3 +21,10 @@ class MenuBar(tk.Menu):
         self.file_menu.add_command(label="Save", command=file_controller.save_file)
         self.add_separator()
         self.file_menu.add_command(label="Exit", command=root.destroy)
+
+        self.statistics_menu = tk.Menu(self, tearoff=False)
+        self.add_cascade(label="Statistics", menu=self.statistics_menu)
+
+        self.statistics_menu.add_checkbutton(label="Show statistics", command=statistics_controller.toggle_statistics)
+        self.statistics_menu.add_command(label="Reset", command=statistics_controller.reset_statistics)
+        self.statistics_menu.add_command(label="Export", command=statistics_controller.export_statistics)
@@ -0,0 +1,50 @@
+import threading
+import unittest
+
+from model.BackgroundTask import BackgroundTask, TaskCancelled
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from test.test_dijkstra_algorithm import create_random_graph
+
+
+class BackgroundTaskTest(unittest.TestCase):
+
+    def test_result(self):
+        nodes = create_random_graph(3000, 6000, 0)
+        view = DijkstraAlgorithm(nodes, nodes[0]).solve()
+        expected = [view.get_distance(n) for n in nodes]
+        reported = []
+
+        def solve(task):
+            return DijkstraAlgorithm(nodes, nodes[0]).solve(lambda p: (reported.append(p), task.report_progress(p)))
+
+        task = BackgroundTask(solve).start()
+        self.assertTrue(task.wait(10))
+        self.assertIsNone(task.error)
+        self.assertEqual(expected, [task.result.get_distance(n) for n in nodes])
+        self.assertTrue(reported)
+        self.assertEqual(sorted(reported), reported)
+        self.assertTrue(all(0 < p <= 1 for p in reported))
+
+    def test_cancel(self):
+        started = threading.Event()
+
+        def run(task):
+            started.set()
+            while True:
+                task.report_progress(0.5)
+
+        task = BackgroundTask(run).start()
+        started.wait(10)
+        task.cancel()
+        self.assertTrue(task.wait(10))
+        self.assertTrue(task.cancelled)
+        self.assertIsInstance(task.error, TaskCancelled)
+
+    def test_error(self):
+        task = BackgroundTask(lambda task: 1 / 0).start()
+        self.assertTrue(task.wait(10))
+        self.assertIsInstance(task.error, ZeroDivisionError)
+
+
+if __name__ == '__main__':
+    unittest.main()
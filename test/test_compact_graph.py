@@ -0,0 +1,44 @@
+import unittest
+
+from model.CompactGraph import CompactGraph
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.Node import Node
+from test.test_dijkstra_algorithm import create_random_graph
+
+
+class CompactGraphTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        nodes = create_random_graph(20, 30, 1)
+        graph = CompactGraph.from_nodes(nodes)
+        self.assertEqual(len(nodes), len(graph))
+        self.assertEqual(sum(len(n.neighbours) for n in nodes) // 2, graph.edge_count)
+
+        copied_nodes = graph.to_nodes()
+        index = {node: i for i, node in enumerate(copied_nodes)}
+        for node, copied_node in zip(nodes, copied_nodes):
+            self.assertEqual((node.name, node.x, node.y), (copied_node.name, copied_node.x, copied_node.y))
+            self.assertEqual({nodes.index(n): w for n, w in zip(node.neighbours, node.weights)},
+                             {index[n]: w for n, w in zip(copied_node.neighbours, copied_node.weights)})
+            for neighbour, weight in zip(copied_node.neighbours, copied_node.weights):
+                self.assertEqual(weight, neighbour.get_weight(copied_node))
+
+    def test_solve_compact(self):
+        for seed in range(10):
+            nodes = create_random_graph(30, 45, seed)
+            view = DijkstraAlgorithm(nodes, nodes[0]).solve()
+            distance, predecessor = DijkstraAlgorithm.solve_compact(CompactGraph.from_nodes(nodes), 0)
+            self.assertEqual([view.get_distance(n) for n in nodes], list(distance))
+            self.assertEqual([nodes.index(view.get_predecessor(n)) if view.get_predecessor(n) else -1 for n in nodes],
+                             list(predecessor))
+
+    def test_neighbours(self):
+        a, b = Node("A", 0, 0), Node("B", 1, 1)
+        a.add_neighbour(b, 2.5)
+        graph = CompactGraph.from_nodes([a, b])
+        self.assertEqual([(1, 2.5)], list(graph.neighbours(0)))
+        self.assertEqual([(0, 2.5)], list(graph.neighbours(1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from model.CompactGraph import CompactGraph
+from model.ContractionHierarchy import ContractionHierarchy
+from model.ContractionHierarchyAlgorithm import ContractionHierarchyAlgorithm
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.GraphFile import GraphFile
+from test.test_dijkstra_algorithm import create_random_graph
+from test.test_point_to_point import create_geometric_graph, get_path_distance, run
+
+
+class ContractionHierarchyTest(unittest.TestCase):
+
+    def assert_queries(self, nodes, query_count: int = 100):
+        hierarchy = ContractionHierarchy.build(CompactGraph.from_nodes(nodes))
+        rng = random.Random(0)
+        for _ in range(query_count):
+            source, target = rng.randrange(len(nodes)), rng.randrange(len(nodes))
+            expected = DijkstraAlgorithm(nodes, nodes[source], target_node=nodes[target]).solve().get_distance(nodes[target])
+            distance, path = hierarchy.query(source, target)
+            self.assertEqual(expected, distance)
+            if distance == float('inf'):
+                self.assertEqual([], path)
+                continue
+            self.assertEqual((source, target), (path[0], path[-1]))
+            self.assertEqual(distance, sum(nodes[a].get_weight(nodes[b]) for a, b in zip(path, path[1:])))
+
+    def test_geometric_graph(self):
+        self.assert_queries(create_geometric_graph(12, 0))
+
+    def test_random_graph(self):
+        self.assert_queries(create_random_graph(300, 500, 1))
+
+    def test_limited_witness_search(self):
+        # Missed witnesses only add superfluous shortcuts
+        with mock.patch.object(ContractionHierarchy, "WITNESS_LIMIT", 2), \
+                mock.patch.object(ContractionHierarchy, "WITNESS_HOPS", 1):
+            self.assert_queries(create_geometric_graph(8, 4), 50)
+
+    def test_algorithm(self):
+        nodes = create_geometric_graph(10, 2)
+        hierarchy = ContractionHierarchy.build(CompactGraph.from_nodes(nodes))
+        rng = random.Random(2)
+        for _ in range(30):
+            start_node, target_node = rng.choice(nodes), rng.choice(nodes)
+            expected = DijkstraAlgorithm(nodes, start_node).solve().get_distance(target_node)
+            for view in (ContractionHierarchyAlgorithm(nodes, start_node, target_node, hierarchy).solve(),
+                         run(ContractionHierarchyAlgorithm(nodes, start_node, target_node, hierarchy))):
+                self.assertEqual(expected, view.get_distance(target_node))
+                self.assertEqual((start_node, expected), get_path_distance(view, target_node))
+
+    def test_lazy_search_spaces(self):
+        nodes = create_geometric_graph(6, 5)
+        algorithm = ContractionHierarchyAlgorithm(nodes, nodes[0], nodes[-1])
+        algorithm.solve()
+        self.assertNotIn("upward_nodes", vars(algorithm))
+        self.assertIn(nodes[0], algorithm.upward_nodes)
+        self.assertIn(nodes[-1], algorithm.downward_nodes)
+        self.assertTrue(algorithm.upward_nodes & algorithm.downward_nodes)
+
+    def test_persistence(self):
+        nodes = create_random_graph(200, 400, 3)
+        graph = CompactGraph.from_nodes(nodes)
+        hierarchy = ContractionHierarchy.build(graph)
+        with tempfile.TemporaryDirectory() as directory:
+            # The snapshot changes the order of the connections, but not the graph
+            graph_file = Path(directory) / "graph.graph"
+            GraphFile.write(graph_file, nodes)
+            hierarchy.write(ContractionHierarchy.get_file(graph_file))
+            loaded = ContractionHierarchy.load(graph_file, CompactGraph.from_nodes(GraphFile.read(graph_file)))
+            self.assertIsNotNone(loaded)
+            self.assertEqual(list(hierarchy.ranks), list(loaded.ranks))
+            self.assertEqual(list(hierarchy.targets), list(loaded.targets))
+            for source, target in ((0, 1), (5, 150), (42, 7)):
+                self.assertEqual(hierarchy.query(source, target), loaded.query(source, target))
+
+            nodes[0].add_neighbour(nodes[1], 1000)
+            self.assertIsNone(ContractionHierarchy.load(graph_file, CompactGraph.from_nodes(nodes)))
+            self.assertIsNone(ContractionHierarchy.load(Path(directory) / "missing.graph", graph))
@@ -0,0 +1,115 @@
+import random
+import unittest
+
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.Node import Node
+from model.PriorityQueue import LinearPriorityQueue, HeapPriorityQueue, BucketPriorityQueue
+
+
+def create_random_graph(node_count: int, edge_count: int, seed: int):
+    rng = random.Random(seed)
+    nodes = [Node(str(i), rng.randint(0, 1000), rng.randint(0, 600)) for i in range(node_count)]
+    for _ in range(edge_count):
+        a, b = rng.sample(nodes, 2)
+        a.add_neighbour(b, rng.randint(1, 5))
+    return nodes
+
+
+def run_steps(nodes, start_node, queue_class):
+    algorithm = DijkstraAlgorithm(nodes, start_node, queue_class)
+    view = algorithm.get_view()
+    steps = [(node, neighbour, view.get_distance(node) if node else None,
+              view.get_distance(neighbour) if neighbour else None) for _, node, neighbour in algorithm]
+    return steps, [view.get_distance(n) for n in nodes]
+
+
+class DijkstraAlgorithmTest(unittest.TestCase):
+
+    def test_distances(self):
+        a, b, c, d = Node("A", 0, 0), Node("B", 0, 0), Node("C", 0, 0), Node("D", 0, 0)
+        a.add_neighbour(b, 1)
+        b.add_neighbour(c, 2)
+        a.add_neighbour(c, 4)
+        algorithm = DijkstraAlgorithm([a, b, c, d], a)
+        for _ in algorithm:
+            pass
+        view = algorithm.get_view()
+        self.assertEqual([0, 1, 3, float('inf')], [view.get_distance(n) for n in (a, b, c, d)])
+        self.assertEqual([None, a, b, None], [view.get_predecessor(n) for n in (a, b, c, d)])
+        self.assertTrue(all(view.is_checked(n) for n in (a, b, c, d)))
+
+    def test_heap_matches_linear_steps(self):
+        for seed in range(20):
+            nodes = create_random_graph(30, 45, seed)
+            start_node = nodes[seed % len(nodes)]
+            self.assertEqual(run_steps(nodes, start_node, LinearPriorityQueue),
+                             run_steps(nodes, start_node, HeapPriorityQueue))
+
+    def test_bucket_matches_linear_steps(self):
+        for seed in range(20):
+            nodes = create_random_graph(30, 45, seed)
+            # Zero weights push nodes into the bucket which is currently emptied
+            nodes[0].add_neighbour(nodes[1], 0)
+            start_node = nodes[seed % len(nodes)]
+            self.assertEqual(run_steps(nodes, start_node, LinearPriorityQueue),
+                             run_steps(nodes, start_node, BucketPriorityQueue))
+
+    def test_max_weight(self):
+        nodes = create_random_graph(30, 45, 0)
+        self.assertEqual(5, BucketPriorityQueue.get_max_weight(nodes))
+        nodes[0].add_neighbour(nodes[1], 1.5)
+        self.assertIsNone(BucketPriorityQueue.get_max_weight(nodes))
+        nodes[0].add_neighbour(nodes[1], BucketPriorityQueue.MAX_WEIGHT + 1)
+        self.assertIsNone(BucketPriorityQueue.get_max_weight(nodes))
+
+    def test_solve_with_buckets_matches_reference(self):
+        for seed in range(20):
+            nodes = create_random_graph(30, 45, seed)
+            nodes[2].add_neighbour(nodes[3], 0)
+            start_node = nodes[seed % len(nodes)]
+            algorithm = DijkstraAlgorithm(nodes, start_node, LinearPriorityQueue)
+            for _ in algorithm:
+                pass
+            view = algorithm.get_view()
+            expected = [(view.get_distance(n), view.get_predecessor(n)) for n in nodes]
+
+            view = DijkstraAlgorithm(nodes, start_node).solve()
+            self.assertEqual(expected, [(view.get_distance(n), view.get_predecessor(n)) for n in nodes])
+
+    def test_solve_matches_steps(self):
+        for seed in range(20):
+            nodes = create_random_graph(30, 45, seed)
+            start_node = nodes[seed % len(nodes)]
+            algorithm = DijkstraAlgorithm(nodes, start_node)
+            for _ in algorithm:
+                pass
+            view = algorithm.get_view()
+            expected = [(view.get_distance(n), view.get_predecessor(n)) for n in nodes]
+
+            algorithm = DijkstraAlgorithm(nodes, start_node)
+            view = algorithm.solve()
+            self.assertEqual(expected, [(view.get_distance(n), view.get_predecessor(n)) for n in nodes])
+            self.assertTrue(all(view.is_checked(n) for n in nodes))
+            self.assertRaises(StopIteration, next, algorithm)
+
+    def test_reused_state(self):
+        nodes = create_random_graph(30, 45, 0)
+        first = DijkstraAlgorithm(nodes, nodes[0])
+        first_view = first.solve()
+        expected = [first_view.get_distance(n) for n in nodes]
+
+        # Concurrent runs with their own states do not collide
+        second = DijkstraAlgorithm(nodes, nodes[1])
+        for _ in second:
+            pass
+        self.assertEqual(expected, [first_view.get_distance(n) for n in nodes])
+
+        # A reused state only contains the result of the latest run
+        view = DijkstraAlgorithm(nodes, nodes[1], state=first.state).solve()
+        self.assertEqual([second.get_view().get_distance(n) for n in nodes], [view.get_distance(n) for n in nodes])
+        view = DijkstraAlgorithm(nodes, nodes[0], target_node=nodes[0], state=first.state).solve()
+        self.assertEqual([0] + [float('inf')] * (len(nodes) - 1), [view.get_distance(n) for n in nodes])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from model.CompactGraph import CompactGraph
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.DistanceMatrix import DistanceMatrix
+from test.test_dijkstra_algorithm import create_random_graph
+
+
+class DistanceMatrixTest(unittest.TestCase):
+
+    def test_matches_single_source(self):
+        nodes = create_random_graph(40, 50, 3)
+        graph = CompactGraph.from_nodes(nodes)
+        sources, targets = [0, 5, 17, 39], [1, 2, 5, 30]
+        expected = []
+        for source in sources:
+            view = DijkstraAlgorithm(nodes, nodes[source]).solve()
+            expected.append([view.get_distance(nodes[target]) for target in targets])
+
+        self.assertEqual(expected, DistanceMatrix.calculate(graph, sources, targets, processes=1))
+        self.assertEqual(expected, DistanceMatrix.calculate(graph, sources, targets, processes=2))
+
+    def test_nodes(self):
+        nodes = create_random_graph(10, 12, 4)
+        matrix = DistanceMatrix.calculate_for_nodes(nodes, nodes[:3], nodes, processes=2)
+        for i, source in enumerate(nodes[:3]):
+            view = DijkstraAlgorithm(nodes, source).solve()
+            self.assertEqual([view.get_distance(n) for n in nodes], matrix[i])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from model.CompactGraph import CompactGraph
+from model.GraphFile import GraphFile
+from model.GraphSnapshot import GraphSnapshot
+from model.Node import Node
+from test.test_dijkstra_algorithm import create_random_graph
+
+EXAMPLE_FILE = Path(__file__).parent.parent / "data/example-1.json"
+
+
+def get_edges(nodes):
+    index = {node: i for i, node in enumerate(nodes)}
+    return {(index[n], index[m], w) for n in nodes for m, w in zip(n.neighbours, n.weights)}
+
+
+class GraphFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        nodes = create_random_graph(40, 80, 3)
+        for suffix in (".jsonl", ".json", ".graph"):
+            file = self.path / f"graph{suffix}"
+            GraphFile.write(file, nodes)
+            loaded_nodes = GraphFile.read(file)
+            self.assertEqual([(n.name, n.x, n.y) for n in nodes], [(n.name, n.x, n.y) for n in loaded_nodes])
+            self.assertEqual(get_edges(nodes), get_edges(loaded_nodes))
+
+    def test_edges_stored_once(self):
+        a, b = Node("A", 0, 0), Node("B", 10, 0)
+        a.add_neighbour(b, 2)
+        file = self.path / "graph.jsonl"
+        GraphFile.write(file, [a, b])
+        self.assertEqual(4, len(file.read_text().splitlines()))
+
+    def test_shared_coordinates(self):
+        a, b, c = Node("A", 0, 0), Node("B", 0, 0), Node("C", 10, 0)
+        a.add_neighbour(c, 1)
+        b.add_neighbour(c, 2)
+        for suffix in (".jsonl", ".json", ".graph"):
+            file = self.path / f"graph{suffix}"
+            GraphFile.write(file, [a, b, c])
+            self.assertEqual(get_edges([a, b, c]), get_edges(GraphFile.read(file)))
+
+    def test_read_legacy_example(self):
+        nodes = GraphFile.read(EXAMPLE_FILE)
+        self.assertTrue(nodes)
+        for node in nodes:
+            for neighbour, weight in zip(node.neighbours, node.weights):
+                self.assertEqual(weight, neighbour.get_weight(node))
+
+    def test_progress(self):
+        nodes = create_random_graph(40, 80, 4)
+        for suffix in (".jsonl", ".json"):
+            file = self.path / f"graph{suffix}"
+            GraphFile.write(file, nodes)
+            reported = []
+            with mock.patch.object(GraphFile, "CHUNK_SIZE", 100), mock.patch.object(GraphFile, "PROGRESS_INTERVAL", 10):
+                GraphFile.read(file, reported.append)
+                self.assertGreater(len(reported), 5)
+                self.assertEqual(sorted(reported), reported)
+                self.assertLessEqual(reported[-1], 1.0)
+
+                def cancel(_):
+                    raise InterruptedError()
+                with self.assertRaises(InterruptedError):
+                    GraphFile.read(file, cancel)
+        self.assertEqual(1.0, reported[-1])
+
+    def test_snapshot_is_mapped(self):
+        nodes = create_random_graph(30, 50, 4)
+        file = self.path / "graph.graph"
+        GraphFile.write(file, nodes)
+        graph = GraphSnapshot.read(file)
+        self.assertIsInstance(graph.targets, memoryview)
+        self.assertEqual(CompactGraph.from_nodes(nodes).weights.tolist(), graph.weights.tolist())
+        self.assertEqual([n.name for n in nodes], graph.names)
+
+
+    def test_truncated_snapshot(self):
+        file = self.path / "graph.graph"
+        GraphFile.write(file, create_random_graph(30, 50, 5))
+        data = file.read_bytes()
+        for size in (10, 40, len(data) - 100, len(data) - 1):
+            file.write_bytes(data[:size])
+            with self.assertRaisesRegex(ValueError, "Truncated graph snapshot"):
+                GraphSnapshot.read(file)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import random
+import unittest
+
+from model.CompactGraph import CompactGraph
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.LandmarkAlgorithm import LandmarkAlgorithm
+from model.Landmarks import Landmarks
+from model.Node import Node
+from test.test_dijkstra_algorithm import create_random_graph
+from test.test_point_to_point import create_geometric_graph, get_path_distance, run
+
+
+class LandmarksTest(unittest.TestCase):
+
+    def test_lower_bound(self):
+        nodes = create_random_graph(400, 600, 0)
+        graph = CompactGraph.from_nodes(nodes)
+        landmarks = Landmarks.select(graph, 4)
+        self.assertEqual(4, len(landmarks))
+        self.assertEqual(4 * len(nodes), len(landmarks.distances))
+        rng = random.Random(0)
+        for _ in range(20):
+            target = rng.randrange(len(nodes))
+            distances, _ = DijkstraAlgorithm.solve_compact(graph, target)
+            target_distances = landmarks.get_distances(target)
+            for i in range(len(nodes)):
+                self.assertLessEqual(landmarks.lower_bound(i, target_distances), distances[i])
+
+    def test_components(self):
+        # A large component, a small one and isolated nodes
+        nodes = create_geometric_graph(6, 0)
+        small = [Node(f"s{i}", i, 0) for i in range(3)]
+        small[0].add_neighbour(small[1], 1)
+        small[1].add_neighbour(small[2], 1)
+        nodes += small + [Node("i1", 0, 0), Node("i2", 0, 0)]
+        landmarks = Landmarks.select(CompactGraph.from_nodes(nodes), 4)
+        self.assertTrue(all(i < 36 for i in landmarks.landmarks))
+        self.assertEqual(float('inf'), landmarks.lower_bound(36, landmarks.get_distances(0)))
+        self.assertEqual(0, landmarks.lower_bound(36, landmarks.get_distances(37)))
+        self.assertEqual(0, len(Landmarks.select(CompactGraph.from_nodes([]))))
+
+    def test_algorithm(self):
+        nodes = create_geometric_graph(15, 1)
+        landmarks = Landmarks.select(CompactGraph.from_nodes(nodes))
+        rng = random.Random(1)
+        for _ in range(30):
+            start_node, target_node = rng.choice(nodes), rng.choice(nodes)
+            reference = DijkstraAlgorithm(nodes, start_node, target_node=target_node).solve()
+            expected = reference.get_distance(target_node)
+            for view in (LandmarkAlgorithm(nodes, start_node, target_node, landmarks).solve(),
+                         run(LandmarkAlgorithm(nodes, start_node, target_node, landmarks))):
+                self.assertEqual(expected, view.get_distance(target_node))
+                self.assertEqual((start_node, expected), get_path_distance(view, target_node))
+                self.assertLessEqual(sum(1 for n in nodes if view.is_checked(n)),
+                                     sum(1 for n in nodes if reference.is_checked(n)))
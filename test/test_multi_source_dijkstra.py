@@ -0,0 +1,63 @@
+import unittest
+
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.MultiSourceDijkstraAlgorithm import MultiSourceDijkstraAlgorithm
+from model.PriorityQueue import LinearPriorityQueue, HeapPriorityQueue, BucketPriorityQueue
+from test.test_dijkstra_algorithm import create_random_graph
+
+
+class MultiSourceDijkstraTest(unittest.TestCase):
+
+    def test_nearest_source(self):
+        nodes = create_random_graph(150, 300, 0)
+        sources, offsets = [nodes[0], nodes[40], nodes[90]], [0.0, 3.0, 10.0]
+        singles = [DijkstraAlgorithm(nodes, source).solve() for source in sources]
+        algorithm = MultiSourceDijkstraAlgorithm(nodes, sources, offsets)
+        view = algorithm.solve()
+
+        for node in nodes:
+            expected = min(single.get_distance(node) + offset for single, offset in zip(singles, offsets))
+            self.assertAlmostEqual(expected, view.get_distance(node))
+            owner = algorithm.get_owner(node)
+            if expected == float('inf'):
+                self.assertIsNone(owner)
+            else:
+                i = sources.index(owner)
+                self.assertAlmostEqual(expected, singles[i].get_distance(node) + offsets[i])
+
+    def test_steps(self):
+        nodes = create_random_graph(60, 90, 1)
+        sources = [nodes[3], nodes[20], nodes[3]]
+        # Offsets further apart than the largest weight and not integers
+        offsets = [50.5, 0.0, 1.25]
+        expected = MultiSourceDijkstraAlgorithm(nodes, sources, offsets).solve()
+        for queue_class in (LinearPriorityQueue, HeapPriorityQueue, BucketPriorityQueue):
+            algorithm = MultiSourceDijkstraAlgorithm(nodes, sources, offsets, queue_class)
+            for _ in algorithm:
+                pass
+            view = algorithm.get_view()
+            for node in nodes:
+                self.assertAlmostEqual(expected.get_distance(node), view.get_distance(node))
+                self.assertTrue(view.is_checked(node))
+        self.assertEqual(1.25, expected.get_distance(nodes[3]))
+
+    def test_owner_while_stepping(self):
+        nodes = create_random_graph(60, 120, 2)
+        sources = [nodes[0], nodes[30]]
+        algorithm = MultiSourceDijkstraAlgorithm(nodes, sources)
+        for _ in algorithm:
+            for node in nodes:
+                if algorithm.get_view().is_checked(node) and algorithm.get_view().get_distance(node) != float('inf'):
+                    self.assertIn(algorithm.get_owner(node), sources)
+        final_owners = {node: algorithm.get_owner(node) for node in nodes}
+        algorithm.solve()
+        self.assertEqual(final_owners, {node: algorithm.get_owner(node) for node in nodes})
+
+    def test_invalid_offsets(self):
+        nodes = create_random_graph(5, 5, 3)
+        with self.assertRaises(ValueError):
+            MultiSourceDijkstraAlgorithm(nodes, nodes[:2], [0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,31 @@ class NodeTest(unittest.TestCase):
         self.assertEqual(False, node.is_position_in_node(50, 61))
         self.assertEqual(False, node.is_position_in_node(57, 58))
 
+    def test_add_and_delete_neighbour(self):
+        a, b, c = Node("A", 0, 0), Node("B", 0, 0), Node("C", 0, 0)
+        a.add_neighbour(b, 1)
+        a.add_neighbour(c, 2)
+        self.assertEqual([b, c], list(a.neighbours))
+        self.assertEqual([a], list(b.neighbours))
+
+        a.add_neighbour(b, 3)
+        self.assertEqual([3, 2], list(a.weights))
+        self.assertEqual(3, b.get_weight(a))
+
+        a.delete_neighbour(b)
+        self.assertEqual([c], list(a.neighbours))
+        self.assertEqual([], list(b.neighbours))
+        self.assertIsNone(a.get_weight(b))
+
+        c.add_neighbour(a, 0)
+        self.assertEqual([], list(a.neighbours))
+        self.assertEqual([], list(c.weights))
+
+    def test_slots(self):
+        node = Node("A", 0, 0)
+        self.assertRaises(AttributeError, setattr, node, "colour", "red")
+        self.assertEqual({"name": "A", "x": 0, "y": 0, "neighbours": [], "weights": []}, node.to_dict())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,129 @@
+import math
+import random
+import unittest
+from pathlib import Path
+
+from model.AStarAlgorithm import AStarAlgorithm, EuclideanHeuristic
+from model.BidirectionalDijkstraAlgorithm import BidirectionalDijkstraAlgorithm
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.GraphFile import GraphFile
+from model.Node import Node
+from model.Profiler import profiler
+from test.test_dijkstra_algorithm import create_random_graph
+
+
+def create_geometric_graph(side: int, seed: int):
+    rng = random.Random(seed)
+    nodes = [Node(str(i), (i % side) * 100 + rng.randint(0, 50), (i // side) * 100 + rng.randint(0, 50))
+             for i in range(side * side)]
+    for i, node in enumerate(nodes):
+        for j in (i + 1, i + side, i + side + 1):
+            if j < len(nodes) and (j % side != 0 or j == i + side):
+                other = nodes[j]
+                node.add_neighbour(other, math.ceil(math.hypot(node.x - other.x, node.y - other.y)) + rng.randint(0, 20))
+    return nodes
+
+
+def get_path_distance(view, target_node):
+    distance = 0
+    node = target_node
+    while view.get_predecessor(node):
+        distance += node.get_weight(view.get_predecessor(node))
+        node = view.get_predecessor(node)
+    return node, distance
+
+
+def run(algorithm):
+    for _ in algorithm:
+        pass
+    return algorithm.get_view()
+
+
+class PointToPointTest(unittest.TestCase):
+
+    def assert_shortest_path(self, view, start_node, target_node, expected_distance):
+        self.assertEqual(expected_distance, view.get_distance(target_node))
+        if expected_distance != float('inf'):
+            self.assertEqual((start_node, expected_distance), get_path_distance(view, target_node))
+
+    def test_early_exit(self):
+        for seed in range(10):
+            nodes = create_random_graph(60, 120, seed)
+            start_node, target_node = random.Random(seed).sample(nodes, 2)
+            expected = DijkstraAlgorithm(nodes, start_node).solve().get_distance(target_node)
+
+            view = run(DijkstraAlgorithm(nodes, start_node, target_node=target_node))
+            self.assert_shortest_path(view, start_node, target_node, expected)
+
+            view = DijkstraAlgorithm(nodes, start_node, target_node=target_node).solve()
+            self.assert_shortest_path(view, start_node, target_node, expected)
+
+    def test_bidirectional(self):
+        for seed in range(30):
+            nodes = create_random_graph(60, 100, seed)
+            start_node, target_node = random.Random(seed).sample(nodes, 2)
+            expected = DijkstraAlgorithm(nodes, start_node).solve().get_distance(target_node)
+
+            view = run(BidirectionalDijkstraAlgorithm(nodes, start_node, target_node))
+            self.assert_shortest_path(view, start_node, target_node, expected)
+
+    def test_bidirectional_solve(self):
+        for seed in range(10):
+            nodes = create_random_graph(80, 140, seed)
+            start_node, target_node = random.Random(seed).sample(nodes, 2)
+            expected = run(BidirectionalDijkstraAlgorithm(nodes, start_node, target_node))
+            profiler.reset()
+            profiler.enabled = True
+            try:
+                view = BidirectionalDijkstraAlgorithm(nodes, start_node, target_node).solve()
+            finally:
+                profiler.enabled = False
+            for node in nodes:
+                self.assertEqual(expected.get_distance(node), view.get_distance(node))
+                self.assertEqual(expected.is_checked(node), view.is_checked(node))
+            self.assertEqual(sum(1 for n in nodes if view.is_checked(n)), profiler.counters["nodes settled"])
+            self.assertLessEqual(profiler.counters["nodes settled"], profiler.counters["heap pops"])
+            self.assertLessEqual(profiler.counters["heap pops"], profiler.counters["heap pushes"])
+            profiler.reset()
+
+    def test_bidirectional_same_node(self):
+        nodes = create_random_graph(5, 5, 0)
+        view = BidirectionalDijkstraAlgorithm(nodes, nodes[0], nodes[0]).solve()
+        self.assertEqual(0, view.get_distance(nodes[0]))
+
+    def test_a_star(self):
+        for seed in range(10):
+            nodes = create_geometric_graph(15, seed)
+            start_node, target_node = nodes[0], nodes[-1 - seed]
+            view = DijkstraAlgorithm(nodes, start_node, target_node=target_node).solve()
+            expected = view.get_distance(target_node)
+            dijkstra_checked = sum(view.is_checked(n) for n in nodes)
+
+            view = run(AStarAlgorithm(nodes, start_node, target_node))
+            self.assert_shortest_path(view, start_node, target_node, expected)
+            self.assertLess(sum(view.is_checked(n) for n in nodes), dijkstra_checked)
+
+            view = AStarAlgorithm(nodes, start_node, target_node, EuclideanHeuristic(0.5)).solve()
+            self.assert_shortest_path(view, start_node, target_node, expected)
+
+    def test_a_star_small_weights(self):
+        # The example's weights are much smaller than the lengths of the connections
+        nodes = GraphFile.read(Path(__file__).parent.parent / "data/example-1.json")
+        self.assertLess(EuclideanHeuristic.from_nodes(nodes).factor, 1.0)
+        for start_node in nodes:
+            expected = DijkstraAlgorithm(nodes, start_node).solve()
+            for target_node in nodes:
+                view = run(AStarAlgorithm(nodes, start_node, target_node))
+                self.assert_shortest_path(view, start_node, target_node, expected.get_distance(target_node))
+
+    def test_euclidean_factor(self):
+        a, b, c = Node("A", 0, 0), Node("B", 0, 0), Node("C", 30, 40)
+        a.add_neighbour(b, 1)
+        self.assertEqual(0.0, EuclideanHeuristic.from_nodes([a, b]).factor)
+        a.add_neighbour(c, 100)
+        b.add_neighbour(c, 25)
+        self.assertEqual(0.5, EuclideanHeuristic.from_nodes([a, b, c]).factor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.Profiler import Profiler, profiler
+from test.test_dijkstra_algorithm import create_random_graph
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def test_disabled(self):
+        p = Profiler()
+        events = []
+        p.add_hook(lambda *event: events.append(event))
+        p.count("a")
+        p.add_time("b", 1.0)
+        with p.measure("c"):
+            pass
+        self.assertEqual({}, p.counters)
+        self.assertEqual({}, p.timings)
+        self.assertEqual([], events)
+
+    def test_counters_and_timings(self):
+        p = Profiler()
+        p.enabled = True
+        events = []
+        p.add_hook(lambda *event: events.append(event))
+        p.count("a")
+        p.count("a", 4)
+        p.add_time("b", 1.0)
+        p.add_time("b", 3.0)
+        with p.measure("c"):
+            pass
+        self.assertEqual({"a": 5}, p.counters)
+        self.assertEqual([2, 4.0, 3.0], p.timings["b"])
+        self.assertEqual(1, p.timings["c"][0])
+        self.assertEqual([("counter", "a", 1), ("counter", "a", 4), ("timer", "b", 1.0), ("timer", "b", 3.0)],
+                         events[:4])
+        self.assertIn("a: 5", p.get_summary())
+
+        p.reset()
+        self.assertEqual("", p.get_summary())
+
+    def test_export(self):
+        p = Profiler()
+        p.enabled = True
+        p.count("a", 2)
+        p.add_time("b", 0.5)
+        with tempfile.TemporaryDirectory() as directory:
+            file = Path(directory) / "statistics.json"
+            p.export(file)
+            with open(file, encoding='utf-8') as f:
+                data = json.load(f)
+        self.assertEqual({"a": 2}, data["counters"])
+        self.assertEqual({"count": 1, "total_seconds": 0.5, "max_seconds": 0.5}, data["timings"]["b"])
+        self.assertEqual(2, len(data["events"]))
+
+    def test_solve_statistics(self):
+        nodes = create_random_graph(500, 1500, 0)
+        profiler.reset()
+        profiler.enabled = True
+        try:
+            view = DijkstraAlgorithm(nodes, nodes[0]).solve()
+        finally:
+            profiler.enabled = False
+        reached = sum(1 for n in nodes if view.get_distance(n) != float('inf'))
+        self.assertEqual(reached, profiler.counters["nodes settled"])
+        self.assertEqual(profiler.counters["heap pushes"], profiler.counters["heap pops"])
+        self.assertEqual(1, profiler.timings["solve"][0])
+        profiler.reset()
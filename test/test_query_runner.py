@@ -0,0 +1,115 @@
+import contextlib
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import cli
+from model.AStarAlgorithm import AStarAlgorithm
+from model.BidirectionalDijkstraAlgorithm import BidirectionalDijkstraAlgorithm
+from model.ContractionHierarchyAlgorithm import ContractionHierarchyAlgorithm
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.GraphFile import GraphFile
+from model.QueryRunner import QueryRunner
+from test.test_dijkstra_algorithm import create_random_graph
+
+SOURCE_DIRECTORY = Path(__file__).parent.parent / "dijkstra_visualizer"
+
+
+class QueryRunnerTest(unittest.TestCase):
+
+    def test_single_source(self):
+        nodes = create_random_graph(500, 1000, 0)
+        view = DijkstraAlgorithm(nodes, nodes[0]).solve()
+        expected = [(nodes[0].name, n.name, view.get_distance(n)) for n in nodes if view.get_distance(n) != float('inf')]
+        results = list(QueryRunner(nodes).single_source(nodes[0].name))
+        self.assertEqual(expected, [result[:3] for result in results])
+
+    def test_point_to_point(self):
+        nodes = create_random_graph(500, 1000, 1)
+        view = DijkstraAlgorithm(nodes, nodes[0]).solve()
+        for algorithm_class in (DijkstraAlgorithm, BidirectionalDijkstraAlgorithm, AStarAlgorithm):
+            runner = QueryRunner(nodes, algorithm_class, paths=True)
+            for target in nodes[::50]:
+                source_name, target_name, distance, path = runner.point_to_point(nodes[0].name, target.name)
+                self.assertEqual(view.get_distance(target), distance)
+                if distance == float('inf'):
+                    self.assertEqual([], path)
+                else:
+                    self.assertEqual(nodes[0].name, path[0])
+                    self.assertEqual(target.name, path[-1])
+
+    def test_batch(self):
+        nodes = create_random_graph(200, 400, 2)
+        queries = [(nodes[i].name, nodes[j].name) for i in (0, 0, 5, 5, 0) for j in (3, 100, 7)]
+        queries.append((nodes[9].name, None))
+        expected = []
+        for source_name, target_name in queries:
+            source = nodes[int(source_name)]
+            if target_name is None:
+                expected += QueryRunner(nodes).single_source(source_name)
+            else:
+                target = nodes[int(target_name)]
+                view = BidirectionalDijkstraAlgorithm(nodes, source, target).solve()
+                expected.append((source_name, target_name, view.get_distance(target), None))
+        for algorithm_class in (DijkstraAlgorithm, BidirectionalDijkstraAlgorithm, ContractionHierarchyAlgorithm):
+            self.assertEqual(expected, list(QueryRunner(nodes, algorithm_class).batch(queries)))
+
+    def test_unknown_node(self):
+        nodes = create_random_graph(10, 10, 0)
+        with self.assertRaises(ValueError):
+            QueryRunner(nodes).point_to_point(nodes[0].name, "unknown")
+
+    def test_command_line(self):
+        nodes = create_random_graph(100, 300, 3)
+        view = DijkstraAlgorithm(nodes, nodes[0], target_node=nodes[42]).solve()
+        with tempfile.TemporaryDirectory() as directory:
+            file = Path(directory) / "graph.jsonl"
+            GraphFile.write(file, nodes)
+            code = ("import sys, cli\n"
+                    f"code = cli.main([{str(file)!r}, '--source', '0', '--target', '42', '--format', 'jsonl'])\n"
+                    "assert 'tkinter' not in sys.modules\n"
+                    "sys.exit(code)")
+            process = subprocess.run([sys.executable, "-c", code], cwd=SOURCE_DIRECTORY,
+                                     capture_output=True, text=True, timeout=60)
+        self.assertEqual(0, process.returncode, process.stderr)
+        distance = view.get_distance(nodes[42])
+        expected = float(distance) if distance != float('inf') else None
+        self.assertEqual(f'{{"source": "0", "target": "42", "distance": {expected}}}\n'.replace("None", "null"),
+                         process.stdout)
+
+    def test_command_line_closed_output(self):
+        nodes = create_random_graph(100, 300, 5)
+        with tempfile.TemporaryDirectory() as directory:
+            file = Path(directory) / "graph.jsonl"
+            query_file = Path(directory) / "queries.csv"
+            GraphFile.write(file, nodes)
+            query_file.write_text("0\n" * 2000)
+            process = subprocess.Popen([sys.executable, "cli.py", str(file), "--queries", str(query_file)],
+                                       cwd=SOURCE_DIRECTORY, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            self.assertEqual(b"source,target,distance\n", process.stdout.readline())
+            process.stdout.close()
+            _, error = process.communicate(timeout=60)
+        self.assertEqual(1, process.returncode)
+        self.assertEqual(b"", error)
+
+    def test_command_line_hierarchy(self):
+        nodes = create_random_graph(100, 300, 4)
+        expected = DijkstraAlgorithm(nodes, nodes[0], target_node=nodes[42]).solve().get_distance(nodes[42])
+        with tempfile.TemporaryDirectory() as directory:
+            file = Path(directory) / "graph.jsonl"
+            store_file = Path(directory) / "cache" / "graph.ch"
+            store_file.parent.mkdir()
+            GraphFile.write(file, nodes)
+            arguments = [str(file), "--source", "0", "--target", "42", "--format", "jsonl", "--algorithm", "ch"]
+            for extra_arguments in ([], ["--store-hierarchy", str(store_file)], ["--store-hierarchy", str(store_file)]):
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    self.assertEqual(0, cli.main(arguments + extra_arguments))
+                distance = json.loads(output.getvalue())["distance"]
+                self.assertEqual(expected, distance if distance is not None else float('inf'))
+                self.assertEqual(bool(extra_arguments), store_file.exists())
+            self.assertEqual(["cache", "graph.jsonl"], sorted(p.name for p in Path(directory).iterdir()))
@@ -0,0 +1,65 @@
+import random
+import unittest
+
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.ShortestPathCache import ShortestPathCache
+from test.test_dijkstra_algorithm import create_random_graph
+
+
+class ShortestPathCacheTest(unittest.TestCase):
+
+    def assert_cached_result(self, cache, nodes, start_node, version):
+        expected_view = DijkstraAlgorithm(nodes, start_node).solve()
+        algorithm = DijkstraAlgorithm(nodes, start_node)
+        self.assertTrue(cache.load(algorithm, version))
+        view = algorithm.get_view()
+        self.assertEqual([expected_view.get_distance(n) for n in nodes], [view.get_distance(n) for n in nodes])
+        for node in nodes:
+            predecessor = view.get_predecessor(node)
+            if predecessor:
+                self.assertEqual(view.get_distance(node), view.get_distance(predecessor) + node.get_weight(predecessor))
+        self.assertRaises(StopIteration, next, algorithm)
+
+    def test_repair_after_edits(self):
+        rng = random.Random(0)
+        nodes = create_random_graph(50, 100, 0)
+        cache = ShortestPathCache()
+        start_node = nodes[0]
+        version = 0
+        algorithm = DijkstraAlgorithm(nodes, start_node)
+        algorithm.solve()
+        cache.store(algorithm, version)
+
+        for _ in range(100):
+            version += 1
+            node, other_node = rng.sample(nodes, 2)
+            if rng.random() < 0.1 and node is not start_node:
+                for neighbour in list(node.neighbours):
+                    node.delete_neighbour(neighbour)
+                nodes.remove(node)
+                cache.node_deleted(node, version)
+            else:
+                old_weight = node.get_weight(other_node)
+                node.add_neighbour(other_node, rng.choice([0, 1, 2, 5, 10]))
+                cache.connection_changed(node, other_node, old_weight, version)
+            self.assert_cached_result(cache, nodes, start_node, version)
+
+    def test_only_full_runs_are_cached(self):
+        nodes = create_random_graph(10, 20, 1)
+        algorithm = DijkstraAlgorithm(nodes, nodes[0], target_node=nodes[1])
+        algorithm.solve()
+        cache = ShortestPathCache()
+        cache.store(algorithm, 0)
+        self.assertFalse(cache.load(DijkstraAlgorithm(nodes, nodes[0]), 0))
+
+    def test_outdated_version(self):
+        nodes = create_random_graph(10, 20, 1)
+        algorithm = DijkstraAlgorithm(nodes, nodes[0])
+        algorithm.solve()
+        cache = ShortestPathCache()
+        cache.store(algorithm, 0)
+        self.assertFalse(cache.load(DijkstraAlgorithm(nodes, nodes[0]), 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import random
+import unittest
+
+from model.Node import Node
+from model.SpatialIndex import SpatialIndex
+
+
+class SpatialIndexTest(unittest.TestCase):
+
+    def test_find_matches_linear_search(self):
+        rng = random.Random(0)
+        nodes = [Node(str(i), rng.randint(-100, 500), rng.randint(-100, 500)) for i in range(300)]
+        index = SpatialIndex()
+        for node in nodes:
+            index.insert(node)
+        for node in nodes[::3]:
+            index.remove(node)
+            nodes.remove(node)
+
+        for _ in range(2000):
+            x, y = rng.randint(-150, 550), rng.randint(-150, 550)
+            expected = next((n for n in reversed(nodes) if n.is_position_in_node(x, y)), None)
+            self.assertIs(expected, index.find(x, y))
+
+    def test_last_added_wins(self):
+        index = SpatialIndex()
+        first, second = Node("A", 100, 100), Node("B", 110, 100)
+        index.insert(first)
+        index.insert(second)
+        self.assertIs(second, index.find(105, 100))
+        index.remove(second)
+        self.assertIs(first, index.find(105, 100))
+        index.clear()
+        self.assertIsNone(index.find(105, 100))
+
+    def test_find_in_rectangle(self):
+        rng = random.Random(1)
+        nodes = [Node(str(i), rng.randint(0, 2000), rng.randint(0, 2000)) for i in range(500)]
+        index = SpatialIndex()
+        for node in nodes:
+            index.insert(node)
+
+        for min_x, min_y, max_x, max_y in ((100, 200, 600, 500), (-5000, -5000, 5000, 5000), (30, 30, 31, 31)):
+            expected = [n for n in nodes if min_x - n.radius <= n.x <= max_x + n.radius and min_y - n.radius <= n.y <= max_y + n.radius]
+            self.assertEqual(expected, index.find_in_rectangle(min_x, min_y, max_x, max_y))
+
+
+if __name__ == '__main__':
+    unittest.main()
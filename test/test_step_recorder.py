@@ -0,0 +1,65 @@
+import random
+import unittest
+
+from model.BidirectionalDijkstraAlgorithm import BidirectionalDijkstraAlgorithm
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.StepRecorder import StepRecorder
+from test.test_dijkstra_algorithm import create_random_graph
+
+
+def get_values(nodes, view, current_node, current_neighbour):
+    return [(view.get_distance(n), view.get_predecessor(n), view.is_checked(n)) for n in nodes], \
+        current_node, current_neighbour
+
+
+def run_steps(algorithm):
+    view = algorithm.get_view()
+    values = [get_values(algorithm.nodes, view, None, None)]
+    for _, current_node, current_neighbour in algorithm:
+        values.append(get_values(algorithm.nodes, view, current_node, current_neighbour))
+    return values
+
+
+class StepRecorderTest(unittest.TestCase):
+
+    def assert_position(self, recorder, expected):
+        self.assertEqual(expected[recorder.position],
+                         get_values(recorder.nodes, recorder.get_view(), recorder.current_node,
+                                    recorder.current_neighbour))
+
+    def test_seek(self):
+        for seed, algorithm_class in ((0, DijkstraAlgorithm), (1, DijkstraAlgorithm),
+                                      (2, BidirectionalDijkstraAlgorithm)):
+            nodes = create_random_graph(40, 60, seed)
+            expected = run_steps(algorithm_class(nodes, nodes[0], target_node=nodes[-1]))
+
+            recorder = StepRecorder(algorithm_class(nodes, nodes[0], target_node=nodes[-1]))
+            recorder.checkpoint_interval = 16
+            for _ in recorder:
+                self.assert_position(recorder, expected)
+            self.assertEqual(len(expected) - 1, recorder.length)
+
+            rng = random.Random(seed)
+            for _ in range(50):
+                recorder.seek(rng.randint(0, recorder.length))
+                self.assert_position(recorder, expected)
+
+            recorder.seek(5)
+            recorder.next()
+            self.assertEqual(6, recorder.position)
+            self.assert_position(recorder, expected)
+
+    def test_continue_after_seek(self):
+        nodes = create_random_graph(30, 45, 3)
+        expected = run_steps(DijkstraAlgorithm(nodes, nodes[0]))
+        recorder = StepRecorder(DijkstraAlgorithm(nodes, nodes[0]))
+        for _ in range(20):
+            recorder.next()
+        recorder.seek(3)
+        for _ in recorder:
+            self.assert_position(recorder, expected)
+        self.assertEqual(len(expected) - 1, recorder.position)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from unittest import mock
+
+from model.CompactGraph import CompactGraph
+from model.DijkstraAlgorithm import DijkstraAlgorithm
+from model.QueryRunner import QueryRunner
+from model.VectorizedDijkstra import VectorizedDijkstra
+from test.test_dijkstra_algorithm import create_random_graph
+
+
+class VectorizedDijkstraTest(unittest.TestCase):
+
+    def check_single_source(self, graph: CompactGraph, solver: VectorizedDijkstra):
+        for source in (0, 17, 99):
+            expected, _ = DijkstraAlgorithm.solve_compact(graph, source)
+            distance, predecessor = solver.solve([source])
+            for i in range(len(graph)):
+                self.assertAlmostEqual(expected[i], distance[i])
+                if i != source and distance[i] != float('inf'):
+                    edge_weight = min(w for j, w in graph.neighbours(predecessor[i]) if j == i)
+                    self.assertAlmostEqual(distance[i], distance[predecessor[i]] + edge_weight)
+
+    def check_multi_source(self, graph: CompactGraph, solver: VectorizedDijkstra):
+        sources, offsets = [3, 40, 77], [0.0, 5.0, 20.0]
+        singles = [DijkstraAlgorithm.solve_compact(graph, source)[0] for source in sources]
+        distance, predecessor = solver.solve(sources, offsets)
+        for i in range(len(graph)):
+            self.assertAlmostEqual(min(s[i] + offset for s, offset in zip(singles, offsets)), distance[i])
+            if distance[i] == float('inf'):
+                self.assertEqual(-1, predecessor[i])
+
+    def test_fallback(self):
+        graph = CompactGraph.from_nodes(create_random_graph(100, 200, 0))
+        with mock.patch('model.VectorizedDijkstra.numpy', None):
+            solver = VectorizedDijkstra(graph)
+            self.assertFalse(VectorizedDijkstra.is_available())
+            self.check_single_source(graph, solver)
+            self.check_multi_source(graph, solver)
+
+    @unittest.skipUnless(VectorizedDijkstra.is_available(), "NumPy is not installed")
+    def test_numpy(self):
+        graph = CompactGraph.from_nodes(create_random_graph(100, 200, 0))
+        for delta in (None, 0.5, 1000.0):
+            solver = VectorizedDijkstra(graph, delta)
+            self.check_single_source(graph, solver)
+            self.check_multi_source(graph, solver)
+
+    def test_solve_nodes(self):
+        nodes = create_random_graph(100, 200, 1)
+        expected = DijkstraAlgorithm(nodes, nodes[0]).solve()
+        view = VectorizedDijkstra(CompactGraph.from_nodes(nodes)).solve_nodes(nodes, [nodes[0]])
+        for node in nodes:
+            self.assertEqual(expected.get_distance(node), view.get_distance(node))
+            self.assertTrue(view.is_checked(node))
+        self.assertIsNone(view.get_predecessor(nodes[0]))
+
+    def test_query_runner(self):
+        nodes = create_random_graph(100, 200, 2)
+        expected = list(QueryRunner(nodes).single_source(nodes[0].name))
+        runner = QueryRunner(nodes, paths=True, vectorized=True)
+        self.assertEqual([result[:3] for result in expected],
+                         [result[:3] for result in runner.single_source(nodes[0].name)])
+        self.assertEqual(expected[-1][2], runner.point_to_point(nodes[0].name, expected[-1][1])[2])
+
+
+if __name__ == '__main__':
+    unittest.main()